@@ -7,6 +7,7 @@ from pathlib import Path
 
 from relay_inventory.app.config.loader import load_tenant_config
 from relay_inventory.engine.canonical.models import CANONICAL_COLUMNS
+from relay_inventory.engine.parsing.csv_parser import records_to_rows
 from relay_inventory.engine.pipeline import merge_records, price_records, process_vendor
 
 
@@ -22,10 +23,11 @@ def parse_vendor_files(values: list[str]) -> dict[str, str]:
 
 def write_csv(path: Path, rows: list[dict[str, object]], columns: list[str]) -> None:
     path.parent.mkdir(parents=True, exist_ok=True)
+    column_values = [[row.get(column) for row in rows] for column in columns]
     with path.open("w", newline="", encoding="utf-8") as handle:
-        writer = csv.DictWriter(handle, fieldnames=columns)
-        writer.writeheader()
-        writer.writerows(rows)
+        writer = csv.writer(handle)
+        writer.writerow(columns)
+        writer.writerows(zip(*column_values))
 
 
 def main() -> None:
@@ -61,7 +63,7 @@ def main() -> None:
             raise ValueError(f"Missing vendor file for {vendor.vendor_id}")
         result = process_vendor(vendor, source_path=vendor_files[vendor.vendor_id])
         vendor_results.append(result)
-        normalized_rows = [record.model_dump() for record in result.records]
+        normalized_rows = records_to_rows(result.records)
         write_csv(
             Path(args.output_dir)
             / "normalized"
@@ -75,7 +77,7 @@ def main() -> None:
     priced = price_records(merged, config)
 
     output_columns = config.output.columns or CANONICAL_COLUMNS
-    output_rows = [record.model_dump() for record in priced]
+    output_rows = records_to_rows(priced)
     write_csv(Path(args.output_dir) / "merged_inventory.csv", output_rows, output_columns)
 
 
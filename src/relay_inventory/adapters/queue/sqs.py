@@ -1,53 +1,210 @@
 from __future__ import annotations
 
-import json
+import queue
+import random
+import threading
+import time
 from dataclasses import dataclass
-from typing import Any, Dict, Optional
+from functools import cached_property
+from typing import Any, Callable, Dict, Iterable, List, Optional
 
-import boto3
+import orjson
+from botocore.exceptions import BotoCoreError, ClientError
+
+from relay_inventory.util.aws import aws_client
+
+SEND_BATCH_MAX = 10
+DELETE_BATCH_MAX = 10
+DELETE_BATCH_WAIT_SECONDS = 0.05
+VISIBILITY_BATCH_MAX = 10
+HEARTBEAT_JITTER_FRACTION = 0.1
+RECEIVE_BATCH_MAX = 10
+RECEIVE_WAIT_SECONDS = 20
 
 
 @dataclass
 class SqsMessage:
     receipt_handle: str
-    body: Dict[str, Any]
+    raw_body: str = "{}"
     receive_count: int = 1
 
+    @cached_property
+    def body(self) -> Dict[str, Any]:
+        return orjson.loads(self.raw_body)
+
+
+def _to_message(message: Dict[str, Any]) -> SqsMessage:
+    attributes = message.get("Attributes", {})
+    return SqsMessage(
+        receipt_handle=message["ReceiptHandle"],
+        raw_body=message.get("Body", "{}"),
+        receive_count=int(attributes.get("ApproximateReceiveCount", "1")),
+    )
+
 
 class SqsAdapter:
     def __init__(self, queue_url: str) -> None:
         self.queue_url = queue_url
-        self.client = boto3.client("sqs")
+        self.client = aws_client("sqs")
 
     def send(self, payload: Dict[str, Any]) -> None:
-        self.client.send_message(QueueUrl=self.queue_url, MessageBody=json.dumps(payload))
+        self.client.send_message(QueueUrl=self.queue_url, MessageBody=orjson.dumps(payload).decode("utf-8"))
+
+    def send_many(self, payloads: Iterable[Dict[str, Any]]) -> None:
+        bodies = [orjson.dumps(payload).decode("utf-8") for payload in payloads]
+        for start in range(0, len(bodies), SEND_BATCH_MAX):
+            group = bodies[start : start + SEND_BATCH_MAX]
+            response = self.client.send_message_batch(
+                QueueUrl=self.queue_url,
+                Entries=[{"Id": str(index), "MessageBody": body} for index, body in enumerate(group)],
+            )
+            failed: List[Dict[str, Any]] = response.get("Failed", [])
+            for entry in failed:
+                self.client.send_message(QueueUrl=self.queue_url, MessageBody=group[int(entry["Id"])])
 
     def receive(self) -> Optional[SqsMessage]:
+        messages = self.receive_batch(max_messages=1)
+        return messages[0] if messages else None
+
+    def receive_batch(self, max_messages: int = RECEIVE_BATCH_MAX) -> List[SqsMessage]:
         response = self.client.receive_message(
             QueueUrl=self.queue_url,
             AttributeNames=["ApproximateReceiveCount"],
-            MaxNumberOfMessages=1,
-            WaitTimeSeconds=5,
-        )
-        messages = response.get("Messages", [])
-        if not messages:
-            return None
-        message = messages[0]
-        body = json.loads(message.get("Body", "{}"))
-        attributes = message.get("Attributes", {})
-        receive_count = int(attributes.get("ApproximateReceiveCount", "1"))
-        return SqsMessage(
-            receipt_handle=message["ReceiptHandle"],
-            body=body,
-            receive_count=receive_count,
+            MaxNumberOfMessages=max_messages,
+            WaitTimeSeconds=RECEIVE_WAIT_SECONDS,
         )
+        return [_to_message(message) for message in response.get("Messages", [])]
 
     def delete(self, receipt_handle: str) -> None:
         self.client.delete_message(QueueUrl=self.queue_url, ReceiptHandle=receipt_handle)
 
+    def delete_batch(self, receipt_handles: List[str]) -> List[str]:
+        failed: List[str] = []
+        for start in range(0, len(receipt_handles), DELETE_BATCH_MAX):
+            group = receipt_handles[start : start + DELETE_BATCH_MAX]
+            response = self.client.delete_message_batch(
+                QueueUrl=self.queue_url,
+                Entries=[{"Id": str(index), "ReceiptHandle": handle} for index, handle in enumerate(group)],
+            )
+            failed.extend(group[int(entry["Id"])] for entry in response.get("Failed", []))
+        return failed
+
+    def change_visibility_batch(self, receipt_handles: List[str], timeout_seconds: int) -> List[str]:
+        failed: List[str] = []
+        for start in range(0, len(receipt_handles), VISIBILITY_BATCH_MAX):
+            group = receipt_handles[start : start + VISIBILITY_BATCH_MAX]
+            response = self.client.change_message_visibility_batch(
+                QueueUrl=self.queue_url,
+                Entries=[
+                    {"Id": str(index), "ReceiptHandle": handle, "VisibilityTimeout": timeout_seconds}
+                    for index, handle in enumerate(group)
+                ],
+            )
+            failed.extend(group[int(entry["Id"])] for entry in response.get("Failed", []))
+        return failed
+
     def change_visibility(self, receipt_handle: str, timeout_seconds: int) -> None:
         self.client.change_message_visibility(
             QueueUrl=self.queue_url,
             ReceiptHandle=receipt_handle,
             VisibilityTimeout=timeout_seconds,
         )
+
+
+class SqsDeleteBatcher:
+    def __init__(self, adapter: SqsAdapter, on_error: Callable[[Exception], None]) -> None:
+        self.adapter = adapter
+        self.on_error = on_error
+        self._pending: queue.Queue[Optional[str]] = queue.Queue()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def submit(self, receipt_handle: str) -> None:
+        self._pending.put(receipt_handle)
+
+    def close(self, timeout: float = 5.0) -> None:
+        self._pending.put(None)
+        self._thread.join(timeout=timeout)
+
+    def _run(self) -> None:
+        while True:
+            handle = self._pending.get()
+            if handle is None:
+                return
+            batch = [handle]
+            deadline = time.monotonic() + DELETE_BATCH_WAIT_SECONDS
+            closing = False
+            while len(batch) < DELETE_BATCH_MAX:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    handle = self._pending.get(timeout=remaining)
+                except queue.Empty:
+                    break
+                if handle is None:
+                    closing = True
+                    break
+                batch.append(handle)
+            self._flush(batch)
+            if closing:
+                return
+
+    def _flush(self, batch: List[str]) -> None:
+        try:
+            failed = self.adapter.delete_batch(batch)
+        except (BotoCoreError, ClientError) as exc:
+            self.on_error(exc)
+            return
+        if failed:
+            self.on_error(RuntimeError(f"failed to delete {len(failed)} of {len(batch)} messages"))
+
+
+class SqsVisibilityHeartbeat:
+    def __init__(
+        self,
+        adapter: SqsAdapter,
+        *,
+        interval_seconds: float,
+        timeout_seconds: int,
+        on_error: Callable[[Exception], None],
+    ) -> None:
+        self.adapter = adapter
+        self.interval_seconds = interval_seconds
+        self.timeout_seconds = timeout_seconds
+        self.on_error = on_error
+        self._due: Dict[str, float] = {}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def register(self, receipt_handle: str) -> None:
+        jitter = random.uniform(0, HEARTBEAT_JITTER_FRACTION * self.interval_seconds)
+        with self._lock:
+            self._due[receipt_handle] = time.monotonic() + self.interval_seconds + jitter
+
+    def unregister(self, receipt_handle: str) -> None:
+        with self._lock:
+            self._due.pop(receipt_handle, None)
+
+    def close(self, timeout: float = 5.0) -> None:
+        self._stop.set()
+        self._thread.join(timeout=timeout)
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval_seconds / 2):
+            now = time.monotonic()
+            with self._lock:
+                due = [handle for handle, deadline in self._due.items() if deadline <= now]
+                for handle in due:
+                    self._due[handle] = now + self.interval_seconds
+            if not due:
+                continue
+            try:
+                failed = self.adapter.change_visibility_batch(due, self.timeout_seconds)
+            except (BotoCoreError, ClientError) as exc:
+                self.on_error(exc)
+                continue
+            if failed:
+                self.on_error(RuntimeError(f"failed to extend visibility for {len(failed)} of {len(due)} messages"))
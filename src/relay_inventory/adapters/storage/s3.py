@@ -1,10 +1,30 @@
 from __future__ import annotations
 
+import codecs
+import io
+import os
+import zlib
+from bisect import bisect_right
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Iterable, Optional
+from typing import Dict, Iterable, Iterator, List, Optional
 
-import boto3
+from boto3.s3.transfer import TransferConfig
+from botocore.exceptions import ClientError
+
+from relay_inventory.util.aws import aws_client
+
+LIST_PAGE_SIZE = 1000
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+MULTIPART_CHUNK_SIZE = 8 * 1024 * 1024
+TRANSFER_CONFIG = TransferConfig(
+    multipart_threshold=MULTIPART_CHUNK_SIZE,
+    multipart_chunksize=MULTIPART_CHUNK_SIZE,
+    max_concurrency=8,
+)
+GZIP_COMPRESS_LEVEL = 1
+NOT_MODIFIED_CODES = {"304", "NotModified"}
+PRECONDITION_FAILED_CODES = {"412", "PreconditionFailed"}
 
 
 @dataclass
@@ -16,37 +36,145 @@ class S3Location:
     last_modified: Optional[datetime] = None
 
 
+class _ChunkStream(io.RawIOBase):
+    def __init__(self, chunks: Iterable[bytes]) -> None:
+        self._chunks: Iterator[bytes] = iter(chunks)
+        self._pending = memoryview(b"")
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer) -> int:
+        while not self._pending:
+            try:
+                self._pending = memoryview(next(self._chunks))
+            except StopIteration:
+                return 0
+        size = min(len(buffer), len(self._pending))
+        buffer[:size] = self._pending[:size]
+        self._pending = self._pending[size:]
+        return size
+
+
+def _gzip_chunks(chunks: Iterable[bytes]) -> Iterator[bytes]:
+    compressor = zlib.compressobj(GZIP_COMPRESS_LEVEL, zlib.DEFLATED, 31)
+    for chunk in chunks:
+        compressed = compressor.compress(chunk)
+        if compressed:
+            yield compressed
+    yield compressor.flush()
+
+
+def _prefix_parents(sorted_prefixes: List[str]) -> List[int]:
+    parents: List[int] = []
+    for index, prefix in enumerate(sorted_prefixes):
+        parent = index - 1
+        while parent >= 0 and not prefix.startswith(sorted_prefixes[parent]):
+            parent = parents[parent]
+        parents.append(parent)
+    return parents
+
+
 class S3Adapter:
     def __init__(self, bucket: str) -> None:
         self.bucket = bucket
-        self.client = boto3.client("s3")
+        self.client = aws_client("s3")
 
     def list_latest(self, prefix: str) -> Optional[S3Location]:
-        response = self.client.list_objects_v2(Bucket=self.bucket, Prefix=prefix)
-        contents = response.get("Contents", [])
-        if not contents:
+        latest: Optional[dict] = None
+        paginator = self.client.get_paginator("list_objects_v2")
+        for page in paginator.paginate(
+            Bucket=self.bucket,
+            Prefix=prefix,
+            PaginationConfig={"PageSize": LIST_PAGE_SIZE},
+        ):
+            for item in page.get("Contents", ()):
+                if latest is None or item["LastModified"] > latest["LastModified"]:
+                    latest = item
+        return self._to_location(latest)
+
+    def list_latest_multi(self, prefixes: Iterable[str]) -> Dict[str, Optional[S3Location]]:
+        unique = sorted(set(prefixes))
+        common = os.path.commonprefix(unique)
+        common = common[: common.rfind("/") + 1]
+        depth = common.count("/")
+        if len(unique) < 2 or not common or any(prefix.count("/") - depth > 1 for prefix in unique):
+            return {prefix: self.list_latest(prefix) for prefix in unique}
+        parents = _prefix_parents(unique)
+        latest: Dict[str, dict] = {}
+        paginator = self.client.get_paginator("list_objects_v2")
+        for page in paginator.paginate(
+            Bucket=self.bucket,
+            Prefix=common,
+            PaginationConfig={"PageSize": LIST_PAGE_SIZE},
+        ):
+            for item in page.get("Contents", ()):
+                key = item["Key"]
+                index = bisect_right(unique, key) - 1
+                while index >= 0 and not key.startswith(unique[index]):
+                    index = parents[index]
+                while index >= 0:
+                    prefix = unique[index]
+                    current = latest.get(prefix)
+                    if current is None or item["LastModified"] > current["LastModified"]:
+                        latest[prefix] = item
+                    index = parents[index]
+        return {prefix: self._to_location(latest.get(prefix)) for prefix in unique}
+
+    def _to_location(self, item: Optional[dict]) -> Optional[S3Location]:
+        if item is None:
             return None
-        latest = max(contents, key=lambda item: item["LastModified"])
         return S3Location(
             bucket=self.bucket,
-            key=latest["Key"],
-            etag=latest.get("ETag"),
-            size=latest.get("Size"),
-            last_modified=latest.get("LastModified"),
+            key=item["Key"],
+            etag=item.get("ETag"),
+            size=item.get("Size"),
+            last_modified=item.get("LastModified"),
         )
 
+    def download_bytes_if_changed(self, key: str, etag: Optional[str]) -> tuple[Optional[bytes], Optional[str]]:
+        params = {"Bucket": self.bucket, "Key": key}
+        if etag:
+            params["IfNoneMatch"] = etag
+        try:
+            response = self.client.get_object(**params)
+        except ClientError as exc:
+            if exc.response["Error"]["Code"] in NOT_MODIFIED_CODES:
+                return None, etag
+            raise
+        return response["Body"].read(), response.get("ETag")
+
     def download_text(self, key: str) -> str:
-        return self.download_bytes(key).decode("utf-8")
+        response = self.client.get_object(Bucket=self.bucket, Key=key)
+        decoder = codecs.getincrementaldecoder("utf-8")()
+        parts = [decoder.decode(chunk) for chunk in response["Body"].iter_chunks(DOWNLOAD_CHUNK_SIZE)]
+        parts.append(decoder.decode(b"", final=True))
+        return "".join(parts)
 
-    def download_bytes(self, key: str) -> bytes:
+    def download_bytes(self, key: str, out: Optional[bytearray] = None) -> bytes | bytearray:
         response = self.client.get_object(Bucket=self.bucket, Key=key)
-        return response["Body"].read()
+        if out is None:
+            return response["Body"].read()
+        del out[:]
+        for chunk in response["Body"].iter_chunks(DOWNLOAD_CHUNK_SIZE):
+            out += chunk
+        return out
 
     def upload_text(self, key: str, body: str) -> None:
         self.client.put_object(Bucket=self.bucket, Key=key, Body=body.encode("utf-8"))
 
-    def upload_bytes(self, key: str, body: bytes) -> None:
-        self.client.put_object(Bucket=self.bucket, Key=key, Body=body)
+    def upload_bytes(self, key: str, body: bytes, content_type: Optional[str] = None) -> None:
+        extra = {"ContentType": content_type} if content_type else {}
+        self.client.put_object(Bucket=self.bucket, Key=key, Body=body, **extra)
+
+    def copy_key(self, source_key: str, key: str, if_match: Optional[str] = None) -> None:
+        self.client.copy(
+            {"Bucket": self.bucket, "Key": source_key},
+            self.bucket,
+            key,
+            ExtraArgs={"CopySourceIfMatch": if_match} if if_match else None,
+            Config=TRANSFER_CONFIG,
+        )
 
     def presign(self, key: str, expires_in: int = 3600) -> str:
         return self.client.generate_presigned_url(
@@ -55,6 +183,20 @@ class S3Adapter:
             ExpiresIn=expires_in,
         )
 
+    def upload_stream(self, key: str, chunks: Iterable[bytes], content_type: Optional[str] = None) -> None:
+        stream = io.BufferedReader(_ChunkStream(chunks), buffer_size=MULTIPART_CHUNK_SIZE)
+        extra = {"ContentType": content_type} if content_type else None
+        self.client.upload_fileobj(stream, self.bucket, key, ExtraArgs=extra, Config=TRANSFER_CONFIG)
+
+    def upload_gzip_stream(self, key: str, chunks: Iterable[bytes]) -> None:
+        stream = io.BufferedReader(_ChunkStream(_gzip_chunks(chunks)), buffer_size=MULTIPART_CHUNK_SIZE)
+        self.client.upload_fileobj(
+            stream,
+            self.bucket,
+            key,
+            ExtraArgs={"ContentEncoding": "gzip"},
+            Config=TRANSFER_CONFIG,
+        )
+
     def upload_lines(self, key: str, lines: Iterable[str]) -> None:
-        data = "".join(lines)
-        self.upload_text(key, data)
+        self.upload_stream(key, (line.encode("utf-8") for line in lines))
@@ -1,26 +1,33 @@
 from __future__ import annotations
 
+import asyncio
 import os
+import time
 import uuid
-from datetime import datetime
 from typing import Dict, Optional
 
 import logging
 
+import orjson
 from fastapi import Depends, FastAPI, HTTPException
-from fastapi.responses import JSONResponse
+from fastapi.responses import Response
 
 from botocore.exceptions import BotoCoreError, ClientError
 from relay_inventory.adapters.queue.sqs import SqsAdapter
 from relay_inventory.adapters.storage.s3 import S3Adapter
-from relay_inventory.app.auth.api_key import ApiKeyAuth
-from relay_inventory.app.jobs.schema import RunJob
+from relay_inventory.app.auth.api_key import build_auth_dependency
 from relay_inventory.app.models.config import TenantConfig
 from relay_inventory.app.models.run import RunRequest, RunStatus
 from relay_inventory.persistence.dynamo_runs import DynamoRuns, RunRecord
 from relay_inventory.persistence.dynamo_tenants import DynamoTenants, TenantRecord
 
 
+def _utc_iso_now() -> str:
+    seconds, micros = divmod(time.time_ns() // 1000, 1_000_000)
+    stamp = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(seconds))
+    return f"{stamp}.{micros:06d}" if micros else stamp
+
+
 class InMemoryTenants:
     def __init__(self) -> None:
         self._data: Dict[str, Dict[int, TenantRecord]] = {}
@@ -44,9 +51,17 @@ class InMemoryTenants:
 class InMemoryRuns:
     def __init__(self) -> None:
         self._data: Dict[str, RunRecord] = {}
+        self._running_by_tenant: Dict[str, str] = {}
+
+    def _index(self, record: RunRecord) -> None:
+        if record.status == "RUNNING":
+            self._running_by_tenant[record.tenant_id] = record.run_id
+        elif self._running_by_tenant.get(record.tenant_id) == record.run_id:
+            del self._running_by_tenant[record.tenant_id]
 
     def create(self, record: RunRecord) -> None:
         self._data[record.run_id] = record
+        self._index(record)
 
     def update_status(
         self,
@@ -63,22 +78,23 @@ class InMemoryRuns:
             for field in clear_fields:
                 setattr(record, field, None)
         record.status = status
+        self._index(record)
 
     def get(self, run_id: str) -> Optional[RunRecord]:
         return self._data.get(run_id)
 
     def find_running_by_tenant(self, tenant_id: str) -> Optional[RunRecord]:
-        for record in self._data.values():
-            if record.tenant_id == tenant_id and record.status == "RUNNING":
-                return record
-        return None
+        run_id = self._running_by_tenant.get(tenant_id)
+        if run_id is None:
+            return None
+        return self._data.get(run_id)
 
 
 runs_table = os.getenv("RUNS_TABLE")
 tenants_table = os.getenv("TENANTS_TABLE")
 queue_url = os.getenv("SQS_QUEUE_URL")
 s3_bucket = os.getenv("ARTIFACT_BUCKET")
-api_keys = set(filter(None, os.getenv("API_KEYS", "").split(",")))
+api_keys = frozenset(filter(None, os.getenv("API_KEYS", "").split(",")))
 
 runs_repo = DynamoRuns(runs_table) if runs_table else InMemoryRuns()
 tenants_repo = DynamoTenants(tenants_table) if tenants_table else InMemoryTenants()
@@ -87,7 +103,7 @@ s3_adapter = S3Adapter(s3_bucket) if s3_bucket else None
 
 logger = logging.getLogger("relay_inventory.api")
 
-auth_dependency = ApiKeyAuth(api_keys)
+auth_dependency = build_auth_dependency(api_keys)
 
 app = FastAPI()
 
@@ -134,12 +150,15 @@ async def create_run(request: RunRequest) -> RunStatus:
     run_id = str(uuid.uuid4())
     running = runs_repo.find_running_by_tenant(request.tenant_id) if hasattr(runs_repo, "find_running_by_tenant") else None
     if running:
-        return JSONResponse(
+        return Response(
             status_code=409,
-            content={
-                "error": "TENANT_ALREADY_RUNNING",
-                "active_run_id": running.run_id,
-            },
+            content=orjson.dumps(
+                {
+                    "error": "TENANT_ALREADY_RUNNING",
+                    "active_run_id": running.run_id,
+                }
+            ),
+            media_type="application/json",
         )
     tenant_record = (
         tenants_repo.get_latest(request.tenant_id) if hasattr(tenants_repo, "get_latest") else None
@@ -150,18 +169,18 @@ async def create_run(request: RunRequest) -> RunStatus:
         tenant_id=request.tenant_id,
         config_version=config_version,
         status="QUEUED",
-        requested_at=datetime.utcnow().isoformat(),
+        requested_at=_utc_iso_now(),
     )
     runs_repo.create(record)
     if queue:
-        job = RunJob(
-            run_id=run_id,
-            tenant_id=request.tenant_id,
-            vendors=request.vendors,
-            config_version=record.config_version,
-        )
+        payload = {
+            "run_id": run_id,
+            "tenant_id": request.tenant_id,
+            "vendors": list(request.vendors),
+            "config_version": record.config_version,
+        }
         try:
-            queue.send(job.model_dump())
+            queue.send(payload)
         except (BotoCoreError, ClientError) as exc:
             logger.exception("queue_send_failed")
             raise HTTPException(status_code=503, detail="Queue unavailable") from exc
@@ -170,6 +189,7 @@ async def create_run(request: RunRequest) -> RunStatus:
         tenant_id=request.tenant_id,
         config_version=record.config_version,
         status=record.status,
+        requested_at=record.requested_at,
     )
 
 
@@ -178,23 +198,15 @@ async def get_run(run_id: str) -> RunStatus:
     record = runs_repo.get(run_id)
     if not record:
         raise HTTPException(status_code=404, detail="Run not found")
-    return RunStatus(
+    return RunStatus.model_construct(
         run_id=record.run_id,
         tenant_id=record.tenant_id,
         config_version=record.config_version,
         status=record.status,
         stage=getattr(record, "stage", None),
-        requested_at=datetime.fromisoformat(record.requested_at),
-        started_at=datetime.fromisoformat(record.started_at)
-        if record.started_at
-        else None,
-        finished_at=(
-            datetime.fromisoformat(record.finished_at)
-            if getattr(record, "finished_at", None)
-            else datetime.fromisoformat(record.completed_at)
-            if getattr(record, "completed_at", None)
-            else None
-        ),
+        requested_at=record.requested_at,
+        started_at=record.started_at or None,
+        finished_at=getattr(record, "finished_at", None) or getattr(record, "completed_at", None) or None,
         failed_stage=getattr(record, "failed_stage", None),
         error_code=getattr(record, "error_code", None),
         error_message=getattr(record, "error_message", None),
@@ -212,4 +224,5 @@ async def get_run_artifacts(run_id: str) -> dict[str, str]:
     if not s3_adapter:
         raise HTTPException(status_code=503, detail="Artifact storage not configured")
     artifacts = record.artifacts or {}
-    return {name: s3_adapter.presign(key) for name, key in artifacts.items()}
+    urls = await asyncio.gather(*(asyncio.to_thread(s3_adapter.presign, key) for key in artifacts.values()))
+    return dict(zip(artifacts.keys(), urls))
@@ -1,14 +1,32 @@
 from __future__ import annotations
 
+from typing import Callable, Iterable
+
 from fastapi import Header, HTTPException, status
 
 
 class ApiKeyAuth:
-    def __init__(self, valid_keys: set[str]) -> None:
-        self.valid_keys = valid_keys
+    def __init__(self, valid_keys: Iterable[str]) -> None:
+        self.valid_keys = frozenset(valid_keys)
+        self._hash_mask = 0
+        for key in self.valid_keys:
+            self._hash_mask |= 1 << (hash(key) & 63)
 
     def __call__(self, x_api_key: str | None = Header(default=None)) -> None:
         if not self.valid_keys:
             return
-        if not x_api_key or x_api_key not in self.valid_keys:
+        if x_api_key is None or not (self._hash_mask >> (hash(x_api_key) & 63)) & 1:
+            raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid API key")
+        if x_api_key not in self.valid_keys:
             raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid API key")
+
+
+def allow_all() -> None:
+    return None
+
+
+def build_auth_dependency(valid_keys: Iterable[str]) -> Callable[..., None]:
+    keys = frozenset(valid_keys)
+    if not keys:
+        return allow_all
+    return ApiKeyAuth(keys)
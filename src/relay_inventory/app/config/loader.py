@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import os
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict
 
@@ -7,14 +9,25 @@ import yaml
 
 from relay_inventory.app.models.config import TenantConfig
 
+try:
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # pragma: no cover - LibYAML bindings not installed
+    from yaml import SafeLoader
+
 SUPPORTED_SCHEMA_VERSIONS = {1}
 
 
-def load_tenant_config(path: str | Path) -> TenantConfig:
+@lru_cache(maxsize=32)
+def _load_cached(path: str, mtime_ns: int, size: int) -> TenantConfig:
     data: Dict[str, Any]
     with open(path, "r", encoding="utf-8") as handle:
-        data = yaml.safe_load(handle) or {}
+        data = yaml.load(handle.read(), Loader=SafeLoader) or {}
     config = TenantConfig.model_validate(data)
     if config.schema_version not in SUPPORTED_SCHEMA_VERSIONS:
         raise ValueError(f"Unsupported schema_version {config.schema_version}")
     return config
+
+
+def load_tenant_config(path: str | Path) -> TenantConfig:
+    stat = os.stat(path)
+    return _load_cached(str(path), stat.st_mtime_ns, stat.st_size)
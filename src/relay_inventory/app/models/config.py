@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from decimal import Decimal
-from typing import Dict, List, Optional
+from typing import Dict, List, Literal, Optional
 
 from pydantic import BaseModel, Field
 
@@ -9,6 +9,7 @@ from pydantic import BaseModel, Field
 class InboundConfig(BaseModel):
     type: str
     s3_prefix: Optional[str] = None
+    emit_normalized_artifact: bool = True
 
 
 class ParserConfig(BaseModel):
@@ -68,6 +69,7 @@ class MergeConfig(BaseModel):
 class OutputConfig(BaseModel):
     format: str = "csv"
     columns: List[str]
+    compression: Optional[Literal["gzip"]] = None
 
 
 class ErrorPolicy(BaseModel):
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 from datetime import datetime
-from typing import List, Optional
+from typing import List, Optional, Union
 
 from pydantic import BaseModel, Field
 
@@ -18,9 +18,9 @@ class RunStatus(BaseModel):
     config_version: int
     status: str
     stage: Optional[str] = None
-    requested_at: datetime = Field(default_factory=datetime.utcnow)
-    started_at: Optional[datetime] = None
-    finished_at: Optional[datetime] = None
+    requested_at: Union[datetime, str] = Field(default_factory=datetime.utcnow)
+    started_at: Optional[Union[datetime, str]] = None
+    finished_at: Optional[Union[datetime, str]] = None
     failed_stage: Optional[str] = None
     error_code: Optional[str] = None
     error_message: Optional[str] = None
@@ -2,31 +2,47 @@ from __future__ import annotations
 
 import csv
 import io
+import re
 from datetime import datetime, timezone
 from decimal import Decimal, InvalidOperation
-from typing import Iterable, Sequence
+from functools import lru_cache
+from operator import itemgetter
+from typing import Iterable, Iterator, Sequence
+
+import orjson
 
 DECIMAL_FIELDS = {"cost", "map_price", "price", "msrp"}
 DATETIME_FIELDS = {"updated_at"}
+CSV_CHUNK_ROWS = 10_000
+JSON_CHUNK_ITEMS = 10_000
+
+_CENTS = Decimal("0.01")
+_NORMALIZED_DECIMAL = re.compile(r"-?(?:0|[1-9][0-9]*)\.[0-9]{2}")
 
 
 def _format_decimal(value: object) -> object:
     if value is None:
         return None
-    if isinstance(value, Decimal):
-        decimal_value = value
-    else:
-        try:
-            decimal_value = Decimal(str(value))
-        except (InvalidOperation, ValueError, TypeError):
-            return value
-    return str(decimal_value.quantize(Decimal("0.01")))
+    value_type = type(value)
+    if value_type is Decimal:
+        return str(value.quantize(_CENTS))
+    if value_type is str and _NORMALIZED_DECIMAL.fullmatch(value):
+        return value
+    if value_type is int:
+        return str(Decimal(value).quantize(_CENTS))
+    try:
+        decimal_value = Decimal(str(value))
+    except (InvalidOperation, ValueError, TypeError):
+        return value
+    return str(decimal_value.quantize(_CENTS))
 
 
 def _format_datetime(value: object) -> object:
     if value is None:
         return None
     datetime_value: datetime | None = None
+    if type(value) is datetime and (value.tzinfo is None or value.tzinfo is timezone.utc):
+        return value.isoformat().replace("+00:00", "") + "Z"
     if isinstance(value, datetime):
         datetime_value = value
     elif isinstance(value, str):
@@ -43,15 +59,97 @@ def _format_datetime(value: object) -> object:
     return datetime_value.isoformat().replace("+00:00", "Z")
 
 
-def _normalize_row(row: dict) -> dict:
-    normalized = dict(row)
-    for field in DECIMAL_FIELDS:
-        if field in normalized:
-            normalized[field] = _format_decimal(normalized[field])
-    for field in DATETIME_FIELDS:
-        if field in normalized:
-            normalized[field] = _format_datetime(normalized[field])
-    return normalized
+def _project_rows(rows: Iterable[dict], fieldnames: Sequence[str]) -> list[list[object]]:
+    if not fieldnames:
+        return [[] for _ in rows]
+    project = itemgetter(*fieldnames)
+    single = len(fieldnames) == 1
+    projected: list[list[object]] = []
+    append = projected.append
+    for row in rows:
+        try:
+            values = project(row)
+        except KeyError:
+            append([row.get(field) for field in fieldnames])
+            continue
+        append([values] if single else list(values))
+    return projected
+
+
+def _normalize_rows(rows: Iterable[dict], fieldnames: Sequence[str]) -> list[list[object]]:
+    normalized_rows = _project_rows(rows, fieldnames)
+    for index, field in enumerate(fieldnames):
+        if field in DECIMAL_FIELDS:
+            for values in normalized_rows:
+                values[index] = _format_decimal(values[index])
+        elif field in DATETIME_FIELDS:
+            formatted: dict[object, object] = {}
+            for values in normalized_rows:
+                value = values[index]
+                try:
+                    values[index] = formatted[value]
+                except KeyError:
+                    values[index] = formatted[value] = _format_datetime(value)
+                except TypeError:
+                    values[index] = _format_datetime(value)
+    return normalized_rows
+
+
+def _sku_key(row: dict) -> str:
+    return str(row.get("sku", ""))
+
+
+def _sku_vendor_key(row: dict) -> tuple[str, str]:
+    return (str(row.get("sku", "")), str(row.get("vendor_id", "")))
+
+
+def _check_extra_fields(rows: Iterable[dict], fieldnames: Sequence[str]) -> None:
+    allowed = set(fieldnames)
+    for row in rows:
+        extra = row.keys() - allowed
+        if extra:
+            raise ValueError(
+                "dict contains fields not in fieldnames: " + ", ".join(repr(field) for field in sorted(extra))
+            )
+
+
+def _prepare_rows(rows: Iterable[dict], fieldnames: Sequence[str], extrasaction: str) -> list[list[object]]:
+    ordered_rows = sorted(rows, key=_sku_vendor_key if "vendor_id" in fieldnames else _sku_key)
+    if extrasaction == "raise":
+        _check_extra_fields(ordered_rows, fieldnames)
+    return _normalize_rows(ordered_rows, fieldnames)
+
+
+@lru_cache(maxsize=32)
+def _header_bytes(fieldnames: tuple[str, ...]) -> bytes:
+    text = io.StringIO()
+    csv.writer(text, quoting=csv.QUOTE_MINIMAL, lineterminator="\n").writerow(fieldnames)
+    return text.getvalue().encode("utf-8")
+
+
+def _encode_csv(rows: list[list[object]], fieldnames: Sequence[str], chunk_rows: int) -> Iterator[bytes]:
+    header = _header_bytes(tuple(fieldnames))
+    if not rows:
+        yield header
+        return
+    text = io.StringIO()
+    writer = csv.writer(text, quoting=csv.QUOTE_MINIMAL, lineterminator="\n")
+    for start in range(0, len(rows), chunk_rows):
+        writer.writerows(rows[start : start + chunk_rows])
+        chunk = text.getvalue().encode("utf-8")
+        yield header + chunk if start == 0 else chunk
+        text.seek(0)
+        text.truncate()
+
+
+def iter_csv_chunks(
+    rows: Iterable[dict],
+    fieldnames: Sequence[str],
+    *,
+    extrasaction: str = "raise",
+    chunk_rows: int = CSV_CHUNK_ROWS,
+) -> Iterator[bytes]:
+    return _encode_csv(_prepare_rows(rows, fieldnames, extrasaction), fieldnames, chunk_rows)
 
 
 def write_csv_bytes(
@@ -60,26 +158,27 @@ def write_csv_bytes(
     *,
     extrasaction: str = "raise",
 ) -> bytes:
-    normalized_rows = [_normalize_row(row) for row in rows]
-    include_vendor_id = "vendor_id" in fieldnames
-    normalized_rows.sort(
-        key=lambda row: (
-            str(row.get("sku", "")),
-            str(row.get("vendor_id", "")) if include_vendor_id else "",
-        )
-    )
-    buffer = io.StringIO()
-    writer = csv.DictWriter(
-        buffer,
-        fieldnames=fieldnames,
-        extrasaction=extrasaction,
-        quoting=csv.QUOTE_MINIMAL,
-        lineterminator="\n",
-    )
-    writer.writeheader()
-    for row in normalized_rows:
-        writer.writerow(row)
-    return buffer.getvalue().encode("utf-8")
+    prepared = _prepare_rows(rows, fieldnames, extrasaction)
+    return b"".join(_encode_csv(prepared, fieldnames, max(len(prepared), 1)))
+
+
+def write_json_bytes(payload: object) -> bytes:
+    return orjson.dumps(payload, default=str, option=orjson.OPT_NON_STR_KEYS)
+
+
+def iter_json_array_chunks(items: Iterable[object], *, chunk_items: int = JSON_CHUNK_ITEMS) -> Iterator[bytes]:
+    encoded: list[bytes] = []
+    separator = b"["
+    for item in items:
+        encoded.append(write_json_bytes(item))
+        if len(encoded) >= chunk_items:
+            yield separator + b",".join(encoded)
+            encoded.clear()
+            separator = b","
+    if encoded:
+        yield separator + b",".join(encoded) + b"]"
+    else:
+        yield b"[]" if separator == b"[" else b"]"
 
 
 def read_csv_rows(bytes_blob: bytes) -> list[dict]:
@@ -1,11 +1,18 @@
 from __future__ import annotations
 
+import sys
 from datetime import datetime
 from decimal import Decimal
-from typing import Optional
+from typing import Any, Optional
 
 from pydantic import BaseModel, Field, field_validator
 
+VALID_CONDITIONS = frozenset({"new", "used", "refurb"})
+INTERN_MAX_LENGTH = 64
+
+_new_object = object.__new__
+_set_slot = object.__setattr__
+
 
 class InventoryRecord(BaseModel):
     sku: str
@@ -42,11 +49,89 @@ class InventoryRecord(BaseModel):
         if value is None:
             return None
         normalized = value.strip().lower()
-        if normalized not in {"new", "used", "refurb"}:
+        if normalized not in VALID_CONDITIONS:
             raise ValueError("condition must be new, used, or refurb")
         return normalized
 
 
+def intern_sku(value: Optional[str]) -> Optional[str]:
+    if value and len(value) < INTERN_MAX_LENGTH:
+        return sys.intern(value)
+    return value
+
+
+def construct_record(
+    *,
+    sku: str,
+    vendor_sku: Optional[str],
+    vendor_id: str,
+    quantity_available: int,
+    lead_time_days: Optional[int],
+    cost: Optional[Decimal],
+    map_price: Optional[Decimal],
+    price: Decimal,
+    msrp: Optional[Decimal],
+    condition: Optional[str],
+    brand: Optional[str],
+    title: Optional[str],
+    updated_at: datetime,
+) -> InventoryRecord:
+    """Build a record from already-typed values, only re-checking what the validators enforce."""
+    fields = {
+        "sku": intern_sku(sku.strip()),
+        "vendor_sku": vendor_sku,
+        "vendor_id": vendor_id.strip(),
+        "quantity_available": quantity_available,
+        "lead_time_days": lead_time_days,
+        "cost": cost,
+        "map_price": map_price,
+        "price": price,
+        "msrp": msrp,
+        "condition": condition.strip().lower() if condition is not None else None,
+        "brand": brand,
+        "title": title,
+        "updated_at": updated_at,
+    }
+    if (
+        not fields["sku"]
+        or not fields["vendor_id"]
+        or quantity_available < 0
+        or (condition is not None and fields["condition"] not in VALID_CONDITIONS)
+        or not price.is_finite()
+        or (cost is not None and not cost.is_finite())
+        or (map_price is not None and not map_price.is_finite())
+        or (msrp is not None and not msrp.is_finite())
+    ):
+        return InventoryRecord(
+            sku=sku,
+            vendor_sku=vendor_sku,
+            vendor_id=vendor_id,
+            quantity_available=quantity_available,
+            lead_time_days=lead_time_days,
+            cost=cost,
+            map_price=map_price,
+            price=price,
+            msrp=msrp,
+            condition=condition,
+            brand=brand,
+            title=title,
+            updated_at=updated_at,
+        )
+    record = _new_object(InventoryRecord)
+    _set_slot(record, "__dict__", fields)
+    _set_slot(record, "__pydantic_fields_set__", set(fields))
+    _set_slot(record, "__pydantic_extra__", None)
+    _set_slot(record, "__pydantic_private__", None)
+    return record
+
+
+def update_in_place(record: InventoryRecord, **fields: Any) -> InventoryRecord:
+    """Set already-valid field values on a record the caller owns, skipping model_copy."""
+    record.__dict__.update(fields)
+    record.__pydantic_fields_set__.update(fields)
+    return record
+
+
 CANONICAL_COLUMNS = [
     "sku",
     "vendor_sku",
@@ -4,7 +4,7 @@ from dataclasses import dataclass
 from decimal import Decimal
 from typing import Dict, Iterable, List
 
-from relay_inventory.engine.canonical.models import InventoryRecord
+from relay_inventory.engine.canonical.models import InventoryRecord, update_in_place
 
 
 @dataclass
@@ -19,36 +19,38 @@ class BestOfferConfig:
     fallback_lead_time_days: int
 
 
-def _landed_cost(record: InventoryRecord, config: LandedCostConfig) -> Decimal:
-    if record.cost is None:
-        return Decimal("0")
-    if config.include_shipping_handling:
-        return record.cost + config.shipping_handling_flat
-    return record.cost
-
-
 def merge_best_offer(
     records: Iterable[InventoryRecord],
     *,
     config: BestOfferConfig,
 ) -> List[InventoryRecord]:
-    grouped: Dict[str, List[InventoryRecord]] = {}
+    zero = Decimal("0")
+    shipping = (
+        config.landed_cost.shipping_handling_flat
+        if config.landed_cost.include_shipping_handling
+        else None
+    )
+
+    best: Dict[str, tuple[tuple[int, Decimal, str], InventoryRecord]] = {}
+    best_get = best.get
     for record in records:
-        grouped.setdefault(record.sku, []).append(record)
+        cost = record.cost
+        if cost is None:
+            landed = zero
+        elif shipping is not None:
+            landed = cost + shipping
+        else:
+            landed = cost
+        key = (0 if record.quantity_available > 0 else 1, landed, record.vendor_id)
+        current = best_get(record.sku)
+        if current is None or key < current[0]:
+            best[record.sku] = (key, record)
 
     merged: List[InventoryRecord] = []
-    for sku in sorted(grouped.keys()):
-        sku_records = grouped[sku]
-
-        def sort_key(item: InventoryRecord) -> tuple[int, Decimal, str]:
-            in_stock = 1 if item.quantity_available > 0 else 0
-            return (-in_stock, _landed_cost(item, config.landed_cost), item.vendor_id)
-
-        sorted_records = sorted(sku_records, key=sort_key)
-        selected = sorted_records[0]
+    fallback_lead_time_days = config.fallback_lead_time_days
+    for sku in sorted(best):
+        selected = best[sku][1]
         if selected.lead_time_days is None:
-            selected = selected.model_copy(
-                update={"lead_time_days": config.fallback_lead_time_days}
-            )
+            update_in_place(selected, lead_time_days=fallback_lead_time_days)
         merged.append(selected)
     return merged
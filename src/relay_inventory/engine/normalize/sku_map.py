@@ -2,9 +2,9 @@ from __future__ import annotations
 
 import csv
 from dataclasses import dataclass
-from typing import Dict, Iterable
+from typing import Dict, Iterable, Iterator, List
 
-from relay_inventory.engine.canonical.models import InventoryRecord
+from relay_inventory.engine.canonical.models import InventoryRecord, intern_sku, update_in_place
 
 
 @dataclass
@@ -15,29 +15,42 @@ class SkuMap:
         for record in records:
             mapped = self.mapping.get(record.sku)
             if mapped:
-                yield record.model_copy(update={"sku": mapped})
-            else:
-                yield record
+                update_in_place(record, sku=mapped)
+            yield record
+
+    def remap(self, records: Iterable[InventoryRecord]) -> None:
+        mapping = self.mapping
+        for record in records:
+            mapped = mapping.get(record.sku)
+            if mapped:
+                update_in_place(record, sku=mapped)
 
 
-def _parse_sku_rows(reader: csv.DictReader) -> Dict[str, str]:
+def _parse_sku_rows(reader: Iterator[List[str]]) -> Dict[str, str]:
+    header = next(reader, [])
+    positions = {name: index for index, name in enumerate(header)}
+    vendor_sku_at = positions.get("vendor_sku")
+    sku_at = positions.get("sku")
     mapping: Dict[str, str] = {}
+    if vendor_sku_at is None or sku_at is None:
+        return mapping
+    needed = max(vendor_sku_at, sku_at)
     for row in reader:
-        vendor_sku = (row.get("vendor_sku") or "").strip()
-        sku = (row.get("sku") or "").strip()
+        if len(row) <= needed:
+            continue
+        vendor_sku = row[vendor_sku_at].strip()
+        sku = row[sku_at].strip()
         if vendor_sku and sku:
-            mapping[vendor_sku] = sku
+            mapping[intern_sku(vendor_sku)] = intern_sku(sku)
     return mapping
 
 
 def load_sku_map(path: str) -> SkuMap:
     with open(path, "r", newline="", encoding="utf-8") as handle:
-        reader = csv.DictReader(handle)
-        mapping = _parse_sku_rows(reader)
+        mapping = _parse_sku_rows(csv.reader(handle))
     return SkuMap(mapping=mapping)
 
 
 def load_sku_map_from_text(text: str) -> SkuMap:
-    reader = csv.DictReader(text.splitlines())
-    mapping = _parse_sku_rows(reader)
+    mapping = _parse_sku_rows(csv.reader(text.splitlines()))
     return SkuMap(mapping=mapping)
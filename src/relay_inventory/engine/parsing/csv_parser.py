@@ -1,12 +1,13 @@
 from __future__ import annotations
 
 import csv
+import io
 from dataclasses import dataclass
 from datetime import datetime
 from decimal import Decimal, InvalidOperation
-from typing import IO, Any, Dict, Iterable, List, Optional, Tuple
+from typing import IO, Any, Dict, Iterable, Iterator, List, Optional, Tuple
 
-from relay_inventory.engine.canonical.models import InventoryRecord
+from relay_inventory.engine.canonical.models import InventoryRecord, construct_record, intern_sku
 
 
 @dataclass
@@ -16,7 +17,7 @@ class ParseError:
     row_data: Dict[str, Any]
 
 
-def _parse_decimal(value: Optional[str]) -> Optional[Decimal]:
+def _parse_decimal(value: Optional[str], failures: List[str]) -> Optional[Decimal]:
     if value is None:
         return None
     if isinstance(value, (int, float, Decimal)):
@@ -26,11 +27,12 @@ def _parse_decimal(value: Optional[str]) -> Optional[Decimal]:
         return None
     try:
         return Decimal(stripped)
-    except InvalidOperation as exc:
-        raise ValueError(f"invalid decimal: {value}") from exc
+    except InvalidOperation:
+        failures.append(f"invalid decimal: {value}")
+        return None
 
 
-def _parse_int(value: Optional[str]) -> Optional[int]:
+def _parse_int(value: Optional[str], failures: List[str]) -> Optional[int]:
     if value is None:
         return None
     if isinstance(value, int):
@@ -40,11 +42,38 @@ def _parse_int(value: Optional[str]) -> Optional[int]:
         return None
     try:
         return int(stripped)
-    except ValueError as exc:
-        raise ValueError(f"invalid int: {value}") from exc
+    except ValueError:
+        failures.append(f"invalid int: {value}")
+        return None
+
+
+ZERO_PRICE = Decimal("0")
+FAST_PATH_PEEK_CHARS = 8 * 1024
+FAST_PATH_MAX_CHARS = 100 * 1024 * 1024
+DATE_FORMAT = "%Y-%m-%d"
+DATETIME_FORMAT = "%Y-%m-%d %H:%M:%S"
+ISO_DATETIME_FORMAT = "%Y-%m-%dT%H:%M:%S"
+
+
+def _is_iso_shaped(value: str) -> bool:
+    length = len(value)
+    if length == 19:
+        if value[10] not in " T" or value[13] != ":" or value[16] != ":":
+            return False
+    elif length != 10:
+        return False
+    return value[4] == "-" and value[7] == "-"
+
 
+def _datetime_format(value: str) -> str:
+    if "T" in value:
+        return ISO_DATETIME_FORMAT
+    if ":" in value:
+        return DATETIME_FORMAT
+    return DATE_FORMAT
 
-def _parse_datetime(value: Optional[str]) -> Optional[datetime]:
+
+def _parse_datetime(value: Optional[str], failures: List[str]) -> Optional[datetime]:
     if value is None:
         return None
     if isinstance(value, datetime):
@@ -52,12 +81,50 @@ def _parse_datetime(value: Optional[str]) -> Optional[datetime]:
     stripped = value.strip()
     if not stripped:
         return None
-    for fmt in ("%Y-%m-%d %H:%M:%S", "%Y-%m-%d", "%Y-%m-%dT%H:%M:%S"):
+    if _is_iso_shaped(stripped):
         try:
-            return datetime.strptime(stripped, fmt)
+            return datetime.fromisoformat(stripped)
         except ValueError:
-            continue
-    raise ValueError(f"invalid datetime: {value}")
+            pass
+    try:
+        return datetime.strptime(stripped, _datetime_format(stripped))
+    except ValueError:
+        failures.append(f"invalid datetime: {value}")
+        return None
+
+
+def _needs_csv_reader(text: str) -> bool:
+    return '"' in text or "\r" in text or "\x00" in text
+
+
+def _stream_lines(prefix: str, handle: IO[str]) -> Iterator[str]:
+    for line in io.StringIO(prefix):
+        if not line.endswith("\n"):
+            line += handle.readline()
+        yield line
+    yield from handle
+
+
+def _read_rows(handle: IO[str]) -> Iterator[List[str]]:
+    text = handle.read(FAST_PATH_PEEK_CHARS)
+    if not _needs_csv_reader(text):
+        text += handle.read(FAST_PATH_MAX_CHARS - len(text))
+        if len(text) < FAST_PATH_MAX_CHARS and not _needs_csv_reader(text):
+            lines = text.split("\n")
+            if not lines[-1]:
+                lines.pop()
+            return (line.split(",") if line else [] for line in lines)
+    return csv.reader(_stream_lines(text, handle))
+
+
+def _row_dict(header: List[str], row: List[str]) -> Dict[Any, Any]:
+    data: Dict[Any, Any] = dict(zip(header, row))
+    if len(row) < len(header):
+        for name in header[len(row):]:
+            data[name] = None
+    elif len(row) > len(header):
+        data[None] = row[len(header):]
+    return data
 
 
 def parse_csv(
@@ -69,54 +136,80 @@ def parse_csv(
     now: Optional[datetime] = None,
 ) -> Tuple[List[InventoryRecord], List[ParseError]]:
     parsed_at = now or datetime.utcnow()
-    reader = csv.DictReader(handle)
+    reader = _read_rows(handle)
+    header: List[str] = next(reader, [])
     required_fields = ["sku", "quantity_available"]
     missing = []
     for field in required_fields:
         mapped = column_map.get(field, field)
-        if not reader.fieldnames or mapped not in reader.fieldnames:
+        if mapped not in header:
             missing.append(mapped)
     if missing:
         raise ValueError(f"missing columns: {', '.join(missing)}")
+    positions = {name: index for index, name in enumerate(header)}
+    width = len(header)
+    missing_value: List[Optional[str]] = [None]
+
+    def column(field: str) -> int:
+        return positions.get(column_map.get(field, field), width)
+
+    sku_at = column("sku")
+    vendor_sku_at = column("vendor_sku")
+    quantity_at = column("quantity_available")
+    cost_at = column("cost")
+    map_price_at = column("map_price")
+    msrp_at = column("msrp")
+    lead_time_at = column("lead_time_days")
+    price_at = column("price")
+    updated_at_at = column("updated_at")
+    condition_at = column("condition")
+    brand_at = column("brand")
+    title_at = column("title")
     records: List[InventoryRecord] = []
     errors: List[ParseError] = []
 
-    for row_number, row in enumerate(reader, start=2):
+    row_number = 1
+    for row in reader:
+        if not row:
+            continue
+        row_number += 1
+        if len(row) == width:
+            values: List[Optional[str]] = row + missing_value
+        else:
+            values = row[:width] + [None] * (width + 1 - min(len(row), width))
+        failures: List[str] = []
+        quantity_available = _parse_int(values[quantity_at], failures)
+        cost = _parse_decimal(values[cost_at], failures)
+        map_price = _parse_decimal(values[map_price_at], failures)
+        msrp = _parse_decimal(values[msrp_at], failures)
+        lead_time_days = _parse_int(values[lead_time_at], failures)
+        price = _parse_decimal(values[price_at], failures)
+        updated_at = _parse_datetime(values[updated_at_at], failures)
+        if failures:
+            errors.append(ParseError(row_number=row_number, reason=failures[0], row_data=_row_dict(header, row)))
+            continue
         try:
-            sku = row.get(column_map.get("sku", "sku"))
-            vendor_sku = row.get(column_map.get("vendor_sku", "vendor_sku"))
-            quantity_available = _parse_int(
-                row.get(column_map.get("quantity_available", "quantity_available"))
-            )
-            cost = _parse_decimal(row.get(column_map.get("cost", "cost")))
-            map_price = _parse_decimal(row.get(column_map.get("map_price", "map_price")))
-            msrp = _parse_decimal(row.get(column_map.get("msrp", "msrp")))
-            lead_time_days = _parse_int(
-                row.get(column_map.get("lead_time_days", "lead_time_days"))
-            )
-            price = _parse_decimal(row.get(column_map.get("price", "price")))
-            updated_at = _parse_datetime(
-                row.get(column_map.get("updated_at", "updated_at"))
-            )
-            record = InventoryRecord(
-                sku=sku or "",
-                vendor_sku=vendor_sku,
+            record = construct_record(
+                sku=values[sku_at] or "",
+                vendor_sku=intern_sku(values[vendor_sku_at]),
                 vendor_id=vendor_id,
                 quantity_available=quantity_available or 0,
                 lead_time_days=lead_time_days,
                 cost=cost,
                 map_price=map_price,
-                price=price or Decimal("0"),
+                price=price or ZERO_PRICE,
                 msrp=msrp,
-                condition=row.get(column_map.get("condition", "condition"))
-                or default_condition,
-                brand=row.get(column_map.get("brand", "brand")),
-                title=row.get(column_map.get("title", "title")),
+                condition=values[condition_at] or default_condition,
+                brand=values[brand_at],
+                title=values[title_at],
                 updated_at=updated_at or parsed_at,
             )
-            records.append(record)
         except Exception as exc:  # noqa: BLE001 - capture parse errors for reporting
-            errors.append(ParseError(row_number=row_number, reason=str(exc), row_data=row))
+            errors.append(
+                ParseError(row_number=row_number, reason=str(exc), row_data=_row_dict(header, row))
+            )
+            continue
+        records.append(record)
 
     return records, errors
 
@@ -138,4 +231,4 @@ def load_csv_records(
 
 
 def records_to_rows(records: Iterable[InventoryRecord]) -> List[Dict[str, Any]]:
-    return [record.model_dump() for record in records]
+    return [dict(record.__dict__) for record in records]
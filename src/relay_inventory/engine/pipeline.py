@@ -33,7 +33,7 @@ def process_vendor(
     if vendor_config.sku_map and vendor_config.sku_map.local_path:
         sku_map = load_sku_map(vendor_config.sku_map.local_path)
     if sku_map:
-        records = list(sku_map.apply(records))
+        sku_map.remap(records)
 
     return VendorResult(vendor_id=vendor_config.vendor_id, records=records, errors=errors)
 
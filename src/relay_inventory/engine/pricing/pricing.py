@@ -4,7 +4,7 @@ from dataclasses import dataclass
 from decimal import Decimal, ROUND_HALF_UP
 from typing import Iterable
 
-from relay_inventory.engine.canonical.models import InventoryRecord
+from relay_inventory.engine.canonical.models import InventoryRecord, update_in_place
 
 
 @dataclass
@@ -47,12 +47,71 @@ def compute_price(cost: Decimal, rules: PricingRules, map_price: Decimal | None)
     return candidate
 
 
+@dataclass(frozen=True)
+class IntegerPricing:
+    markup_num: int
+    markup_den: int
+    shipping_num: int
+    shipping_den: int
+    min_num: int
+    min_den: int
+    increment_num: int
+    increment_den: int
+    increment: Decimal
+    enforce_map: bool
+
+    @classmethod
+    def from_rules(cls, rules: PricingRules) -> "IntegerPricing":
+        margin_num, margin_den = rules.base_margin_pct.as_integer_ratio()
+        shipping_num, shipping_den = rules.shipping_handling_flat.as_integer_ratio()
+        min_num, min_den = rules.min_price.as_integer_ratio()
+        increment_num, increment_den = rules.rounding.increment.as_integer_ratio()
+        return cls(
+            markup_num=margin_den + margin_num,
+            markup_den=margin_den,
+            shipping_num=shipping_num,
+            shipping_den=shipping_den,
+            min_num=min_num,
+            min_den=min_den,
+            increment_num=increment_num,
+            increment_den=increment_den,
+            increment=rules.rounding.increment,
+            enforce_map=rules.map_policy.enforce
+            and rules.map_policy.map_floor_behavior == "max(price, map_price)",
+        )
+
+    def compute_price(self, cost: Decimal, map_price: Decimal | None) -> Decimal:
+        cost_num, cost_den = cost.as_integer_ratio()
+        num = (cost_num * self.shipping_den + self.shipping_num * cost_den) * self.markup_num
+        den = cost_den * self.shipping_den * self.markup_den
+        if num * self.min_den < self.min_num * den:
+            num, den = self.min_num, self.min_den
+        num *= self.increment_den
+        den *= self.increment_num
+        if num >= 0:
+            increments = (2 * num + den) // (2 * den)
+        else:
+            increments = -((den - 2 * num) // (2 * den))
+        candidate = Decimal(increments) * self.increment
+        if self.enforce_map and map_price is not None:
+            candidate = max(candidate, map_price)
+        return candidate
+
+
 def apply_pricing(records: Iterable[InventoryRecord], rules: PricingRules) -> list[InventoryRecord]:
-    priced: list[InventoryRecord] = []
-    for record in records:
-        if record.cost is None:
-            priced.append(record)
-            continue
-        new_price = compute_price(record.cost, rules, record.map_price)
-        priced.append(record.model_copy(update={"price": new_price}))
+    priced = list(records)
+    costed = [record for record in priced if record.cost is not None]
+    if rules.rounding.increment <= 0:
+        for record in costed:
+            update_in_place(record, price=compute_price(record.cost, rules, record.map_price))
+        return priced
+    fast = IntegerPricing.from_rules(rules)
+    base_prices = {cost: fast.compute_price(cost, None) for cost in {record.cost for record in costed}}
+    enforce_map = fast.enforce_map
+    for record in costed:
+        price = base_prices[record.cost]
+        map_price = record.map_price
+        if enforce_map and map_price is not None and map_price > price:
+            price = map_price
+        update_in_place(record, price=price)
     return priced
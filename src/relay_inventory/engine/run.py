@@ -1,16 +1,26 @@
 from __future__ import annotations
 
+import gzip
+import hashlib
 import io
+import zlib
+from concurrent.futures import Future, ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime
+from typing import Iterator, Optional
 
 from relay_inventory.app.models.config import TenantConfig, VendorConfig
 from relay_inventory.engine.canonical.models import InventoryRecord
-from relay_inventory.engine.normalize.sku_map import load_sku_map_from_text
-from relay_inventory.engine.parsing.csv_parser import ParseError, parse_csv
+from relay_inventory.engine.normalize.sku_map import SkuMap, load_sku_map_from_text
+from relay_inventory.engine.parsing.csv_parser import ParseError, parse_csv, records_to_rows
 from relay_inventory.engine.pipeline import merge_records, price_records
+from relay_inventory.util.cache import LruCache
 
 SKU_MAP_SUFFIX = "::sku_map"
+MAX_PARSE_WORKERS = 8
+SKU_MAP_CACHE_SIZE = 64
+GZIP_MAGIC = b"\x1f\x8b"
+DECODE_ERRORS = (UnicodeDecodeError, gzip.BadGzipFile, EOFError, zlib.error)
 SUPPORTED_ENCODINGS = {
     "utf-8": "utf-8",
     "utf8": "utf-8",
@@ -19,6 +29,8 @@ SUPPORTED_ENCODINGS = {
     "iso8859-1": "latin-1",
 }
 
+_SKU_MAP_CACHE: LruCache[tuple[bytes, str], SkuMap] = LruCache(SKU_MAP_CACHE_SIZE)
+
 
 class MissingRequiredColumnsError(ValueError):
     """Raised when a vendor input is missing required columns."""
@@ -48,7 +60,7 @@ def _normalize_encoding(encoding: str) -> str:
     return SUPPORTED_ENCODINGS.get(normalized, normalized)
 
 
-def _decode_bytes(*, raw_bytes: bytes, encoding: str, vendor_id: str) -> str:
+def _supported_encoding(encoding: str, vendor_id: str) -> str:
     normalized = _normalize_encoding(encoding)
     if normalized not in set(SUPPORTED_ENCODINGS.values()):
         raise DecodeError(
@@ -56,12 +68,36 @@ def _decode_bytes(*, raw_bytes: bytes, encoding: str, vendor_id: str) -> str:
             encoding,
             f"unsupported encoding '{encoding}' for vendor {vendor_id}",
         )
+    return normalized
+
+
+def _open_text(*, raw_bytes: bytes, encoding: str, vendor_id: str) -> io.TextIOWrapper:
+    normalized = _supported_encoding(encoding, vendor_id)
+    raw: io.BufferedIOBase = io.BytesIO(raw_bytes)
+    if raw_bytes.startswith(GZIP_MAGIC):
+        raw = gzip.GzipFile(fileobj=raw, mode="rb")
+    return io.TextIOWrapper(raw, encoding=normalized, newline="")
+
+
+def _decode_bytes(*, raw_bytes: bytes, encoding: str, vendor_id: str) -> str:
+    normalized = _supported_encoding(encoding, vendor_id)
     try:
+        if raw_bytes.startswith(GZIP_MAGIC):
+            raw_bytes = gzip.decompress(raw_bytes)
         return raw_bytes.decode(normalized)
-    except UnicodeDecodeError as exc:
+    except DECODE_ERRORS as exc:
         raise DecodeError(vendor_id, encoding, str(exc)) from exc
 
 
+def _load_sku_map(raw_bytes: bytes, *, encoding: str, vendor_id: str) -> SkuMap:
+    key = (hashlib.blake2b(raw_bytes, digest_size=16).digest(), _normalize_encoding(encoding))
+    sku_map = _SKU_MAP_CACHE.get(key)
+    if sku_map is None:
+        sku_map = load_sku_map_from_text(_decode_bytes(raw_bytes=raw_bytes, encoding=encoding, vendor_id=vendor_id))
+        _SKU_MAP_CACHE.put(key, sku_map)
+    return sku_map
+
+
 def _parse_vendor_input(
     vendor: VendorConfig,
     *,
@@ -72,13 +108,15 @@ def _parse_vendor_input(
 ) -> tuple[list[InventoryRecord], list[ParseError]]:
     try:
         encoding = vendor.parser.encoding or "utf-8"
-        decoded_text = _decode_bytes(raw_bytes=raw_bytes, encoding=encoding, vendor_id=vendor.vendor_id)
-        records, vendor_errors = parse_csv(
-            io.StringIO(decoded_text),
-            vendor_id=vendor.vendor_id,
-            column_map=vendor.parser.column_map,
-            now=now,
-        )
+        with _open_text(raw_bytes=raw_bytes, encoding=encoding, vendor_id=vendor.vendor_id) as handle:
+            records, vendor_errors = parse_csv(
+                handle,
+                vendor_id=vendor.vendor_id,
+                column_map=vendor.parser.column_map,
+                now=now,
+            )
+    except DECODE_ERRORS as exc:
+        raise DecodeError(vendor.vendor_id, encoding, str(exc)) from exc
     except ValueError as exc:
         message = str(exc)
         if "missing columns:" in message.lower():
@@ -98,13 +136,8 @@ def _parse_vendor_input(
                 )
             )
         else:
-            decoded_map = _decode_bytes(
-                raw_bytes=sku_map_bytes,
-                encoding=encoding,
-                vendor_id=vendor.vendor_id,
-            )
-            sku_map = load_sku_map_from_text(decoded_map)
-            records = list(sku_map.apply(records))
+            sku_map = _load_sku_map(sku_map_bytes, encoding=encoding, vendor_id=vendor.vendor_id)
+            sku_map.remap(records)
 
     return records, vendor_errors
 
@@ -118,42 +151,56 @@ def run_inventory_sync(
 ) -> EngineResult:
     normalized_by_vendor: dict[str, list[dict]] = {}
     errors: list[ParseError] = []
-    vendor_counts: dict[str, int] = {}
+    vendor_ids = [vendor.vendor_id for vendor in tenant_config.vendors]
+    vendor_counts = [0] * len(vendor_ids)
     total_rows = 0
-    all_records: list[InventoryRecord] = []
-
-    for vendor in tenant_config.vendors:
-        raw_bytes = vendor_inputs.get(vendor.vendor_id)
-        if raw_bytes is None:
-            if vendor.required and tenant_config.error_policy.missing_required_vendor_policy != "warn_only":
-                errors.append(
-                    ParseError(row_number=0, reason="missing inbound file", row_data={"vendor": vendor.vendor_id})
+
+    parsed: list[Optional[Future[tuple[list[InventoryRecord], list[ParseError]]]]] = []
+
+    def parsed_records() -> Iterator[InventoryRecord]:
+        nonlocal total_rows
+        for index, (vendor, future) in enumerate(zip(tenant_config.vendors, parsed)):
+            if future is None:
+                if vendor.required and tenant_config.error_policy.missing_required_vendor_policy != "warn_only":
+                    errors.append(
+                        ParseError(row_number=0, reason="missing inbound file", row_data={"vendor": vendor.vendor_id})
+                    )
+                normalized_by_vendor[vendor.vendor_id] = []
+                continue
+
+            records, vendor_errors = future.result()
+            errors.extend(vendor_errors)
+            record_count = vendor_counts[index] = len(records)
+            total_rows += record_count + len(vendor_errors)
+            normalized_by_vendor[vendor.vendor_id] = records_to_rows(records)
+            yield from records
+
+    workers = max(1, min(MAX_PARSE_WORKERS, len(tenant_config.vendors)))
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        for vendor in tenant_config.vendors:
+            raw_bytes = vendor_inputs.get(vendor.vendor_id)
+            if raw_bytes is None:
+                parsed.append(None)
+                continue
+            parsed.append(
+                executor.submit(
+                    _parse_vendor_input,
+                    vendor,
+                    raw_bytes=raw_bytes,
+                    now=now,
+                    tenant_config=tenant_config,
+                    vendor_inputs=vendor_inputs,
                 )
-            normalized_by_vendor[vendor.vendor_id] = []
-            vendor_counts[vendor.vendor_id] = 0
-            continue
-
-        records, vendor_errors = _parse_vendor_input(
-            vendor,
-            raw_bytes=raw_bytes,
-            now=now,
-            tenant_config=tenant_config,
-            vendor_inputs=vendor_inputs,
-        )
-        errors.extend(vendor_errors)
-        all_records.extend(records)
-        vendor_counts[vendor.vendor_id] = len(records)
-        total_rows += len(records) + len(vendor_errors)
-        normalized_by_vendor[vendor.vendor_id] = [record.model_dump() for record in records]
+            )
+        merged = merge_records(parsed_records(), tenant_config)
 
-    merged = merge_records(all_records, tenant_config)
     priced = price_records(merged, tenant_config)
-    merged_rows = [record.model_dump() for record in priced]
+    merged_rows = records_to_rows(priced)
 
     summary = {
         "run_id": run_id,
         "vendor_count": len(tenant_config.vendors),
-        "vendor_record_counts": vendor_counts,
+        "vendor_record_counts": dict(zip(vendor_ids, vendor_counts)),
         "record_count": len(priced),
         "invalid_rows": len(errors),
         "total_rows": total_rows,
@@ -2,10 +2,22 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Any, Dict, Optional
+from functools import lru_cache
+from typing import Any, Dict, Iterable, Optional
 
-import boto3
 from boto3.dynamodb.conditions import Attr
+from botocore.exceptions import ClientError
+
+from relay_inventory.util.aws import aws_resource
+
+RESERVED_ATTRIBUTE_NAMES = {"status": "#status", "stage": "#stage"}
+RUN_STAGES = ("QUEUE", "FETCH_INPUTS", "NORMALIZE", "MERGE_PRICE", "WRITE_OUTPUTS", "COMPLETE")
+STAGE_INDEX = {stage: index for index, stage in enumerate(RUN_STAGES)}
+STAGE_CONDITION = (
+    "attribute_not_exists(stage_index) OR attribute_type(stage_index, :null_type) OR stage_index <= :stage_index"
+)
+TERMINAL_STATUSES = {"SUCCEEDED", "FAILED"}
+NOT_SUCCEEDED_CONDITION = "(attribute_not_exists(#status) OR #status <> :succeeded)"
 
 
 @dataclass
@@ -14,8 +26,8 @@ class RunRecord:
     tenant_id: str
     config_version: int
     status: str
-    stage: Optional[str] = None
     requested_at: str
+    stage: Optional[str] = None
     started_at: Optional[str] = None
     finished_at: Optional[str] = None
     completed_at: Optional[str] = None
@@ -25,15 +37,38 @@ class RunRecord:
     errors_artifact_key: Optional[str] = None
     error_report_key: Optional[str] = None
     artifacts: Dict[str, str] | None = None
+    stage_index: Optional[int] = None
+
+
+@lru_cache(maxsize=128)
+def _update_expression(fields: tuple[str, ...], remove_fields: tuple[str, ...]) -> tuple[str, Dict[str, str]]:
+    assignments = []
+    names: Dict[str, str] = {}
+    for field in ("status", *fields):
+        placeholder = RESERVED_ATTRIBUTE_NAMES.get(field)
+        if placeholder:
+            names[placeholder] = field
+            assignments.append(f"{placeholder} = :{field}")
+        else:
+            assignments.append(f"{field} = :{field}")
+    expression = "SET " + ", ".join(assignments)
+    if remove_fields:
+        expression += " REMOVE " + ", ".join(remove_fields)
+    return expression, names
 
 
 class DynamoRuns:
     def __init__(self, table_name: str) -> None:
-        self.table = boto3.resource("dynamodb").Table(table_name)
+        self.table = aws_resource("dynamodb").Table(table_name)
 
     def create(self, record: RunRecord) -> None:
         self.table.put_item(Item=record.__dict__)
 
+    def create_many(self, records: Iterable[RunRecord]) -> None:
+        with self.table.batch_writer(overwrite_by_pkeys=["run_id"]) as batch:
+            for record in records:
+                batch.put_item(Item=record.__dict__)
+
     def update_status(
         self,
         run_id: str,
@@ -51,52 +86,66 @@ class DynamoRuns:
         artifacts: Optional[Dict[str, str]] = None,
         clear_fields: Optional[list[str]] = None,
     ) -> None:
-        expression = ["#status = :status"]
-        names = {"#status": "status"}
+        updates = {
+            "stage": stage,
+            "started_at": started_at.isoformat() if started_at else None,
+            "finished_at": finished_at.isoformat() if finished_at else None,
+            "completed_at": completed_at.isoformat() if completed_at else None,
+            "failed_stage": failed_stage,
+            "error_code": error_code,
+            "error_message": error_message,
+            "errors_artifact_key": errors_artifact_key,
+            "error_report_key": error_report_key,
+            "artifacts": artifacts,
+        }
         values: Dict[str, Any] = {":status": status}
-        if stage:
-            expression.append("#stage = :stage")
-            names["#stage"] = "stage"
-            values[":stage"] = stage
-        if started_at:
-            expression.append("started_at = :started_at")
-            values[":started_at"] = started_at.isoformat()
-        if finished_at:
-            expression.append("finished_at = :finished_at")
-            values[":finished_at"] = finished_at.isoformat()
-        if completed_at:
-            expression.append("completed_at = :completed_at")
-            values[":completed_at"] = completed_at.isoformat()
-        if failed_stage:
-            expression.append("failed_stage = :failed_stage")
-            values[":failed_stage"] = failed_stage
-        if error_code:
-            expression.append("error_code = :error_code")
-            values[":error_code"] = error_code
-        if error_message:
-            expression.append("error_message = :error_message")
-            values[":error_message"] = error_message
-        if errors_artifact_key:
-            expression.append("errors_artifact_key = :errors_artifact_key")
-            values[":errors_artifact_key"] = errors_artifact_key
-        if error_report_key:
-            expression.append("error_report_key = :error_report_key")
-            values[":error_report_key"] = error_report_key
-        if artifacts:
-            expression.append("artifacts = :artifacts")
-            values[":artifacts"] = artifacts
-        remove_fields = []
-        if clear_fields:
-            for field in clear_fields:
-                remove_fields.append(field)
-        self.table.update_item(
-            Key={"run_id": run_id},
-            UpdateExpression=(
-                "SET " + ", ".join(expression) + (" REMOVE " + ", ".join(remove_fields) if remove_fields else "")
-            ),
-            ExpressionAttributeNames=names,
-            ExpressionAttributeValues=values,
-        )
+        present = []
+        for field, value in updates.items():
+            if value:
+                present.append(field)
+                values[f":{field}"] = value
+        guard = None
+        if status != "SUCCEEDED":
+            guard = NOT_SUCCEEDED_CONDITION
+            values[":succeeded"] = "SUCCEEDED"
+        stage_index = STAGE_INDEX.get(stage) if stage else None
+        if stage_index is None:
+            self._update_item(run_id, present, values, clear_fields, guard)
+            return
+        conditional_values = {**values, ":stage_index": stage_index, ":null_type": "NULL"}
+        condition = f"({STAGE_CONDITION}) AND {guard}" if guard else STAGE_CONDITION
+        if self._update_item(run_id, [*present, "stage_index"], conditional_values, clear_fields, condition):
+            return
+        if status not in TERMINAL_STATUSES:
+            return
+        del values[":stage"]
+        present.remove("stage")
+        self._update_item(run_id, present, values, clear_fields, guard)
+
+    def _update_item(
+        self,
+        run_id: str,
+        fields: list[str],
+        values: Dict[str, Any],
+        clear_fields: Optional[list[str]],
+        condition: Optional[str] = None,
+    ) -> bool:
+        update_expression, names = _update_expression(tuple(fields), tuple(clear_fields or ()))
+        params: Dict[str, Any] = {
+            "Key": {"run_id": run_id},
+            "UpdateExpression": update_expression,
+            "ExpressionAttributeNames": names,
+            "ExpressionAttributeValues": values,
+        }
+        if condition:
+            params["ConditionExpression"] = condition
+        try:
+            self.table.update_item(**params)
+        except ClientError as exc:
+            if exc.response.get("Error", {}).get("Code") != "ConditionalCheckFailedException":
+                raise
+            return False
+        return True
 
     def get(self, run_id: str) -> Optional[RunRecord]:
         response = self.table.get_item(Key={"run_id": run_id})
@@ -1,11 +1,13 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Optional
+from decimal import Decimal
+from typing import Any, Optional
 
-import boto3
 from boto3.dynamodb.conditions import Key
 
+from relay_inventory.util.aws import aws_resource
+
 
 @dataclass
 class TenantRecord:
@@ -14,12 +16,28 @@ class TenantRecord:
     config: dict
 
 
+def _floats_to_decimal(value: Any) -> Any:
+    if isinstance(value, float):
+        return Decimal(str(value))
+    if isinstance(value, dict):
+        return {key: _floats_to_decimal(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_floats_to_decimal(item) for item in value]
+    return value
+
+
 class DynamoTenants:
     def __init__(self, table_name: str) -> None:
-        self.table = boto3.resource("dynamodb").Table(table_name)
+        self.table = aws_resource("dynamodb").Table(table_name)
 
     def put(self, record: TenantRecord) -> None:
-        self.table.put_item(Item=record.__dict__)
+        self.table.put_item(
+            Item={
+                "tenant_id": record.tenant_id,
+                "config_version": record.config_version,
+                "config": _floats_to_decimal(record.config),
+            }
+        )
 
     def get(self, tenant_id: str, config_version: int) -> Optional[TenantRecord]:
         response = self.table.get_item(
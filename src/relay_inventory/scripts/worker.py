@@ -1,34 +1,59 @@
 from __future__ import annotations
 
 import json
+import multiprocessing
+import multiprocessing.util
 import os
+import random
 import threading
-from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+import time
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import fields, replace
 from datetime import datetime
+from functools import partial
+from itertools import chain
 from pathlib import PurePosixPath
-from typing import Dict, List
+from typing import Callable, Dict, List
 
-import boto3
 from botocore.exceptions import BotoCoreError, ClientError
-
-from relay_inventory.adapters.queue.sqs import SqsAdapter, SqsMessage
-from relay_inventory.adapters.storage.s3 import S3Adapter
+from pydantic import ValidationError
+
+from relay_inventory.adapters.queue.sqs import (
+    RECEIVE_BATCH_MAX,
+    SqsAdapter,
+    SqsDeleteBatcher,
+    SqsMessage,
+    SqsVisibilityHeartbeat,
+)
+from relay_inventory.adapters.storage.s3 import PRECONDITION_FAILED_CODES, S3Adapter, S3Location
 from relay_inventory.app.jobs.schema import RunJob
-from relay_inventory.app.models.config import TenantConfig
-from relay_inventory.engine.canonical.io import write_csv_bytes
+from relay_inventory.app.models.config import TenantConfig, VendorConfig
+from relay_inventory.engine.canonical.io import iter_csv_chunks, iter_json_array_chunks, write_json_bytes
 from relay_inventory.engine.canonical.models import CANONICAL_COLUMNS
 from relay_inventory.engine.run import (
+    SKU_MAP_CACHE_SIZE,
     DecodeError,
     MissingRequiredColumnsError,
     run_inventory_sync,
     sku_map_input_key,
 )
-from relay_inventory.persistence.dynamo_runs import DynamoRuns
+from relay_inventory.persistence.dynamo_runs import STAGE_INDEX, DynamoRuns, RunRecord
 from relay_inventory.persistence.dynamo_tenants import DynamoTenants
+from relay_inventory.util.cache import LruCache
 from relay_inventory.util.errors import NonRetryableError, RetryableError
 from relay_inventory.util.logging import get_logger, log_event
 from relay_inventory.util.metrics import CloudWatchMetrics
 
+MAX_INGEST_WORKERS = 32
+MAX_UPLOAD_WORKERS = 8
+JSON_CONTENT_TYPE = "application/json"
+TENANT_CONFIG_CACHE_SIZE = 256
+WORKER_EXECUTORS = {"thread", "process"}
+RECEIVE_ERROR_BACKOFF_MAX_SECONDS = 60.0
+RUN_RECORD_FIELDS = {field.name for field in fields(RunRecord)}
+
+_PROCESS_WORKER: Worker | None = None
+
 
 class Worker:
     def __init__(
@@ -39,86 +64,60 @@ class Worker:
         tenants_table: str,
         queue_url: str | None = None,
     ) -> None:
+        self.bucket = bucket
+        self.runs_table = runs_table
+        self.tenants_table = tenants_table
+        self.queue_url = queue_url
         self.s3 = S3Adapter(bucket)
         self.runs = DynamoRuns(runs_table)
         self.tenants = DynamoTenants(tenants_table)
         self.queue = SqsAdapter(queue_url) if queue_url else None
         self.logger = get_logger(self.__class__.__name__)
         self.metrics = CloudWatchMetrics.from_env()
-        self.cloudwatch_enabled = os.getenv("CLOUDWATCH_METRICS_ENABLED", "false").lower() == "true"
-        self.cloudwatch_namespace = os.getenv("CLOUDWATCH_METRICS_NAMESPACE", "RelayInventory")
-        self.cloudwatch_environment = os.getenv("ENVIRONMENT", "unknown")
-        self.cloudwatch = boto3.client("cloudwatch") if self.cloudwatch_enabled else None
         self.visibility_timeout_seconds = int(os.getenv("WORKER_VISIBILITY_TIMEOUT_SECONDS", "300"))
         self.visibility_heartbeat_seconds = int(os.getenv("WORKER_VISIBILITY_HEARTBEAT_SECONDS", "60"))
         self.tenant_backoff_seconds = int(os.getenv("WORKER_TENANT_BACKOFF_SECONDS", "30"))
         self.poison_max_receives = int(os.getenv("WORKER_POISON_MAX_RECEIVES", "3"))
-
-    def emit_metric(self, name: str, value: float, unit: str, tenant_id: str) -> None:
-        if not self.cloudwatch_enabled or not self.cloudwatch:
-            return
-        try:
-            self.cloudwatch.put_metric_data(
-                Namespace=self.cloudwatch_namespace,
-                MetricData=[
-                    {
-                        "MetricName": name,
-                        "Value": value,
-                        "Unit": unit,
-                        "Dimensions": [
-                            {"Name": "TenantId", "Value": tenant_id},
-                            {"Name": "Environment", "Value": self.cloudwatch_environment},
-                        ],
-                    }
-                ],
-            )
-        except (BotoCoreError, ClientError) as exc:
-            log_event(self.logger, "cloudwatch_metric_failed", metric=name, error=str(exc))
-
-    def emit_run_metrics(
-        self,
-        *,
-        tenant_id: str,
-        succeeded: bool,
-        duration_seconds: float,
-        rows_processed: int,
-    ) -> None:
-        if succeeded:
-            self.emit_metric("RunSucceeded", 1, "Count", tenant_id)
-            self.emit_metric("RunFailed", 0, "Count", tenant_id)
-        else:
-            self.emit_metric("RunSucceeded", 0, "Count", tenant_id)
-            self.emit_metric("RunFailed", 1, "Count", tenant_id)
-        self.emit_metric("RunDurationSeconds", duration_seconds, "Seconds", tenant_id)
-        self.emit_metric("RowsProcessed", rows_processed, "Count", tenant_id)
-
-    def emit_worker_heartbeat(self) -> None:
-        self.emit_metric("WorkerHeartbeat", 1, "Count", "worker")
+        self.idle_backoff_max_seconds = float(os.getenv("WORKER_IDLE_BACKOFF_MAX_SECONDS", "30"))
+        self._sku_map_cache: LruCache[str, tuple[str | None, bytes]] = LruCache(SKU_MAP_CACHE_SIZE)
+        self._tenant_config_cache: LruCache[tuple[str, int], TenantConfig] = LruCache(TENANT_CONFIG_CACHE_SIZE)
+        self._delete_batcher: SqsDeleteBatcher | None = None
+        self._delete_batcher_lock = threading.Lock()
+        self._visibility_heartbeat: SqsVisibilityHeartbeat | None = None
+        self._visibility_heartbeat_lock = threading.Lock()
 
     def _stage_index(self, stage: str) -> int:
-        stages = ["QUEUE", "FETCH_INPUTS", "NORMALIZE", "MERGE_PRICE", "WRITE_OUTPUTS", "COMPLETE"]
-        return stages.index(stage)
+        return STAGE_INDEX[stage]
 
-    def _coerce_stage(self, run_id: str, stage: str | None) -> str | None:
-        if not stage or not hasattr(self.runs, "get"):
-            return stage
-        record = self.runs.get(run_id)
+    def _coerce_stage(self, record: object, stage: str | None) -> str | None:
         current = getattr(record, "stage", None) if record else None
-        if not current:
+        if not stage or not current:
             return stage
         if self._stage_index(stage) < self._stage_index(current):
             return current
         return stage
 
-    def _update_run_status(self, run_id: str, status: str, **kwargs: object) -> None:
+    def _update_run_status(
+        self,
+        run_id: str,
+        status: str,
+        *,
+        current: RunRecord | None = None,
+        **kwargs: object,
+    ) -> RunRecord | None:
         stage = kwargs.get("stage")
         if stage:
-            kwargs["stage"] = self._coerce_stage(run_id, stage)
-        if "started_at" in kwargs and hasattr(self.runs, "get"):
-            record = self.runs.get(run_id)
-            if record and getattr(record, "started_at", None):
-                kwargs.pop("started_at")
+            kwargs["stage"] = self._coerce_stage(current, stage)
+        if "started_at" in kwargs and current and current.started_at:
+            kwargs.pop("started_at")
+        if current and status == current.status and kwargs.keys() <= {"stage"} and kwargs.get("stage") == current.stage:
+            return current
         self.runs.update_status(run_id, status, **kwargs)
+        if current is None:
+            return None
+        changes = {field: value for field, value in kwargs.items() if field in RUN_RECORD_FIELDS}
+        changes.update(dict.fromkeys(kwargs.get("clear_fields") or (), None))
+        return replace(current, status=status, **changes)
 
     def _run_prefix(self, *, run_id: str, tenant_id: str) -> str:
         return f"{run_id}/tenants/{tenant_id}"
@@ -135,7 +134,7 @@ class Worker:
         errors_key = f"{self._run_prefix(run_id=run_id, tenant_id=tenant_id)}/reports/errors.json"
         self._ensure_run_prefix(run_id=run_id, key=errors_key)
         try:
-            self.s3.upload_text(errors_key, json.dumps(errors, default=str))
+            self.s3.upload_bytes(errors_key, write_json_bytes(errors), content_type=JSON_CONTENT_TYPE)
         except (BotoCoreError, ClientError) as exc:
             raise RetryableError(str(exc)) from exc
         return errors_key
@@ -150,11 +149,12 @@ class Worker:
         error_message: str,
         artifacts: Dict[str, str],
         errors_key: str | None,
-        start_time: datetime | None,
+        start_timer: float | None,
         rows_processed: int | None,
+        current: RunRecord | None = None,
     ) -> None:
         duration_seconds = (
-            (datetime.utcnow() - start_time).total_seconds() if start_time else 0.0
+            time.perf_counter() - start_timer if start_timer is not None else 0.0
         )
         if not errors_key:
             errors_key = self._write_error_report(
@@ -166,6 +166,7 @@ class Worker:
         self._update_run_status(
             job.run_id,
             status,
+            current=current,
             stage=stage,
             finished_at=datetime.utcnow(),
             failed_stage=stage,
@@ -175,7 +176,7 @@ class Worker:
             error_report_key=errors_key,
             artifacts=artifacts,
         )
-        self.emit_run_metrics(
+        self.metrics.record_run_metrics(
             tenant_id=job.tenant_id,
             succeeded=False,
             duration_seconds=duration_seconds,
@@ -190,39 +191,130 @@ class Worker:
             return record.run_id
         return None
 
-    def _start_visibility_heartbeat(self, receipt_handle: str) -> tuple[threading.Event, threading.Thread] | None:
+    def _start_visibility_heartbeat(self, receipt_handle: str) -> bool:
         if not self.queue or self.visibility_timeout_seconds <= 0:
-            return None
+            return False
         try:
             self.queue.change_visibility(receipt_handle, self.visibility_timeout_seconds)
         except (BotoCoreError, ClientError) as exc:
             log_event(self.logger, "queue_visibility_error", error=str(exc))
-        if self.visibility_heartbeat_seconds <= 0:
-            return None
-        stop_event = threading.Event()
+        if self.visibility_heartbeat_seconds <= 0 or not hasattr(self.queue, "change_visibility_batch"):
+            return False
+        with self._visibility_heartbeat_lock:
+            if self._visibility_heartbeat is None:
+                self._visibility_heartbeat = SqsVisibilityHeartbeat(
+                    self.queue,
+                    interval_seconds=self.visibility_heartbeat_seconds,
+                    timeout_seconds=self.visibility_timeout_seconds,
+                    on_error=self._on_visibility_error,
+                )
+        self._visibility_heartbeat.register(receipt_handle)
+        return True
 
-        def _heartbeat() -> None:
-            while not stop_event.wait(self.visibility_heartbeat_seconds):
-                try:
-                    self.queue.change_visibility(receipt_handle, self.visibility_timeout_seconds)
-                except (BotoCoreError, ClientError) as exc:
-                    log_event(self.logger, "queue_visibility_error", error=str(exc))
+    def _on_visibility_error(self, exc: Exception) -> None:
+        log_event(self.logger, "queue_visibility_error", error=str(exc))
 
-        thread = threading.Thread(target=_heartbeat, daemon=True)
-        thread.start()
-        return stop_event, thread
+    def _run_uploads(self, uploads: List[Callable[[], None]]) -> None:
+        if not uploads:
+            return
+        workers = max(1, min(MAX_UPLOAD_WORKERS, len(uploads)))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(upload) for upload in uploads]
+        try:
+            for future in futures:
+                future.result()
+        except (BotoCoreError, ClientError) as exc:
+            raise RetryableError(str(exc)) from exc
 
-    def run_job(self, job: RunJob) -> None:
+    def _get_tenant_config(self, tenant_id: str, config_version: int) -> TenantConfig | None:
+        cache_key = (tenant_id, config_version)
+        cached = self._tenant_config_cache.get(cache_key)
+        if cached is not None:
+            return cached
+        tenant_record = self.tenants.get(tenant_id, config_version)
+        if not tenant_record:
+            return None
+        config = TenantConfig.model_validate(tenant_record.config)
+        self._tenant_config_cache.put(cache_key, config)
+        return config
+
+    def _download_sku_map(self, key: str) -> bytes:
+        cached = self._sku_map_cache.get(key)
+        sku_bytes, etag = self.s3.download_bytes_if_changed(key, cached[0] if cached else None)
+        if sku_bytes is None and cached is not None:
+            return cached[1]
+        self._sku_map_cache.put(key, (etag, sku_bytes))
+        return sku_bytes
+
+    def _ingest_vendor(
+        self,
+        *,
+        job: RunJob,
+        tenant_id: str,
+        vendor: VendorConfig,
+        latest: S3Location | None,
+    ) -> tuple[dict, Dict[str, bytes], Dict[str, str]]:
+        prefix = vendor.inbound.s3_prefix or ""
+        if not latest:
+            missing = {
+                "status": "missing",
+                "s3_prefix": prefix,
+                "required": vendor.required,
+                "expected_prefix": prefix,
+                "reason": "no_objects_found",
+            }
+            return missing, {}, {}
+        latest_entry = {
+            "status": "found",
+            "s3_prefix": prefix,
+            "required": vendor.required,
+            "expected_prefix": prefix,
+            "s3_key": latest.key,
+            "etag": latest.etag,
+            "size": latest.size,
+            "last_modified": latest.last_modified.isoformat() if latest.last_modified else None,
+            "selection": "latest_by_last_modified",
+        }
+        inputs: Dict[str, bytes] = {}
+        try:
+            raw_bytes = self.s3.download_bytes(latest.key)
+        except (BotoCoreError, ClientError) as exc:
+            raise RetryableError(str(exc)) from exc
+        inputs[vendor.vendor_id] = raw_bytes
+        inbound_copy_key = self._inbound_copy_key(
+            run_id=job.run_id,
+            tenant_id=tenant_id,
+            vendor_id=vendor.vendor_id,
+            source_key=latest.key,
+        )
+        self._ensure_run_prefix(run_id=job.run_id, key=inbound_copy_key)
+        try:
+            self.s3.copy_key(latest.key, inbound_copy_key, if_match=latest.etag)
+        except ClientError as exc:
+            if exc.response.get("Error", {}).get("Code") in PRECONDITION_FAILED_CODES:
+                raise RetryableError(f"Inbound file {latest.key} changed during ingest") from exc
+            raise RetryableError(str(exc)) from exc
+        except BotoCoreError as exc:
+            raise RetryableError(str(exc)) from exc
+        latest_entry["run_copy_key"] = inbound_copy_key
+        return latest_entry, inputs, {f"inbound_{vendor.vendor_id}": inbound_copy_key}
+
+    def run_job(self, job: RunJob, record: RunRecord | None = None) -> None:
         log_event(self.logger, "run_started", run_id=job.run_id, tenant_id=job.tenant_id)
         start_time = datetime.utcnow()
-        self._update_run_status(
-            job.run_id,
-            "RUNNING",
-            started_at=datetime.utcnow(),
-            stage="FETCH_INPUTS",
-        )
-        tenant_record = self.tenants.get(job.tenant_id, job.config_version)
-        if not tenant_record:
+        start_timer = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=1) as status_executor:
+            started = status_executor.submit(
+                self._update_run_status,
+                job.run_id,
+                "RUNNING",
+                current=record,
+                started_at=start_time,
+                stage="FETCH_INPUTS",
+            )
+            config = self._get_tenant_config(job.tenant_id, job.config_version)
+            current = started.result()
+        if config is None:
             self._fail_run(
                 job=job,
                 status="FAILED",
@@ -231,11 +323,11 @@ class Worker:
                 error_message="missing tenant config",
                 artifacts={},
                 errors_key=None,
-                start_time=start_time,
+                start_timer=start_timer,
                 rows_processed=0,
+                current=current,
             )
             raise NonRetryableError("missing tenant config")
-        config = TenantConfig.model_validate(tenant_record.config)
         artifacts: Dict[str, str] = {}
         warnings: List[str] = []
         missing_vendor_errors: List[Dict[str, str]] = []
@@ -250,7 +342,7 @@ class Worker:
             "run_id": job.run_id,
             "tenant_id": job.tenant_id,
             "config_version": job.config_version,
-            "tenant_config": config.model_dump(),
+            "tenant_config": config.model_dump(mode="json"),
         }
         try:
             self.s3.upload_text(config_snapshot_key, json.dumps(config_snapshot))
@@ -260,73 +352,59 @@ class Worker:
 
         vendor_inputs: Dict[str, bytes] = {}
         vendor_latest: Dict[str, dict] = {}
-        ingest_start = datetime.utcnow()
-        for vendor in config.vendors:
-            prefix = vendor.inbound.s3_prefix or ""
-            try:
-                latest = self.s3.list_latest(prefix)
-            except (BotoCoreError, ClientError) as exc:
-                raise RetryableError(str(exc)) from exc
-            if not latest:
-                vendor_latest[vendor.vendor_id] = {
-                    "status": "missing",
-                    "s3_prefix": prefix,
-                    "required": vendor.required,
-                    "expected_prefix": prefix,
-                    "reason": "no_objects_found",
-                }
-                continue
-            vendor_latest[vendor.vendor_id] = {
-                "status": "found",
-                "s3_prefix": prefix,
-                "required": vendor.required,
-                "expected_prefix": prefix,
-                "s3_key": latest.key,
-                "etag": latest.etag,
-                "size": latest.size,
-                "last_modified": latest.last_modified.isoformat() if latest.last_modified else None,
-                "selection": "latest_by_last_modified",
-            }
-            try:
-                raw_bytes = self.s3.download_bytes(latest.key)
-            except (BotoCoreError, ClientError) as exc:
-                raise RetryableError(str(exc)) from exc
-            vendor_inputs[vendor.vendor_id] = raw_bytes
-            inbound_copy_key = self._inbound_copy_key(
-                run_id=job.run_id,
-                tenant_id=config.tenant_id,
-                vendor_id=vendor.vendor_id,
-                source_key=latest.key,
+        missing_required = []
+        missing_optional = []
+        ingest_start = time.perf_counter()
+        try:
+            latest_by_prefix = self.s3.list_latest_multi(
+                vendor.inbound.s3_prefix or "" for vendor in config.vendors
             )
-            self._ensure_run_prefix(run_id=job.run_id, key=inbound_copy_key)
+        except (BotoCoreError, ClientError) as exc:
+            raise RetryableError(str(exc)) from exc
+        sku_map_keys = {
+            sku_map_input_key(vendor.vendor_id): vendor.sku_map.s3_key
+            for vendor in config.vendors
+            if vendor.sku_map
+            and vendor.sku_map.s3_key
+            and latest_by_prefix.get(vendor.inbound.s3_prefix or "")
+        }
+        workers = max(1, min(MAX_INGEST_WORKERS, len(config.vendors) + len(sku_map_keys)))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            ingest_futures = [
+                executor.submit(
+                    self._ingest_vendor,
+                    job=job,
+                    tenant_id=config.tenant_id,
+                    vendor=vendor,
+                    latest=latest_by_prefix.get(vendor.inbound.s3_prefix or ""),
+                )
+                for vendor in config.vendors
+            ]
+            sku_map_futures = {
+                input_key: executor.submit(self._download_sku_map, s3_key)
+                for input_key, s3_key in sku_map_keys.items()
+            }
+            for vendor, future in zip(config.vendors, ingest_futures):
+                latest_entry, inputs, vendor_artifacts = future.result()
+                vendor_latest[vendor.vendor_id] = latest_entry
+                if not inputs:
+                    vendor_missing = {
+                        "vendor_id": vendor.vendor_id,
+                        "expected_prefix": vendor.inbound.s3_prefix or "",
+                        "required": vendor.required,
+                    }
+                    if vendor.required:
+                        missing_required.append(vendor_missing)
+                    else:
+                        missing_optional.append(vendor_missing)
+                vendor_inputs.update(inputs)
+                artifacts.update(vendor_artifacts)
             try:
-                self.s3.upload_bytes(inbound_copy_key, raw_bytes)
+                for input_key, future in sku_map_futures.items():
+                    vendor_inputs[input_key] = future.result()
             except (BotoCoreError, ClientError) as exc:
                 raise RetryableError(str(exc)) from exc
-            vendor_latest[vendor.vendor_id]["run_copy_key"] = inbound_copy_key
-            artifacts[f"inbound_{vendor.vendor_id}"] = inbound_copy_key
-            if vendor.sku_map and vendor.sku_map.s3_key:
-                try:
-                    sku_bytes = self.s3.download_bytes(vendor.sku_map.s3_key)
-                except (BotoCoreError, ClientError) as exc:
-                    raise RetryableError(str(exc)) from exc
-                vendor_inputs[sku_map_input_key(vendor.vendor_id)] = sku_bytes
-        stage_times["ingest_seconds"] = (datetime.utcnow() - ingest_start).total_seconds()
-
-        missing_required = []
-        missing_optional = []
-        for vendor in config.vendors:
-            if vendor.vendor_id in vendor_inputs:
-                continue
-            vendor_missing = {
-                "vendor_id": vendor.vendor_id,
-                "expected_prefix": vendor.inbound.s3_prefix or "",
-                "required": vendor.required,
-            }
-            if vendor.required:
-                missing_required.append(vendor_missing)
-            else:
-                missing_optional.append(vendor_missing)
+        stage_times["ingest_seconds"] = time.perf_counter() - ingest_start
 
         if missing_required and error_policy.missing_required_vendor_policy != "warn_only":
             expected = ", ".join(
@@ -341,8 +419,9 @@ class Worker:
                 error_message=error_message,
                 artifacts=artifacts,
                 errors_key=None,
-                start_time=start_time,
+                start_timer=start_timer,
                 rows_processed=0,
+                current=current,
             )
             raise NonRetryableError(error_message)
 
@@ -385,7 +464,11 @@ class Worker:
             "vendors": vendor_latest,
         }
         try:
-            self.s3.upload_text(input_manifest_key, json.dumps(input_manifest))
+            self.s3.upload_bytes(
+                input_manifest_key,
+                write_json_bytes(input_manifest),
+                content_type=JSON_CONTENT_TYPE,
+            )
         except (BotoCoreError, ClientError) as exc:
             raise RetryableError(str(exc)) from exc
         artifacts["input_manifest"] = input_manifest_key
@@ -400,13 +483,14 @@ class Worker:
                 error_message=error_message,
                 artifacts=artifacts,
                 errors_key=None,
-                start_time=start_time,
+                start_timer=start_timer,
                 rows_processed=0,
+                current=current,
             )
             raise NonRetryableError(error_message)
 
         engine_start = datetime.utcnow()
-        self._update_run_status(job.run_id, "RUNNING", stage="NORMALIZE")
+        engine_timer = time.perf_counter()
         try:
             engine_result = run_inventory_sync(
                 vendor_inputs=vendor_inputs,
@@ -424,8 +508,9 @@ class Worker:
                 error_message=error_message,
                 artifacts=artifacts,
                 errors_key=None,
-                start_time=start_time,
+                start_timer=start_timer,
                 rows_processed=0,
+                current=current,
             )
             raise NonRetryableError(error_message) from exc
         except MissingRequiredColumnsError as exc:
@@ -438,8 +523,9 @@ class Worker:
                 error_message=error_message,
                 artifacts=artifacts,
                 errors_key=None,
-                start_time=start_time,
+                start_timer=start_timer,
                 rows_processed=0,
+                current=current,
             )
             raise NonRetryableError(error_message) from exc
         except ValueError as exc:
@@ -452,53 +538,53 @@ class Worker:
                 error_message=error_message,
                 artifacts=artifacts,
                 errors_key=None,
-                start_time=start_time,
+                start_timer=start_timer,
                 rows_processed=0,
+                current=current,
             )
             raise NonRetryableError(error_message) from exc
-        stage_times["engine_seconds"] = (datetime.utcnow() - engine_start).total_seconds()
-        self._update_run_status(job.run_id, "RUNNING", stage="MERGE_PRICE")
+        stage_times["engine_seconds"] = time.perf_counter() - engine_timer
 
         errors = engine_result.errors
         vendor_counts = engine_result.summary["vendor_record_counts"]
         total_rows = engine_result.summary["total_rows"]
 
+        uploads: List[Callable[[], None]] = []
+        skip_normalized = {
+            vendor.vendor_id for vendor in config.vendors if not vendor.inbound.emit_normalized_artifact
+        }
         for vendor_id, normalized_rows in engine_result.normalized_by_vendor.items():
-            if vendor_id not in vendor_inputs:
+            if vendor_id not in vendor_inputs or vendor_id in skip_normalized:
                 continue
             normalized_key = (
                 f"{run_prefix}/normalized/{vendor_id}/normalized.csv"
             )
             self._ensure_run_prefix(run_id=job.run_id, key=normalized_key)
-            normalized_bytes = write_csv_bytes(
+            normalized_chunks = iter_csv_chunks(
                 normalized_rows,
                 CANONICAL_COLUMNS,
                 extrasaction="raise",
             )
-            try:
-                self.s3.upload_bytes(normalized_key, normalized_bytes)
-            except (BotoCoreError, ClientError) as exc:
-                raise RetryableError(str(exc)) from exc
+            uploads.append(partial(self.s3.upload_gzip_stream, normalized_key, normalized_chunks))
             artifacts[f"normalized_{vendor_id}"] = normalized_key
 
         error_key = None
-        error_entries = list(missing_vendor_errors)
-        if errors:
-            error_entries.extend([error.__dict__ for error in errors])
-        if error_entries:
+        invalid_rows = engine_result.summary["invalid_rows"]
+        if missing_vendor_errors or invalid_rows:
             error_key = f"{reports_prefix}/errors.json"
             self._ensure_run_prefix(run_id=job.run_id, key=error_key)
-            try:
-                self.s3.upload_text(
+            uploads.append(
+                partial(
+                    self.s3.upload_stream,
                     error_key,
-                    json.dumps(error_entries, default=str),
+                    iter_json_array_chunks(chain(missing_vendor_errors, errors)),
+                    content_type=JSON_CONTENT_TYPE,
                 )
-            except (BotoCoreError, ClientError) as exc:
-                raise RetryableError(str(exc)) from exc
+            )
             artifacts["errors"] = error_key
 
-        invalid_rows = len(errors)
         if total_rows == 0 and not missing_vendor_errors:
+            self._run_uploads(uploads)
             self._fail_run(
                 job=job,
                 status="FAILED",
@@ -507,8 +593,9 @@ class Worker:
                 error_message="no rows parsed",
                 artifacts=artifacts,
                 errors_key=error_key,
-                start_time=start_time,
+                start_timer=start_timer,
                 rows_processed=total_rows,
+                current=current,
             )
             log_event(
                 self.logger,
@@ -520,8 +607,9 @@ class Worker:
             raise NonRetryableError("no rows parsed")
 
         exceeds_row_count = invalid_rows > error_policy.max_invalid_rows
-        exceeds_row_pct = (invalid_rows / total_rows) > error_policy.max_invalid_row_pct
+        exceeds_row_pct = bool(total_rows) and (invalid_rows / total_rows) > error_policy.max_invalid_row_pct
         if invalid_rows and (exceeds_row_count or exceeds_row_pct):
+            self._run_uploads(uploads)
             self._fail_run(
                 job=job,
                 status="FAILED",
@@ -530,8 +618,9 @@ class Worker:
                 error_message="validation errors",
                 artifacts=artifacts,
                 errors_key=error_key,
-                start_time=start_time,
+                start_timer=start_timer,
                 rows_processed=total_rows,
+                current=current,
             )
             log_event(
                 self.logger,
@@ -547,27 +636,27 @@ class Worker:
                 "invalid_rows_within_threshold"
             )
 
-        output_start = datetime.utcnow()
-        self._update_run_status(job.run_id, "RUNNING", stage="WRITE_OUTPUTS")
+        output_start = time.perf_counter()
         output_key = f"{run_prefix}/outputs/merged_inventory.csv"
         self._ensure_run_prefix(run_id=job.run_id, key=output_key)
         output_columns = config.output.columns or CANONICAL_COLUMNS
-        output_bytes = write_csv_bytes(
+        output_chunks = iter_csv_chunks(
             engine_result.merged_rows,
             output_columns,
             extrasaction="ignore",
         )
-        try:
-            self.s3.upload_bytes(output_key, output_bytes)
-        except (BotoCoreError, ClientError) as exc:
-            raise RetryableError(str(exc)) from exc
+        if config.output.compression == "gzip":
+            uploads.append(partial(self.s3.upload_gzip_stream, output_key, output_chunks))
+        else:
+            uploads.append(partial(self.s3.upload_stream, output_key, output_chunks))
+        self._run_uploads(uploads)
         artifacts["merged_inventory"] = output_key
-        stage_times["output_seconds"] = (datetime.utcnow() - output_start).total_seconds()
+        stage_times["output_seconds"] = time.perf_counter() - output_start
 
         summary_key = f"{reports_prefix}/run_summary.json"
         self._ensure_run_prefix(run_id=job.run_id, key=summary_key)
         completed_at = datetime.utcnow()
-        duration_seconds = (completed_at - start_time).total_seconds()
+        duration_seconds = time.perf_counter() - start_timer
         summary_data = engine_result.summary
         summary = {
             "run_id": job.run_id,
@@ -581,34 +670,38 @@ class Worker:
             "warnings": warnings,
             "duration_seconds": duration_seconds,
             "stage_times": stage_times,
-            "completed_at": completed_at.isoformat(),
+            "completed_at": completed_at,
         }
         try:
-            self.s3.upload_text(summary_key, json.dumps(summary))
+            self.s3.upload_bytes(summary_key, write_json_bytes(summary), content_type=JSON_CONTENT_TYPE)
         except (BotoCoreError, ClientError) as exc:
             raise RetryableError(str(exc)) from exc
         artifacts["run_summary"] = summary_key
 
-        self._update_run_status(
-            job.run_id,
-            "SUCCEEDED",
-            stage="COMPLETE",
-            finished_at=datetime.utcnow(),
-            artifacts=artifacts,
-            clear_fields=[
-                "failed_stage",
-                "error_code",
-                "error_message",
-                "errors_artifact_key",
-                "error_report_key",
-            ],
-        )
-        self.emit_run_metrics(
-            tenant_id=job.tenant_id,
-            succeeded=True,
-            duration_seconds=duration_seconds,
-            rows_processed=total_rows,
-        )
+        with ThreadPoolExecutor(max_workers=1) as metrics_executor:
+            metrics_future = metrics_executor.submit(
+                self.metrics.record_run_metrics,
+                tenant_id=job.tenant_id,
+                succeeded=True,
+                duration_seconds=duration_seconds,
+                rows_processed=total_rows,
+            )
+            self._update_run_status(
+                job.run_id,
+                "SUCCEEDED",
+                current=current,
+                stage="COMPLETE",
+                finished_at=completed_at,
+                artifacts=artifacts,
+                clear_fields=[
+                    "failed_stage",
+                    "error_code",
+                    "error_message",
+                    "errors_artifact_key",
+                    "error_report_key",
+                ],
+            )
+            metrics_future.result()
         log_event(
             self.logger,
             "run_succeeded",
@@ -620,7 +713,18 @@ class Worker:
     def _process_message(self, message: SqsMessage) -> None:
         if not self.queue:
             raise RuntimeError("Queue URL not configured")
-        job = RunJob.model_validate(message.body)
+        try:
+            job = RunJob.model_validate_json(message.raw_body)
+        except ValidationError as exc:
+            self.metrics.record_worker_error(error_type="invalid_job_message")
+            log_event(
+                self.logger,
+                "invalid_job_message",
+                error=str(exc),
+                receive_count=message.receive_count,
+            )
+            self._delete_message(message.receipt_handle)
+            return
         record = self.runs.get(job.run_id) if hasattr(self.runs, "get") else None
         if record and record.status in {"RUNNING", "SUCCEEDED"}:
             log_event(
@@ -630,11 +734,7 @@ class Worker:
                 tenant_id=job.tenant_id,
                 status=record.status,
             )
-            try:
-                self.queue.delete(message.receipt_handle)
-            except (BotoCoreError, ClientError) as delete_exc:
-                self.metrics.record_worker_error(error_type="queue_delete_error")
-                log_event(self.logger, "queue_delete_error", error=str(delete_exc))
+            self._delete_message(message.receipt_handle)
             return
         if record and record.status == "FAILED" and record.error_code == "POISON_JOB":
             log_event(
@@ -655,7 +755,7 @@ class Worker:
                 error_message="Job moved to DLQ after repeated failures",
                 artifacts=record.artifacts if record and record.artifacts else {},
                 errors_key=getattr(record, "errors_artifact_key", None),
-                start_time=None,
+                start_timer=None,
                 rows_processed=0,
             )
             self.metrics.record_worker_error(error_type="poison_job")
@@ -690,21 +790,13 @@ class Worker:
                 tenant_id=job.tenant_id,
                 status=record.status,
             )
-            try:
-                self.queue.delete(message.receipt_handle)
-            except (BotoCoreError, ClientError) as delete_exc:
-                self.metrics.record_worker_error(error_type="queue_delete_error")
-                log_event(self.logger, "queue_delete_error", error=str(delete_exc))
+            self._delete_message(message.receipt_handle)
             return
         heartbeat = self._start_visibility_heartbeat(message.receipt_handle)
         try:
-            self.run_job(job)
+            self.run_job(job, record)
         except NonRetryableError as exc:
-            try:
-                self.queue.delete(message.receipt_handle)
-            except (BotoCoreError, ClientError) as delete_exc:
-                self.metrics.record_worker_error(error_type="queue_delete_error")
-                log_event(self.logger, "queue_delete_error", error=str(delete_exc))
+            self._delete_message(message.receipt_handle)
             self._update_run_status(
                 job.run_id,
                 "FAILED",
@@ -727,41 +819,132 @@ class Worker:
                 tenant_id=job.tenant_id,
                 error=str(exc),
             )
+        else:
+            self._delete_message(message.receipt_handle)
         finally:
             if heartbeat:
-                stop_event, thread = heartbeat
-                stop_event.set()
-                thread.join(timeout=2)
-        else:
-            try:
-                self.queue.delete(message.receipt_handle)
-            except (BotoCoreError, ClientError) as delete_exc:
-                self.metrics.record_worker_error(error_type="queue_delete_error")
-                log_event(self.logger, "queue_delete_error", error=str(delete_exc))
+                self._visibility_heartbeat.unregister(message.receipt_handle)
+
+    def _delete_message(self, receipt_handle: str) -> None:
+        if hasattr(self.queue, "delete_batch"):
+            with self._delete_batcher_lock:
+                if self._delete_batcher is None:
+                    self._delete_batcher = SqsDeleteBatcher(self.queue, self._on_delete_error)
+            self._delete_batcher.submit(receipt_handle)
+            return
+        try:
+            self.queue.delete(receipt_handle)
+        except (BotoCoreError, ClientError) as exc:
+            self._on_delete_error(exc)
+
+    def _on_delete_error(self, exc: Exception) -> None:
+        self.metrics.record_worker_error(error_type="queue_delete_error")
+        log_event(self.logger, "queue_delete_error", error=str(exc))
+
+    def _idle_backoff_seconds(self, idle_polls: int) -> float:
+        if idle_polls <= 1:
+            return 0.0
+        return min(self.idle_backoff_max_seconds, float(2 ** (idle_polls - 2)))
+
+    def _receive_error_backoff_seconds(self, receive_errors: int) -> float:
+        base = min(RECEIVE_ERROR_BACKOFF_MAX_SECONDS, float(2 ** (receive_errors - 1)))
+        return min(RECEIVE_ERROR_BACKOFF_MAX_SECONDS, base + random.uniform(0, base))
+
+    def _job_executor(self, worker_concurrency: int) -> Executor:
+        executor_kind = os.getenv("WORKER_EXECUTOR", "thread").lower()
+        if executor_kind not in WORKER_EXECUTORS:
+            raise RuntimeError(f"Unsupported WORKER_EXECUTOR: {executor_kind}")
+        if executor_kind == "process":
+            return ProcessPoolExecutor(
+                max_workers=worker_concurrency,
+                mp_context=multiprocessing.get_context("spawn"),
+                initializer=_init_process_worker,
+                initargs=(self.bucket, self.runs_table, self.tenants_table, self.queue_url),
+            )
+        return ThreadPoolExecutor(max_workers=worker_concurrency)
 
     def run_forever(self) -> None:
         if not self.queue:
             raise RuntimeError("Queue URL not configured")
         worker_concurrency = max(1, int(os.getenv("WORKER_MAX_CONCURRENCY", "1")))
-        with ThreadPoolExecutor(max_workers=worker_concurrency) as executor:
-            futures = set()
-            while True:
-                self.emit_worker_heartbeat()
-                completed = {future for future in futures if future.done()}
-                if completed:
-                    for future in completed:
-                        future.result()
-                    futures -= completed
-                if len(futures) >= worker_concurrency:
-                    done, futures = wait(futures, return_when=FIRST_COMPLETED)
-                    for future in done:
-                        future.result()
-                try:
-                    message = self.queue.receive()
-                except (BotoCoreError, ClientError) as exc:
-                    self.metrics.record_worker_error(error_type="queue_receive_error")
-                    log_event(self.logger, "queue_receive_error", error=str(exc))
-                    continue
-                if not message:
-                    continue
-                futures.add(executor.submit(self._process_message, message))
+        slots = threading.BoundedSemaphore(worker_concurrency)
+        try:
+            with self._job_executor(worker_concurrency) as executor:
+                idle_polls = 0
+                receive_errors = 0
+                while True:
+                    self.metrics.record_worker_heartbeat()
+                    free_slots = self._acquire_free_slots(slots)
+                    try:
+                        messages = self.queue.receive_batch(max_messages=free_slots)
+                    except (BotoCoreError, ClientError) as exc:
+                        self._release_slots(slots, free_slots)
+                        receive_errors += 1
+                        self.metrics.record_worker_error(error_type="queue_receive_error")
+                        log_event(self.logger, "queue_receive_error", error=str(exc), attempt=receive_errors)
+                        time.sleep(self._receive_error_backoff_seconds(receive_errors))
+                        continue
+                    receive_errors = 0
+                    self._release_slots(slots, free_slots - len(messages))
+                    if not messages:
+                        idle_polls += 1
+                        time.sleep(self._idle_backoff_seconds(idle_polls))
+                        continue
+                    idle_polls = 0
+                    for message in messages:
+                        if isinstance(executor, ProcessPoolExecutor):
+                            future = executor.submit(_process_message_in_subprocess, message)
+                        else:
+                            future = executor.submit(self._process_message, message)
+                        future.add_done_callback(partial(self._job_done, slots))
+        finally:
+            self.close()
+
+    def close(self) -> None:
+        if self._visibility_heartbeat is not None:
+            self._visibility_heartbeat.close()
+        if self._delete_batcher is not None:
+            self._delete_batcher.close()
+        self.metrics.flush()
+
+    @staticmethod
+    def _acquire_free_slots(slots: threading.BoundedSemaphore) -> int:
+        slots.acquire()
+        free_slots = 1
+        while free_slots < RECEIVE_BATCH_MAX and slots.acquire(blocking=False):
+            free_slots += 1
+        return free_slots
+
+    @staticmethod
+    def _release_slots(slots: threading.BoundedSemaphore, count: int) -> None:
+        for _ in range(count):
+            slots.release()
+
+    def _job_done(self, slots: threading.BoundedSemaphore, future: Future) -> None:
+        slots.release()
+        exc = future.exception()
+        if exc is not None:
+            self.metrics.record_worker_error(error_type="job_unhandled_error")
+            log_event(self.logger, "job_unhandled_error", error=str(exc))
+
+
+def _init_process_worker(
+    bucket: str,
+    runs_table: str,
+    tenants_table: str,
+    queue_url: str | None,
+) -> None:
+    global _PROCESS_WORKER
+    _PROCESS_WORKER = Worker(
+        bucket=bucket,
+        runs_table=runs_table,
+        tenants_table=tenants_table,
+        queue_url=queue_url,
+    )
+    multiprocessing.util.Finalize(_PROCESS_WORKER, _PROCESS_WORKER.close, exitpriority=10)
+
+
+def _process_message_in_subprocess(message: SqsMessage) -> None:
+    if _PROCESS_WORKER is None:
+        raise RuntimeError("Process worker not initialized")
+    _PROCESS_WORKER._process_message(message)
@@ -0,0 +1,41 @@
+from __future__ import annotations
+
+import threading
+from typing import TYPE_CHECKING, Optional
+
+from botocore.config import Config
+
+if TYPE_CHECKING:
+    import boto3
+
+AWS_CLIENT_CONFIG = Config(
+    max_pool_connections=50,
+    retries={"max_attempts": 3, "mode": "adaptive"},
+    connect_timeout=5,
+    tcp_keepalive=True,
+)
+
+_SESSION: Optional["boto3.session.Session"] = None
+_SESSION_LOCK = threading.Lock()
+
+
+def aws_session() -> boto3.session.Session:
+    global _SESSION
+    with _SESSION_LOCK:
+        if _SESSION is None:
+            import boto3
+
+            _SESSION = boto3.session.Session()
+        return _SESSION
+
+
+def aws_client(service_name: str):
+    session = aws_session()
+    with _SESSION_LOCK:
+        return session.client(service_name, config=AWS_CLIENT_CONFIG)
+
+
+def aws_resource(service_name: str):
+    session = aws_session()
+    with _SESSION_LOCK:
+        return session.resource(service_name, config=AWS_CLIENT_CONFIG)
@@ -1,10 +1,11 @@
 from __future__ import annotations
 
-import json
 import logging
 from datetime import datetime
 from typing import Any, Dict
 
+import orjson
+
 
 def get_logger(name: str) -> logging.Logger:
     logger = logging.getLogger(name)
@@ -18,6 +19,6 @@ def get_logger(name: str) -> logging.Logger:
 
 
 def log_event(logger: logging.Logger, event: str, **fields: Any) -> None:
-    payload: Dict[str, Any] = {"event": event, "timestamp": datetime.utcnow().isoformat()}
+    payload: Dict[str, Any] = {"event": event, "timestamp": datetime.utcnow()}
     payload.update(fields)
-    logger.info(json.dumps(payload))
+    logger.info(orjson.dumps(payload, default=str, option=orjson.OPT_NON_STR_KEYS).decode("utf-8"))
@@ -1,35 +1,106 @@
 from __future__ import annotations
 
+import atexit
 import os
-from dataclasses import dataclass
-from typing import Iterable, Optional
+import threading
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional
 
-import boto3
 from botocore.exceptions import BotoCoreError, ClientError
 
+from relay_inventory.util.aws import aws_client
 from relay_inventory.util.logging import get_logger
 
+PUT_METRIC_DATA_MAX = 20
+DEFAULT_FLUSH_INTERVAL_SECONDS = 10.0
 
-@dataclass(frozen=True)
-class MetricDimension:
+
+class MetricDimension(NamedTuple):
     name: str
     value: str
 
 
+@lru_cache(maxsize=512)
+def _dimension_payload(*pairs: tuple[str, str]) -> List[Dict[str, str]]:
+    return [{"Name": name, "Value": value} for name, value in pairs]
+
+
+@lru_cache(maxsize=1024)
+def _metric_payload(name: str, value: float, unit: str, *pairs: tuple[str, str]) -> Dict[str, Any]:
+    return {"MetricName": name, "Value": value, "Unit": unit, "Dimensions": _dimension_payload(*pairs)}
+
+
+def _noop(**_: Any) -> None:
+    return None
+
+
 class CloudWatchMetrics:
-    def __init__(self, *, namespace: str, enabled: bool, environment: str) -> None:
+    def __init__(
+        self,
+        *,
+        namespace: str,
+        enabled: bool,
+        environment: str,
+        flush_interval_seconds: float = DEFAULT_FLUSH_INTERVAL_SECONDS,
+    ) -> None:
         self.namespace = namespace
         self.enabled = enabled
         self.environment = environment
-        self.client = boto3.client("cloudwatch") if enabled else None
+        self.client = aws_client("cloudwatch") if enabled else None
         self.logger = get_logger(self.__class__.__name__)
+        self._buffer: List[Dict[str, Any]] = []
+        self._lock = threading.Lock()
+        if not self.enabled:
+            self.record_run_failure = _noop
+            self.record_run_metrics = _noop
+            self.record_worker_error = _noop
+            self.record_worker_heartbeat = _noop
+        else:
+            atexit.register(self.flush)
+            if flush_interval_seconds > 0:
+                self._start_flusher(flush_interval_seconds)
 
     @classmethod
+    @lru_cache(maxsize=1)
     def from_env(cls) -> "CloudWatchMetrics":
         enabled = os.getenv("CLOUDWATCH_METRICS_ENABLED", "false").lower() == "true"
         namespace = os.getenv("CLOUDWATCH_METRICS_NAMESPACE", "RelayInventory")
         environment = os.getenv("ENVIRONMENT", "unknown")
-        return cls(namespace=namespace, enabled=enabled, environment=environment)
+        flush_interval = float(os.getenv("CLOUDWATCH_FLUSH_INTERVAL", str(DEFAULT_FLUSH_INTERVAL_SECONDS)))
+        return cls(
+            namespace=namespace,
+            enabled=enabled,
+            environment=environment,
+            flush_interval_seconds=flush_interval,
+        )
+
+    def _start_flusher(self, interval_seconds: float) -> None:
+        stop_event = threading.Event()
+
+        def _flush_periodically() -> None:
+            while not stop_event.wait(interval_seconds):
+                self.flush()
+
+        atexit.register(stop_event.set)
+        threading.Thread(target=_flush_periodically, daemon=True).start()
+
+    def flush(self) -> None:
+        while True:
+            with self._lock:
+                batch = self._buffer[:PUT_METRIC_DATA_MAX]
+                del self._buffer[:PUT_METRIC_DATA_MAX]
+            if not batch:
+                return
+            self._send(batch)
+
+    def _send(self, batch: List[Dict[str, Any]]) -> None:
+        try:
+            self.client.put_metric_data(Namespace=self.namespace, MetricData=batch)
+        except (BotoCoreError, ClientError) as exc:
+            self.logger.warning(
+                "cloudwatch_metric_failed",
+                extra={"error": str(exc), "metric": ",".join(sorted({item["MetricName"] for item in batch}))},
+            )
 
     def _put_metric(
         self,
@@ -39,42 +110,73 @@ class CloudWatchMetrics:
         unit: str = "Count",
         dimensions: Optional[Iterable[MetricDimension]] = None,
     ) -> None:
+        self._put_datum(name, value, unit, _dimension_payload(*dimensions) if dimensions else None)
+
+    def _put_datum(self, name: str, value: float, unit: str, dimensions: Optional[List[Dict[str, str]]]) -> None:
         if not self.enabled or not self.client:
             return
-        payload = {
+        payload: Dict[str, Any] = {
             "MetricName": name,
             "Value": value,
             "Unit": unit,
         }
         if dimensions:
-            payload["Dimensions"] = [
-                {"Name": dimension.name, "Value": dimension.value} for dimension in dimensions
-            ]
-        try:
-            self.client.put_metric_data(
-                Namespace=self.namespace,
-                MetricData=[payload],
-            )
-        except (BotoCoreError, ClientError) as exc:
-            self.logger.warning("cloudwatch_metric_failed", extra={"error": str(exc), "metric": name})
+            payload["Dimensions"] = dimensions
+        self._enqueue(payload)
+
+    def _enqueue(self, payload: Dict[str, Any]) -> None:
+        with self._lock:
+            self._buffer.append(payload)
+            if len(self._buffer) < PUT_METRIC_DATA_MAX:
+                return
+            batch = self._buffer[:PUT_METRIC_DATA_MAX]
+            del self._buffer[:PUT_METRIC_DATA_MAX]
+        self._send(batch)
 
     def record_run_failure(self, *, tenant_id: str, failed: bool) -> None:
-        value = 1.0 if failed else 0.0
-        self._put_metric(
-            name="RunFailed",
-            value=value,
-            dimensions=[
-                MetricDimension(name="TenantId", value=tenant_id),
-                MetricDimension(name="Environment", value=self.environment),
-            ],
+        if not self.enabled or not self.client:
+            return
+        self._enqueue(
+            _metric_payload(
+                "RunFailed",
+                1.0 if failed else 0.0,
+                "Count",
+                ("TenantId", tenant_id),
+                ("Environment", self.environment),
+            )
         )
 
     def record_worker_error(self, *, error_type: str) -> None:
-        self._put_metric(
-            name="WorkerError",
-            value=1.0,
-            dimensions=[
-                MetricDimension(name="error_type", value=error_type),
-                MetricDimension(name="Environment", value=self.environment),
-            ],
+        self._put_datum(
+            "WorkerError",
+            1.0,
+            "Count",
+            _dimension_payload(("error_type", error_type), ("Environment", self.environment)),
+        )
+
+    def record_run_metrics(
+        self,
+        *,
+        tenant_id: str,
+        succeeded: bool,
+        duration_seconds: float,
+        rows_processed: int,
+    ) -> None:
+        dimensions = _dimension_payload(("TenantId", tenant_id), ("Environment", self.environment))
+        self._put_datum("RunSucceeded", 1.0 if succeeded else 0.0, "Count", dimensions)
+        self._put_datum("RunFailed", 0.0 if succeeded else 1.0, "Count", dimensions)
+        self._put_datum("RunDurationSeconds", duration_seconds, "Seconds", dimensions)
+        self._put_datum("RowsProcessed", rows_processed, "Count", dimensions)
+
+    def record_worker_heartbeat(self) -> None:
+        if not self.enabled or not self.client:
+            return
+        self._enqueue(
+            _metric_payload(
+                "WorkerHeartbeat",
+                1.0,
+                "Count",
+                ("TenantId", "worker"),
+                ("Environment", self.environment),
+            )
         )
@@ -1,13 +1,34 @@
+import gzip
+import time
+
+import boto3
+import pytest
+from botocore.exceptions import ClientError
+from freezegun import freeze_time
 from moto import mock_aws
 
-from relay_inventory.adapters.queue.sqs import SqsAdapter
-from relay_inventory.adapters.storage.s3 import S3Adapter
+from relay_inventory.adapters.queue.sqs import SqsAdapter, SqsDeleteBatcher, SqsVisibilityHeartbeat
+from relay_inventory.adapters.storage.s3 import PRECONDITION_FAILED_CODES, S3Adapter
 
 
-@mock_aws
-def test_s3_adapter_round_trip() -> None:
-    import boto3
+@pytest.fixture(scope="module", autouse=True)
+def aws_mock():
+    with mock_aws():
+        yield
+
+
+@pytest.fixture(autouse=True)
+def reset_aws_resources(aws_mock):
+    yield
+    for bucket in boto3.resource("s3", region_name="us-east-1").buckets.all():
+        bucket.objects.all().delete()
+        bucket.delete()
+    sqs = boto3.client("sqs", region_name="us-east-1")
+    for queue_url in sqs.list_queues().get("QueueUrls", []):
+        sqs.delete_queue(QueueUrl=queue_url)
 
+
+def test_s3_adapter_round_trip() -> None:
     client = boto3.client("s3", region_name="us-east-1")
     client.create_bucket(Bucket="test-bucket")
 
@@ -18,12 +39,37 @@ def test_s3_adapter_round_trip() -> None:
     assert latest.key == "inbound/file.txt"
     assert adapter.download_text("inbound/file.txt") == "hello"
     assert adapter.download_bytes("inbound/file.txt") == b"hello"
+    buffer = bytearray(b"stale")
+    assert adapter.download_bytes("inbound/file.txt", out=buffer) is buffer
+    assert buffer == b"hello"
 
 
-@mock_aws
-def test_sqs_adapter_send_receive_delete() -> None:
-    import boto3
+def test_s3_adapter_copy_key_copies_server_side() -> None:
+    client = boto3.client("s3", region_name="us-east-1")
+    client.create_bucket(Bucket="test-bucket")
+
+    adapter = S3Adapter("test-bucket")
+    adapter.upload_bytes("inbound/vendor.csv", b"sku\nSKU1\n")
+    adapter.copy_key("inbound/vendor.csv", "runs/run-1/inputs/vendor.csv")
+
+    assert adapter.download_bytes("runs/run-1/inputs/vendor.csv") == b"sku\nSKU1\n"
+
 
+def test_s3_adapter_copy_key_requires_matching_source_etag() -> None:
+    client = boto3.client("s3", region_name="us-east-1")
+    client.create_bucket(Bucket="test-bucket")
+
+    adapter = S3Adapter("test-bucket")
+    adapter.upload_bytes("inbound/vendor.csv", b"sku\nSKU1\n")
+    listed = adapter.list_latest("inbound/")
+    adapter.upload_bytes("inbound/vendor.csv", b"sku\nSKU2\n")
+
+    with pytest.raises(ClientError) as excinfo:
+        adapter.copy_key("inbound/vendor.csv", "runs/run-1/inputs/vendor.csv", if_match=listed.etag)
+    assert excinfo.value.response["Error"]["Code"] in PRECONDITION_FAILED_CODES
+
+
+def test_sqs_adapter_send_receive_delete() -> None:
     client = boto3.client("sqs", region_name="us-east-1")
     response = client.create_queue(QueueName="test-queue")
     queue_url = response["QueueUrl"]
@@ -32,5 +78,184 @@ def test_sqs_adapter_send_receive_delete() -> None:
     adapter.send({"run_id": "123"})
     message = adapter.receive()
     assert message is not None
+    assert "body" not in vars(message)
     assert message.body["run_id"] == "123"
     adapter.delete(message.receipt_handle)
+
+
+def test_sqs_adapter_send_many_batches_payloads() -> None:
+    client = boto3.client("sqs", region_name="us-east-1")
+    queue_url = client.create_queue(QueueName="test-queue")["QueueUrl"]
+
+    adapter = SqsAdapter(queue_url)
+    adapter.send_many([{"run_id": str(index)} for index in range(12)])
+
+    attributes = client.get_queue_attributes(
+        QueueUrl=queue_url, AttributeNames=["ApproximateNumberOfMessages"]
+    )["Attributes"]
+    assert attributes["ApproximateNumberOfMessages"] == "12"
+
+
+def test_s3_adapter_upload_lines_streams_multipart() -> None:
+    client = boto3.client("s3", region_name="us-east-1")
+    client.create_bucket(Bucket="test-bucket")
+
+    adapter = S3Adapter("test-bucket")
+    line = "x" * 1023 + "\n"
+    adapter.upload_lines("outputs/big.csv", (line for _ in range(10 * 1024)))
+
+    assert adapter.download_text("outputs/big.csv") == line * 10 * 1024
+
+
+def test_s3_adapter_list_latest_scans_every_page() -> None:
+    client = boto3.client("s3", region_name="us-east-1")
+    client.create_bucket(Bucket="test-bucket")
+
+    adapter = S3Adapter("test-bucket")
+    with freeze_time("2020-01-01T00:00:00"):
+        for index in range(1005):
+            adapter.upload_bytes(f"inbound/{index:05d}.csv", b"")
+    with freeze_time("2020-01-02T00:00:00"):
+        adapter.upload_bytes("inbound/late.csv", b"")
+
+    latest = adapter.list_latest("inbound/")
+    assert latest is not None
+    assert latest.key == "inbound/late.csv"
+
+
+def test_sqs_adapter_receive_returns_one_message_per_call() -> None:
+    client = boto3.client("sqs", region_name="us-east-1")
+    queue_url = client.create_queue(QueueName="test-queue")["QueueUrl"]
+
+    adapter = SqsAdapter(queue_url)
+    adapter.send_many([{"run_id": str(index)} for index in range(3)])
+
+    received = [adapter.receive() for _ in range(3)]
+    assert sorted(message.body["run_id"] for message in received) == ["0", "1", "2"]
+
+
+def test_sqs_delete_batcher_coalesces_deletes() -> None:
+    client = boto3.client("sqs", region_name="us-east-1")
+    queue_url = client.create_queue(QueueName="test-queue")["QueueUrl"]
+
+    adapter = SqsAdapter(queue_url)
+    adapter.send_many([{"run_id": str(index)} for index in range(12)])
+    handles = []
+    while len(handles) < 12:
+        handles.extend(message.receipt_handle for message in adapter.receive_batch())
+
+    errors = []
+    batcher = SqsDeleteBatcher(adapter, errors.append)
+    for handle in handles:
+        batcher.submit(handle)
+    batcher.close()
+
+    assert errors == []
+    attributes = client.get_queue_attributes(
+        QueueUrl=queue_url,
+        AttributeNames=["ApproximateNumberOfMessages", "ApproximateNumberOfMessagesNotVisible"],
+    )["Attributes"]
+    assert attributes == {"ApproximateNumberOfMessages": "0", "ApproximateNumberOfMessagesNotVisible": "0"}
+
+
+def test_sqs_visibility_heartbeat_extends_registered_messages() -> None:
+    client = boto3.client("sqs", region_name="us-east-1")
+    queue_url = client.create_queue(QueueName="test-queue")["QueueUrl"]
+
+    adapter = SqsAdapter(queue_url)
+    adapter.send({"run_id": "1"})
+    message = adapter.receive()
+    assert adapter.change_visibility_batch([message.receipt_handle], 60) == []
+
+    extended = []
+
+    class RecordingAdapter:
+        def change_visibility_batch(self, receipt_handles, timeout_seconds):
+            extended.append((list(receipt_handles), timeout_seconds))
+            return []
+
+    heartbeat = SqsVisibilityHeartbeat(
+        RecordingAdapter(), interval_seconds=0.05, timeout_seconds=60, on_error=pytest.fail
+    )
+    heartbeat.register("handle-1")
+    time.sleep(0.2)
+    heartbeat.unregister("handle-1")
+    heartbeat.close()
+
+    assert extended
+    assert all(entry == (["handle-1"], 60) for entry in extended)
+
+
+def test_s3_adapter_list_latest_multi_groups_by_prefix() -> None:
+    client = boto3.client("s3", region_name="us-east-1")
+    client.create_bucket(Bucket="test-bucket")
+
+    adapter = S3Adapter("test-bucket")
+    with freeze_time("2020-01-01T00:00:00"):
+        adapter.upload_bytes("inbound/vendor-a/old.csv", b"")
+        adapter.upload_bytes("inbound/vendor-b/only.csv", b"")
+    with freeze_time("2020-01-02T00:00:00"):
+        adapter.upload_bytes("inbound/vendor-a/new.csv", b"")
+        adapter.upload_bytes("outbound/vendor-a/ignored.csv", b"")
+
+    latest = adapter.list_latest_multi(["inbound/vendor-a/", "inbound/vendor-b/", "inbound/vendor-c/"])
+
+    assert {prefix: location.key if location else None for prefix, location in latest.items()} == {
+        "inbound/vendor-a/": "inbound/vendor-a/new.csv",
+        "inbound/vendor-b/": "inbound/vendor-b/only.csv",
+        "inbound/vendor-c/": None,
+    }
+
+
+def test_s3_adapter_list_latest_multi_handles_nested_and_distant_prefixes(monkeypatch) -> None:
+    client = boto3.client("s3", region_name="us-east-1")
+    client.create_bucket(Bucket="test-bucket")
+
+    adapter = S3Adapter("test-bucket")
+    with freeze_time("2020-01-01T00:00:00"):
+        adapter.upload_bytes("tenant-a/inbound/vendor-a/sub/old.csv", b"")
+        adapter.upload_bytes("tenant-a/archive/vendor-b/only.csv", b"")
+    with freeze_time("2020-01-02T00:00:00"):
+        adapter.upload_bytes("tenant-a/inbound/vendor-a/new.csv", b"")
+
+    nested = adapter.list_latest_multi(["tenant-a/inbound/vendor-a/", "tenant-a/inbound/vendor-a/sub/"])
+    assert {prefix: location.key for prefix, location in nested.items()} == {
+        "tenant-a/inbound/vendor-a/": "tenant-a/inbound/vendor-a/new.csv",
+        "tenant-a/inbound/vendor-a/sub/": "tenant-a/inbound/vendor-a/sub/old.csv",
+    }
+
+    listed = []
+    original = adapter.list_latest
+    monkeypatch.setattr(adapter, "list_latest", lambda prefix: listed.append(prefix) or original(prefix))
+    distant = adapter.list_latest_multi(["tenant-a/inbound/vendor-a/", "tenant-a/archive/vendor-b/"])
+
+    assert sorted(listed) == ["tenant-a/archive/vendor-b/", "tenant-a/inbound/vendor-a/"]
+    assert distant["tenant-a/archive/vendor-b/"].key == "tenant-a/archive/vendor-b/only.csv"
+
+
+def test_s3_adapter_download_bytes_if_changed_skips_matching_etag() -> None:
+    client = boto3.client("s3", region_name="us-east-1")
+    client.create_bucket(Bucket="test-bucket")
+
+    adapter = S3Adapter("test-bucket")
+    adapter.upload_bytes("maps/sku_map.csv", b"vendor_sku,sku\nA,1\n")
+    body, etag = adapter.download_bytes_if_changed("maps/sku_map.csv", None)
+    assert body == b"vendor_sku,sku\nA,1\n"
+    assert adapter.download_bytes_if_changed("maps/sku_map.csv", etag) == (None, etag)
+
+    adapter.upload_bytes("maps/sku_map.csv", b"vendor_sku,sku\nA,2\n")
+    body, changed = adapter.download_bytes_if_changed("maps/sku_map.csv", etag)
+    assert body == b"vendor_sku,sku\nA,2\n"
+    assert changed != etag
+
+
+def test_s3_adapter_gzip_stream_round_trip() -> None:
+    client = boto3.client("s3", region_name="us-east-1")
+    client.create_bucket(Bucket="test-bucket")
+
+    adapter = S3Adapter("test-bucket")
+    adapter.upload_gzip_stream("normalized/vendor.csv", [b"sku,title\n", b"SKU1,Widget\n"])
+
+    stored = client.get_object(Bucket="test-bucket", Key="normalized/vendor.csv")
+    assert stored["ContentEncoding"] == "gzip"
+    assert gzip.decompress(stored["Body"].read()) == b"sku,title\nSKU1,Widget\n"
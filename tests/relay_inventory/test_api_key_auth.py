@@ -0,0 +1,20 @@
+import pytest
+from fastapi import HTTPException
+
+from relay_inventory.app.auth.api_key import ApiKeyAuth, allow_all, build_auth_dependency
+
+
+def test_api_key_auth_accepts_only_configured_keys() -> None:
+    auth = ApiKeyAuth(["key-1", "key-2"])
+
+    auth("key-1")
+    auth("key-2")
+    for candidate in (None, "", "key-3", "KEY-1"):
+        with pytest.raises(HTTPException) as excinfo:
+            auth(candidate)
+        assert excinfo.value.status_code == 401
+
+
+def test_build_auth_dependency_skips_auth_without_keys() -> None:
+    assert build_auth_dependency([]) is allow_all
+    assert isinstance(build_auth_dependency(["key-1"]), ApiKeyAuth)
@@ -0,0 +1,93 @@
+from datetime import datetime
+
+from fastapi.testclient import TestClient
+
+from relay_inventory.app.api import app as api
+from relay_inventory.app.jobs.schema import RunJob
+from relay_inventory.persistence.dynamo_runs import RunRecord
+
+
+def test_get_run_returns_stored_timestamps() -> None:
+    client = TestClient(api.app)
+    created = client.post("/v1/runs", json={"tenant_id": "tenant-a", "vendors": ["vendor-a"]})
+    assert created.status_code == 200
+    run_id = created.json()["run_id"]
+    api.runs_repo.update_status(
+        run_id,
+        "SUCCEEDED",
+        started_at="2020-01-01T00:00:00",
+        completed_at="2020-01-01T00:05:00.250000",
+    )
+
+    response = client.get(f"/v1/runs/{run_id}")
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["status"] == "SUCCEEDED"
+    assert body["requested_at"] == created.json()["requested_at"]
+    assert datetime.fromisoformat(body["requested_at"]).tzinfo is None
+    assert body["started_at"] == "2020-01-01T00:00:00"
+    assert body["finished_at"] == "2020-01-01T00:05:00.250000"
+
+
+def test_in_memory_runs_tracks_running_run_per_tenant() -> None:
+    runs = api.InMemoryRuns()
+    runs.create(RunRecord(run_id="run-1", tenant_id="tenant-a", config_version=1, status="QUEUED", requested_at=""))
+    assert runs.find_running_by_tenant("tenant-a") is None
+
+    runs.update_status("run-1", "RUNNING")
+    running = runs.find_running_by_tenant("tenant-a")
+    assert running is not None
+    assert running.run_id == "run-1"
+
+    runs.update_status("run-1", "SUCCEEDED")
+    assert runs.find_running_by_tenant("tenant-a") is None
+
+
+def test_get_run_artifacts_presigns_every_artifact(monkeypatch) -> None:
+    class FakeS3:
+        def presign(self, key: str, expires_in: int = 3600) -> str:
+            return f"https://signed/{key}"
+
+    monkeypatch.setattr(api, "s3_adapter", FakeS3())
+    record = RunRecord(run_id="run-artifacts", tenant_id="tenant-a", config_version=1, status="SUCCEEDED", requested_at="")
+    record.artifacts = {"merged_inventory": "run/out.csv", "run_summary": "run/summary.json"}
+    api.runs_repo.create(record)
+
+    response = TestClient(api.app).get("/v1/runs/run-artifacts/artifacts")
+
+    assert response.json() == {
+        "merged_inventory": "https://signed/run/out.csv",
+        "run_summary": "https://signed/run/summary.json",
+    }
+
+
+def test_create_run_enqueues_run_job_payload(monkeypatch) -> None:
+    class FakeQueue:
+        def __init__(self) -> None:
+            self.sent = []
+
+        def send(self, payload: dict) -> None:
+            self.sent.append(payload)
+
+    queue = FakeQueue()
+    monkeypatch.setattr(api, "queue", queue)
+
+    response = TestClient(api.app).post("/v1/runs", json={"tenant_id": "tenant-q", "vendors": ["vendor-a"]})
+
+    assert response.status_code == 200
+    job = RunJob.model_validate(queue.sent[0])
+    assert job.run_id == response.json()["run_id"]
+    assert job.vendors == ["vendor-a"]
+
+
+def test_create_run_conflicts_while_tenant_is_running() -> None:
+    client = TestClient(api.app)
+    first = client.post("/v1/runs", json={"tenant_id": "tenant-busy", "vendors": ["vendor-a"]}).json()
+    api.runs_repo.update_status(first["run_id"], "RUNNING")
+
+    response = client.post("/v1/runs", json={"tenant_id": "tenant-busy", "vendors": ["vendor-a"]})
+
+    assert response.status_code == 409
+    assert response.headers["content-type"] == "application/json"
+    assert response.json() == {"error": "TENANT_ALREADY_RUNNING", "active_run_id": first["run_id"]}
@@ -1,4 +1,8 @@
+import os
+from pathlib import Path
+
 import pytest
+from pydantic import ValidationError
 
 from relay_inventory.app.config.loader import load_tenant_config
 
@@ -8,3 +12,31 @@ def test_invalid_schema_version(tmp_path) -> None:
     path.write_text("schema_version: 2\ntenant_id: test\ntimezone: UTC\ndefault_currency: USD\nvendors: []\npricing: {base_margin_pct: 0, min_price: 0, shipping_handling_flat: 0, map_policy: {enforce: true}, rounding: {mode: nearest, increment: 0.01}}\nmerge: {strategy: best_offer}\noutput: {columns: [sku]}\n")
     with pytest.raises(ValueError, match="Unsupported schema_version"):
         load_tenant_config(path)
+
+
+def test_load_tenant_config_reuses_unchanged_file(tmp_path) -> None:
+    source = Path("data/relay_inventory/tenant_config.yaml").read_text(encoding="utf-8")
+    path = tmp_path / "config.yaml"
+    path.write_text(source, encoding="utf-8")
+
+    first = load_tenant_config(path)
+    assert load_tenant_config(path) is first
+
+    path.write_text(source.replace('"USD"', '"EUR"'), encoding="utf-8")
+    os.utime(path, ns=(0, 0))
+    reloaded = load_tenant_config(path)
+    assert reloaded is not first
+    assert reloaded.default_currency == "EUR"
+
+
+def test_normalized_artifact_emitted_by_default() -> None:
+    config = load_tenant_config(Path("data/relay_inventory/tenant_config.yaml"))
+    assert all(vendor.inbound.emit_normalized_artifact for vendor in config.vendors)
+
+
+def test_unsupported_output_compression_rejected(tmp_path) -> None:
+    source = Path("data/relay_inventory/tenant_config.yaml").read_text(encoding="utf-8")
+    path = tmp_path / "config.yaml"
+    path.write_text(source.replace("output:\n", "output:\n  compression: zstd\n", 1), encoding="utf-8")
+    with pytest.raises(ValidationError, match="compression"):
+        load_tenant_config(path)
@@ -1,7 +1,16 @@
+import json
 from datetime import datetime, timezone
 from decimal import Decimal
 
-from relay_inventory.engine.canonical.io import write_csv_bytes
+import pytest
+
+from relay_inventory.engine.canonical.io import (
+    iter_csv_chunks,
+    iter_json_array_chunks,
+    write_csv_bytes,
+    write_json_bytes,
+)
+from relay_inventory.engine.parsing.csv_parser import ParseError
 
 
 def test_csv_output_deterministic_order_and_formatting() -> None:
@@ -36,3 +45,49 @@ def test_csv_output_deterministic_order_and_formatting() -> None:
         "SKU-001,vendor-b,10.00,2020-01-01T12:00:00Z\n"
         "SKU-002,vendor-b,9.90,2020-01-01T12:00:00Z\n"
     )
+
+
+def test_csv_output_rejects_extra_fields_when_raising() -> None:
+    rows = [{"sku": "SKU-001", "price": Decimal("1"), "brand": "ACME"}]
+
+    with pytest.raises(ValueError, match="brand"):
+        write_csv_bytes(rows, ["sku", "price"], extrasaction="raise")
+
+    assert write_csv_bytes(rows, ["sku", "price"], extrasaction="ignore") == b"sku,price\nSKU-001,1.00\n"
+
+
+def test_csv_chunks_join_to_full_output() -> None:
+    rows = [{"sku": f"SKU-{index:03d}", "price": Decimal(index)} for index in range(25, 0, -1)]
+
+    chunks = list(iter_csv_chunks(rows, ["sku", "price"], chunk_rows=10))
+
+    assert len(chunks) == 3
+    assert b"".join(chunks) == write_csv_bytes(rows, ["sku", "price"])
+    assert chunks[0].startswith(b"sku,price\nSKU-001,1.00\n")
+
+
+def test_json_report_bytes_match_stdlib_encoding() -> None:
+    errors = [
+        {"error_code": "OPTIONAL_VENDOR_MISSING", "vendor_id": "vendor-b"},
+        ParseError(row_number=3, reason="invalid quantity", row_data={"sku": "SKU-1", None: ["extra"]}),
+    ]
+
+    expected = json.dumps([errors[0], errors[1].__dict__, {"cost": Decimal("1.50")}], default=str)
+
+    assert json.loads(write_json_bytes([*errors, {"cost": Decimal("1.50")}])) == json.loads(expected)
+
+
+def test_csv_projection_handles_missing_and_single_columns() -> None:
+    rows = [{"sku": "SKU-2", "price": Decimal("2")}, {"sku": "SKU-1"}]
+
+    assert write_csv_bytes(rows, ["sku", "price"]) == b"sku,price\nSKU-1,\nSKU-2,2.00\n"
+    assert write_csv_bytes(rows, ["sku"], extrasaction="ignore") == b"sku\nSKU-1\nSKU-2\n"
+
+
+@pytest.mark.parametrize("count", [0, 1, 3, 4, 7])
+def test_json_array_chunks_join_to_full_report(count: int) -> None:
+    items = [{"row_number": index, "reason": "bad"} for index in range(count)]
+
+    chunks = list(iter_json_array_chunks(items, chunk_items=3))
+
+    assert b"".join(chunks) == write_json_bytes(items)
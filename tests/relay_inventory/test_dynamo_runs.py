@@ -0,0 +1,108 @@
+from datetime import datetime
+
+import boto3
+import pytest
+from moto import mock_aws
+
+from relay_inventory.persistence.dynamo_runs import DynamoRuns, RunRecord
+
+
+@pytest.fixture()
+def runs_table_name() -> str:
+    return "runs"
+
+
+@pytest.fixture()
+def runs_table(runs_table_name: str, monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setenv("AWS_DEFAULT_REGION", "us-east-1")
+    with mock_aws():
+        resource = boto3.resource("dynamodb", region_name="us-east-1")
+        table = resource.create_table(
+            TableName=runs_table_name,
+            KeySchema=[{"AttributeName": "run_id", "KeyType": "HASH"}],
+            AttributeDefinitions=[{"AttributeName": "run_id", "AttributeType": "S"}],
+            BillingMode="PAY_PER_REQUEST",
+        )
+        table.meta.client.get_waiter("table_exists").wait(TableName=runs_table_name)
+        yield table
+
+
+def _record(run_id: str, status: str = "QUEUED") -> RunRecord:
+    return RunRecord(
+        run_id=run_id,
+        tenant_id="tenant-a",
+        config_version=1,
+        status=status,
+        requested_at="2024-01-01T00:00:00Z",
+    )
+
+
+def test_create_many_writes_all_records(runs_table_name: str, runs_table):
+    runs = DynamoRuns(runs_table_name)
+    runs.create_many([_record(f"run-{index}") for index in range(30)] + [_record("run-0", "RUNNING")])
+
+    assert runs_table.scan()["Count"] == 30
+    stored = runs.get("run-0")
+    assert stored is not None
+    assert stored.status == "RUNNING"
+    assert stored.requested_at == "2024-01-01T00:00:00Z"
+
+
+def test_update_status_sets_and_removes_fields(runs_table_name: str, runs_table):
+    runs = DynamoRuns(runs_table_name)
+    record = _record("run-1")
+    record.error_code = "OLD"
+    runs.create(record)
+
+    runs.update_status(
+        "run-1",
+        "FAILED",
+        stage="parse",
+        finished_at=datetime(2024, 1, 2, 3, 4, 5),
+        error_message="boom",
+        artifacts={"errors": "s3://bucket/errors.csv"},
+        clear_fields=["error_code"],
+    )
+
+    stored = runs.get("run-1")
+    assert stored is not None
+    assert stored.status == "FAILED"
+    assert stored.stage == "parse"
+    assert stored.finished_at == "2024-01-02T03:04:05"
+    assert stored.error_message == "boom"
+    assert stored.artifacts == {"errors": "s3://bucket/errors.csv"}
+    assert stored.error_code is None
+    assert stored.started_at is None
+
+
+def test_update_status_never_regresses_stage(runs_table_name: str, runs_table):
+    runs = DynamoRuns(runs_table_name)
+    runs.create(_record("run-1"))
+
+    runs.update_status("run-1", "RUNNING", stage="MERGE_PRICE", started_at=datetime(2024, 1, 2))
+    runs.update_status("run-1", "RUNNING", stage="FETCH_INPUTS")
+    runs.update_status("run-1", "FAILED", stage="NORMALIZE", error_code="boom")
+
+    stored = runs.get("run-1")
+    assert stored is not None
+    assert stored.status == "FAILED"
+    assert stored.stage == "MERGE_PRICE"
+    assert stored.started_at == "2024-01-02T00:00:00"
+    assert stored.error_code == "boom"
+
+
+def test_update_status_late_running_does_not_reopen_succeeded_run(runs_table_name: str, runs_table):
+    runs = DynamoRuns(runs_table_name)
+    runs.create(_record("run-1"))
+
+    runs.update_status("run-1", "RUNNING", stage="FETCH_INPUTS")
+    runs.update_status("run-1", "SUCCEEDED", stage="COMPLETE")
+    runs.update_status("run-1", "RUNNING", stage="FETCH_INPUTS")
+    runs.update_status("run-1", "FAILED", stage="NORMALIZE", error_code="late")
+
+    stored = runs.get("run-1")
+    assert stored is not None
+    assert stored.status == "SUCCEEDED"
+    assert stored.stage == "COMPLETE"
+    assert stored.error_code is None
+    assert runs.find_running_by_tenant("tenant-a") is None
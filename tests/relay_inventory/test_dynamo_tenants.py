@@ -1,3 +1,5 @@
+from decimal import Decimal
+
 import boto3
 import pytest
 from moto import mock_aws
@@ -5,17 +7,17 @@ from moto import mock_aws
 from relay_inventory.persistence.dynamo_tenants import DynamoTenants, TenantRecord
 
 
-@pytest.fixture()
+@pytest.fixture(scope="module")
 def dynamo_table_name() -> str:
     return "tenant-configs"
 
 
-@pytest.fixture()
-def dynamodb_table(dynamo_table_name: str, monkeypatch: pytest.MonkeyPatch):
-    monkeypatch.setenv("AWS_DEFAULT_REGION", "us-east-1")
-    with mock_aws():
+@pytest.fixture(scope="module")
+def shared_table(dynamo_table_name: str):
+    with pytest.MonkeyPatch.context() as monkeypatch, mock_aws():
+        monkeypatch.setenv("AWS_DEFAULT_REGION", "us-east-1")
         resource = boto3.resource("dynamodb", region_name="us-east-1")
-        table = resource.create_table(
+        yield resource.create_table(
             TableName=dynamo_table_name,
             KeySchema=[
                 {"AttributeName": "tenant_id", "KeyType": "HASH"},
@@ -27,8 +29,14 @@ def dynamodb_table(dynamo_table_name: str, monkeypatch: pytest.MonkeyPatch):
             ],
             ProvisionedThroughput={"ReadCapacityUnits": 5, "WriteCapacityUnits": 5},
         )
-        table.meta.client.get_waiter("table_exists").wait(TableName=dynamo_table_name)
-        yield table
+
+
+@pytest.fixture()
+def dynamodb_table(shared_table):
+    yield shared_table
+    with shared_table.batch_writer() as batch:
+        for item in shared_table.scan(ProjectionExpression="tenant_id, config_version")["Items"]:
+            batch.delete_item(Key={"tenant_id": item["tenant_id"], "config_version": item["config_version"]})
 
 
 def test_get_latest_returns_none_when_missing(dynamo_table_name: str, dynamodb_table):
@@ -61,3 +69,24 @@ def test_get_latest_isolated_by_tenant(dynamo_table_name: str, dynamodb_table):
     assert latest_b is not None
     assert latest_a.config_version == 1
     assert latest_b.config_version == 3
+
+
+def test_put_stores_decimal_and_float_config_values_as_numbers(dynamo_table_name: str, dynamodb_table):
+    tenants = DynamoTenants(dynamo_table_name)
+    tenants.put(
+        TenantRecord(
+            tenant_id="tenant-a",
+            config_version=1,
+            config={"base_margin_pct": Decimal("12.5"), "max_invalid_row_pct": 0.25, "tiers": [0.5]},
+        )
+    )
+
+    client = boto3.client("dynamodb", region_name="us-east-1")
+    item = client.get_item(
+        TableName=dynamo_table_name,
+        Key={"tenant_id": {"S": "tenant-a"}, "config_version": {"N": "1"}},
+    )["Item"]
+    config = item["config"]["M"]
+    assert config["base_margin_pct"] == {"N": "12.5"}
+    assert config["max_invalid_row_pct"] == {"N": "0.25"}
+    assert config["tiers"] == {"L": [{"N": "0.5"}]}
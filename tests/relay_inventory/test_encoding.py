@@ -1,11 +1,12 @@
 from __future__ import annotations
 
+import gzip
 from datetime import datetime
 
 import pytest
 
 from relay_inventory.app.models.config import TenantConfig
-from relay_inventory.engine.run import DecodeError, run_inventory_sync
+from relay_inventory.engine.run import DecodeError, run_inventory_sync, sku_map_input_key
 
 
 def _base_config(encoding: str) -> TenantConfig:
@@ -66,3 +67,73 @@ def test_decode_error_includes_vendor_id() -> None:
         )
 
     assert excinfo.value.vendor_id == "vendor-a"
+
+
+def test_vendor_results_keep_config_order() -> None:
+    payload = _base_config("utf-8").model_dump()
+    for vendor_id in ("vendor-b", "vendor-c"):
+        vendor = dict(payload["vendors"][0], vendor_id=vendor_id)
+        payload["vendors"].append(vendor)
+    tenant_config = TenantConfig.model_validate(payload)
+
+    result = run_inventory_sync(
+        vendor_inputs={
+            "vendor-c": b"sku,quantity_available,price\nSKU3,1,1.00\n",
+            "vendor-a": b"sku,quantity_available,price\nSKU1,1,1.00\nSKU2,1,1.00\n",
+        },
+        tenant_config=tenant_config,
+        run_id="run-1",
+        now=datetime.utcnow(),
+    )
+
+    assert list(result.normalized_by_vendor) == ["vendor-a", "vendor-b", "vendor-c"]
+    assert result.summary["vendor_record_counts"] == {"vendor-a": 2, "vendor-b": 0, "vendor-c": 1}
+    assert [row["sku"] for row in result.merged_rows] == ["SKU1", "SKU2", "SKU3"]
+
+
+def test_sku_map_applies_on_repeated_runs() -> None:
+    payload = _base_config("latin-1").model_dump()
+    payload["vendors"][0]["sku_map"] = {"type": "csv", "s3_key": "maps/vendor-a.csv"}
+    tenant_config = TenantConfig.model_validate(payload)
+    vendor_inputs = {
+        "vendor-a": "sku,quantity_available,price\nVENDé,1,1.00\n".encode("latin-1"),
+        sku_map_input_key("vendor-a"): "vendor_sku,sku\nVENDé,SKU-é\n".encode("latin-1"),
+    }
+
+    for run_id in ("run-1", "run-2"):
+        result = run_inventory_sync(
+            vendor_inputs=dict(vendor_inputs),
+            tenant_config=tenant_config,
+            run_id=run_id,
+            now=datetime.utcnow(),
+        )
+        assert result.normalized_by_vendor["vendor-a"][0]["sku"] == "SKU-é"
+
+
+def test_gzipped_vendor_input_parses() -> None:
+    tenant_config = _base_config("latin-1")
+    raw_bytes = gzip.compress("sku,quantity_available,price\nSKUé,1,1.00\n".encode("latin-1"))
+    result = run_inventory_sync(
+        vendor_inputs={"vendor-a": raw_bytes},
+        tenant_config=tenant_config,
+        run_id="run-1",
+        now=datetime.utcnow(),
+    )
+
+    assert not result.errors
+    assert result.normalized_by_vendor["vendor-a"][0]["sku"] == "SKUé"
+
+
+def test_truncated_gzip_input_is_decode_error() -> None:
+    tenant_config = _base_config("utf-8")
+    raw_bytes = gzip.compress(b"sku,quantity_available,price\nSKU-1,1,1.00\n")[:-12]
+
+    with pytest.raises(DecodeError) as excinfo:
+        run_inventory_sync(
+            vendor_inputs={"vendor-a": raw_bytes},
+            tenant_config=tenant_config,
+            run_id="run-1",
+            now=datetime.utcnow(),
+        )
+
+    assert excinfo.value.vendor_id == "vendor-a"
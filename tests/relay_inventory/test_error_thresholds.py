@@ -12,49 +12,52 @@ from relay_inventory.scripts.worker import Worker
 from relay_inventory.util.errors import NonRetryableError
 
 
-@pytest.fixture()
-def aws_env(monkeypatch: pytest.MonkeyPatch):
-    monkeypatch.setenv("AWS_DEFAULT_REGION", "us-east-1")
+@pytest.fixture(scope="module")
+def aws_resources():
+    with pytest.MonkeyPatch.context() as monkeypatch, mock_aws():
+        monkeypatch.setenv("AWS_DEFAULT_REGION", "us-east-1")
+        resource = boto3.resource("dynamodb", region_name="us-east-1")
+        tenants_table = resource.create_table(
+            TableName="tenant-configs",
+            KeySchema=[
+                {"AttributeName": "tenant_id", "KeyType": "HASH"},
+                {"AttributeName": "config_version", "KeyType": "RANGE"},
+            ],
+            AttributeDefinitions=[
+                {"AttributeName": "tenant_id", "AttributeType": "S"},
+                {"AttributeName": "config_version", "AttributeType": "N"},
+            ],
+            ProvisionedThroughput={"ReadCapacityUnits": 5, "WriteCapacityUnits": 5},
+        )
+        runs_table = resource.create_table(
+            TableName="run-records",
+            KeySchema=[{"AttributeName": "run_id", "KeyType": "HASH"}],
+            AttributeDefinitions=[{"AttributeName": "run_id", "AttributeType": "S"}],
+            ProvisionedThroughput={"ReadCapacityUnits": 5, "WriteCapacityUnits": 5},
+        )
+        bucket = boto3.resource("s3", region_name="us-east-1").create_bucket(Bucket="inventory-bucket")
+        yield {"bucket": bucket, "tenants": tenants_table, "runs": runs_table}
 
 
 @pytest.fixture()
-def aws_resources(aws_env):
-    with mock_aws():
-        yield
+def clean_resources(aws_resources):
+    yield aws_resources
+    aws_resources["bucket"].objects.all().delete()
+    for table in (aws_resources["tenants"], aws_resources["runs"]):
+        key_names = [key["AttributeName"] for key in table.key_schema]
+        with table.batch_writer() as batch:
+            for item in table.scan(ProjectionExpression=", ".join(key_names))["Items"]:
+                batch.delete_item(Key={name: item[name] for name in key_names})
 
 
 @pytest.fixture()
-def s3_bucket(aws_resources):
-    client = boto3.client("s3", region_name="us-east-1")
-    bucket = "inventory-bucket"
-    client.create_bucket(Bucket=bucket)
-    return bucket
+def s3_bucket(clean_resources):
+    return clean_resources["bucket"].name
 
 
 @pytest.fixture()
-def dynamodb_tables(aws_resources):
-    resource = boto3.resource("dynamodb", region_name="us-east-1")
-    tenants_table = resource.create_table(
-        TableName="tenant-configs",
-        KeySchema=[
-            {"AttributeName": "tenant_id", "KeyType": "HASH"},
-            {"AttributeName": "config_version", "KeyType": "RANGE"},
-        ],
-        AttributeDefinitions=[
-            {"AttributeName": "tenant_id", "AttributeType": "S"},
-            {"AttributeName": "config_version", "AttributeType": "N"},
-        ],
-        ProvisionedThroughput={"ReadCapacityUnits": 5, "WriteCapacityUnits": 5},
-    )
-    runs_table = resource.create_table(
-        TableName="run-records",
-        KeySchema=[{"AttributeName": "run_id", "KeyType": "HASH"}],
-        AttributeDefinitions=[{"AttributeName": "run_id", "AttributeType": "S"}],
-        ProvisionedThroughput={"ReadCapacityUnits": 5, "WriteCapacityUnits": 5},
-    )
-    tenants_table.meta.client.get_waiter("table_exists").wait(TableName="tenant-configs")
-    runs_table.meta.client.get_waiter("table_exists").wait(TableName="run-records")
-    return {"tenants": tenants_table.name, "runs": runs_table.name}
+def dynamodb_tables(clean_resources):
+    return {"tenants": clean_resources["tenants"].name, "runs": clean_resources["runs"].name}
 
 
 def _base_config(error_policy: dict, *, vendor_required: bool = True) -> dict:
@@ -177,6 +180,7 @@ def test_retry_keeps_stage_monotonic_and_artifact_prefix(s3_bucket, dynamodb_tab
     config = _base_config({"max_invalid_rows": 1, "max_invalid_row_pct": 0.5})
     _put_tenant_config(dynamodb_tables["tenants"], config)
     _create_run_record(dynamodb_tables["runs"], "run-4")
+    _upload_csv(s3_bucket, "vendor-a/input.csv", "sku,quantity_available,price\n")
     worker = _create_worker(s3_bucket, dynamodb_tables["runs"], dynamodb_tables["tenants"])
 
     job = RunJob(run_id="run-4", tenant_id="tenant-a", vendors=["vendor-a"], config_version=1)
@@ -68,3 +68,28 @@ def test_merge_best_offer_is_deterministic() -> None:
     merged = merge_best_offer(records, config=config)
     assert [record.sku for record in merged] == ["SKU1", "SKU2"]
     assert merged[0].vendor_id == "a"
+
+
+def test_merge_best_offer_groups_interleaved_skus() -> None:
+    records = [
+        InventoryRecord(sku="SKU2", vendor_id="a", quantity_available=3, cost=Decimal("9"), price=Decimal("0")),
+        InventoryRecord(sku="SKU1", vendor_id="b", quantity_available=0, cost=Decimal("1"), price=Decimal("0")),
+        InventoryRecord(sku="SKU2", vendor_id="b", quantity_available=3, cost=Decimal("7"), price=Decimal("0")),
+        InventoryRecord(
+            sku="SKU1",
+            vendor_id="a",
+            quantity_available=2,
+            cost=None,
+            price=Decimal("0"),
+            lead_time_days=3,
+        ),
+    ]
+    config = BestOfferConfig(
+        landed_cost=LandedCostConfig(include_shipping_handling=False, shipping_handling_flat=Decimal("5")),
+        fallback_lead_time_days=7,
+    )
+    merged = merge_best_offer(records, config=config)
+    assert [(record.sku, record.vendor_id, record.lead_time_days) for record in merged] == [
+        ("SKU1", "a", 3),
+        ("SKU2", "b", 7),
+    ]
@@ -0,0 +1,92 @@
+import pytest
+
+from relay_inventory.util.metrics import PUT_METRIC_DATA_MAX, CloudWatchMetrics
+
+
+class RecordingCloudWatch:
+    def __init__(self) -> None:
+        self.calls = []
+
+    def put_metric_data(self, *, Namespace: str, MetricData: list) -> None:
+        self.calls.append((Namespace, list(MetricData)))
+
+
+def _enabled_metrics(monkeypatch: pytest.MonkeyPatch) -> CloudWatchMetrics:
+    monkeypatch.setenv("AWS_DEFAULT_REGION", "us-east-1")
+    return CloudWatchMetrics(
+        namespace="RelayInventory", enabled=True, environment="test", flush_interval_seconds=0
+    )
+
+
+def test_metrics_are_buffered_and_sent_in_batches(monkeypatch: pytest.MonkeyPatch) -> None:
+    metrics = _enabled_metrics(monkeypatch)
+    metrics.client = RecordingCloudWatch()
+
+    for _ in range(PUT_METRIC_DATA_MAX + 3):
+        metrics.record_worker_error(error_type="queue_receive_error")
+
+    assert [len(batch) for _, batch in metrics.client.calls] == [PUT_METRIC_DATA_MAX]
+
+    metrics.flush()
+
+    assert [len(batch) for _, batch in metrics.client.calls] == [PUT_METRIC_DATA_MAX, 3]
+    assert all(namespace == "RelayInventory" for namespace, _ in metrics.client.calls)
+
+
+def test_run_failure_payload_is_reused_per_tenant(monkeypatch: pytest.MonkeyPatch) -> None:
+    metrics = _enabled_metrics(monkeypatch)
+    metrics.client = RecordingCloudWatch()
+
+    metrics.record_run_failure(tenant_id="tenant-a", failed=False)
+    metrics.record_run_failure(tenant_id="tenant-a", failed=False)
+    metrics.record_run_failure(tenant_id="tenant-a", failed=True)
+    metrics.flush()
+
+    (_, batch), = metrics.client.calls
+    assert batch[0] is batch[1]
+    assert [item["Value"] for item in batch] == [0.0, 0.0, 1.0]
+    assert batch[2]["Dimensions"] == [
+        {"Name": "TenantId", "Value": "tenant-a"},
+        {"Name": "Environment", "Value": "test"},
+    ]
+
+
+def test_run_metrics_and_heartbeats_share_the_buffer(monkeypatch: pytest.MonkeyPatch) -> None:
+    metrics = _enabled_metrics(monkeypatch)
+    metrics.client = RecordingCloudWatch()
+
+    metrics.record_worker_heartbeat()
+    metrics.record_worker_heartbeat()
+    metrics.record_run_metrics(tenant_id="tenant-a", succeeded=True, duration_seconds=1.5, rows_processed=10)
+
+    assert metrics.client.calls == []
+
+    metrics.flush()
+
+    (_, batch), = metrics.client.calls
+    assert [item["MetricName"] for item in batch] == [
+        "WorkerHeartbeat",
+        "WorkerHeartbeat",
+        "RunSucceeded",
+        "RunFailed",
+        "RunDurationSeconds",
+        "RowsProcessed",
+    ]
+    assert batch[4]["Value"] == 1.5
+    assert batch[4]["Dimensions"] == [
+        {"Name": "TenantId", "Value": "tenant-a"},
+        {"Name": "Environment", "Value": "test"},
+    ]
+
+
+def test_disabled_metrics_skip_recording() -> None:
+    metrics = CloudWatchMetrics(namespace="RelayInventory", enabled=False, environment="test")
+    metrics.client = RecordingCloudWatch()
+
+    metrics.record_run_failure(tenant_id="tenant-a", failed=True)
+    metrics.record_worker_error(error_type="poison_job")
+    metrics.record_run_metrics(tenant_id="tenant-a", succeeded=True, duration_seconds=1.0, rows_processed=1)
+    metrics.record_worker_heartbeat()
+    metrics.flush()
+
+    assert metrics.client.calls == []
@@ -1,7 +1,12 @@
 import io
+from datetime import datetime
 from decimal import Decimal
 
-from relay_inventory.engine.parsing.csv_parser import parse_csv
+import pytest
+
+from relay_inventory.engine.canonical.models import InventoryRecord
+from relay_inventory.engine.parsing import csv_parser
+from relay_inventory.engine.parsing.csv_parser import parse_csv, records_to_rows
 
 
 def test_parse_csv_maps_columns() -> None:
@@ -15,3 +20,109 @@ def test_parse_csv_maps_columns() -> None:
     assert records[0].sku == "SKU1"
     assert records[0].quantity_available == 5
     assert records[0].cost == Decimal("10.5")
+
+
+def test_parse_csv_accepts_supported_datetime_formats() -> None:
+    csv_data = (
+        "sku,quantity_available,updated_at\n"
+        "SKU1,1,2024-03-05 10:11:12\n"
+        "SKU2,1,2024-03-05\n"
+        "SKU3,1,2024-03-05T10:11:12\n"
+        "SKU4,1,2024-3-5\n"
+        "SKU5,1,2024-03-05T10:11:12+00:00\n"
+    )
+    records, errors = parse_csv(io.StringIO(csv_data), vendor_id="vendor", column_map={})
+    assert [record.updated_at for record in records] == [
+        datetime(2024, 3, 5, 10, 11, 12),
+        datetime(2024, 3, 5),
+        datetime(2024, 3, 5, 10, 11, 12),
+        datetime(2024, 3, 5),
+    ]
+    assert [error.row_number for error in errors] == [6]
+
+
+def test_records_to_rows_matches_model_dump() -> None:
+    csv_data = "sku,quantity_available,cost,updated_at\nSKU1,5,10.5,2024-03-05\n"
+    records, _ = parse_csv(io.StringIO(csv_data), vendor_id="vendor", column_map={})
+    assert records_to_rows(records) == [record.model_dump() for record in records]
+    assert list(records_to_rows(records)[0]) == list(records[0].model_dump())
+
+
+def test_parse_csv_rejects_near_iso_datetimes() -> None:
+    csv_data = (
+        "sku,quantity_available,updated_at\n"
+        "SKU1,1,2024-03-05T10:11+01\n"
+        "SKU2,1,2024-03-05 10:11\n"
+        "SKU3,1,2024-3-5 1:2:3\n"
+        "SKU4,1,2024-03-05T10:11:60\n"
+    )
+    records, errors = parse_csv(io.StringIO(csv_data), vendor_id="vendor", column_map={})
+    assert [record.updated_at for record in records] == [datetime(2024, 3, 5, 1, 2, 3)]
+    assert [error.row_number for error in errors] == [2, 3, 5]
+    assert errors[0].reason == "invalid datetime: 2024-03-05T10:11+01"
+
+
+def test_parse_csv_handles_quoted_fields_and_crlf() -> None:
+    csv_data = 'sku,quantity_available,title\r\nSKU1,1,"Widget, large"\r\nSKU2,2,"Say ""hi"""\r\n'
+    records, errors = parse_csv(io.StringIO(csv_data, newline=""), vendor_id="vendor", column_map={})
+    assert not errors
+    assert [(record.sku, record.title) for record in records] == [
+        ("SKU1", "Widget, large"),
+        ("SKU2", 'Say "hi"'),
+    ]
+
+
+@pytest.mark.parametrize("late_row", ["SKU99,9,plain", 'SKU99,9,"Widget, large"'])
+def test_parse_csv_streams_inputs_past_the_fast_path_limit(monkeypatch, late_row: str) -> None:
+    monkeypatch.setattr(csv_parser, "FAST_PATH_PEEK_CHARS", 16)
+    monkeypatch.setattr(csv_parser, "FAST_PATH_MAX_CHARS", 64)
+    lines = ["sku,quantity_available,title"] + [f"SKU{index},{index},t{index}" for index in range(20)]
+    csv_data = "\n".join(lines + [late_row]) + "\n"
+
+    records, errors = parse_csv(io.StringIO(csv_data, newline=""), vendor_id="vendor", column_map={})
+
+    assert not errors
+    assert [record.sku for record in records] == [f"SKU{index}" for index in range(20)] + ["SKU99"]
+    assert records[-1].title == late_row.split(",", 2)[2].strip('"')
+
+
+def test_parsed_records_match_validated_models() -> None:
+    csv_data = (
+        "sku,vendor_sku,quantity_available,cost,price,condition\n"
+        " SKU1 ,V1,3,1.50,,New \n"
+        "SKU2,,0,,2.00,\n"
+        "   ,V3,1,1,1,new\n"
+        "SKU4,V4,-1,1,1,new\n"
+        "SKU5,V5,1,NaN,1,new\n"
+        "SKU6,V6,1,1,1,broken\n"
+    )
+    records, errors = parse_csv(
+        io.StringIO(csv_data), vendor_id="vendor", column_map={}, now=datetime(2024, 1, 1)
+    )
+    expected = [
+        InventoryRecord(
+            sku=" SKU1 ",
+            vendor_sku="V1",
+            vendor_id="vendor",
+            quantity_available=3,
+            cost=Decimal("1.50"),
+            price=Decimal("0"),
+            condition="New ",
+            updated_at=datetime(2024, 1, 1),
+        ),
+        InventoryRecord(
+            sku="SKU2",
+            vendor_sku="",
+            vendor_id="vendor",
+            quantity_available=0,
+            price=Decimal("2.00"),
+            updated_at=datetime(2024, 1, 1),
+        ),
+    ]
+    assert records == expected
+    assert [record.model_dump() for record in records] == [record.model_dump() for record in expected]
+    assert [error.row_number for error in errors] == [4, 5, 6, 7]
+    assert "value is required" in errors[0].reason
+    assert "quantity_available must be >= 0" in errors[1].reason
+    assert "finite number" in errors[2].reason
+    assert "condition must be new, used, or refurb" in errors[3].reason
@@ -25,3 +25,16 @@ def test_parse_csv_missing_required_columns() -> None:
             vendor_id="vendor",
             column_map={"sku": "SKU", "quantity_available": "QTY", "cost": "COST"},
         )
+
+
+def test_parse_csv_error_row_data_matches_header() -> None:
+    csv_data = "SKU,QTY,COST\n\nSKU1,5,10.5\nSKU2,bad\nSKU3,x,1,extra\n"
+    records, errors = parse_csv(
+        io.StringIO(csv_data),
+        vendor_id="vendor",
+        column_map={"sku": "SKU", "quantity_available": "QTY", "cost": "COST"},
+    )
+    assert [record.sku for record in records] == ["SKU1"]
+    assert [error.row_number for error in errors] == [3, 4]
+    assert errors[0].row_data == {"SKU": "SKU2", "QTY": "bad", "COST": None}
+    assert errors[1].row_data == {"SKU": "SKU3", "QTY": "x", "COST": "1", None: ["extra"]}
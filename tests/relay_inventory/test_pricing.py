@@ -1,7 +1,7 @@
 from decimal import Decimal
 
 from relay_inventory.engine.canonical.models import InventoryRecord
-from relay_inventory.engine.pricing.pricing import MapPolicy, PricingRules, RoundingRule, apply_pricing
+from relay_inventory.engine.pricing.pricing import MapPolicy, PricingRules, RoundingRule, apply_pricing, compute_price
 
 
 def test_pricing_applies_margin_and_floor() -> None:
@@ -41,3 +41,58 @@ def test_pricing_applies_map_floor() -> None:
     )
     result = apply_pricing([record], rules)[0]
     assert result.price == Decimal("40")
+
+
+def test_apply_pricing_matches_decimal_compute_price() -> None:
+    rules = PricingRules(
+        base_margin_pct=Decimal("0.2"),
+        min_price=Decimal("25"),
+        shipping_handling_flat=Decimal("9.99"),
+        map_policy=MapPolicy(enforce=True),
+        rounding=RoundingRule(mode="nearest", increment=Decimal("0.99")),
+    )
+    records = [
+        InventoryRecord(
+            sku=f"SKU{index}",
+            vendor_id="vendor",
+            quantity_available=1,
+            cost=Decimal(index) / Decimal("8"),
+            map_price=Decimal("60") if index % 3 == 0 else None,
+            price=Decimal("0"),
+        )
+        for index in range(0, 800, 7)
+    ]
+
+    priced = apply_pricing(records, rules)
+
+    for record, result in zip(records, priced):
+        expected = compute_price(record.cost, rules, record.map_price)
+        assert result.price == expected
+        assert str(result.price) == str(expected)
+
+
+def test_apply_pricing_shares_prices_across_repeated_costs() -> None:
+    rules = PricingRules(
+        base_margin_pct=Decimal("0.25"),
+        min_price=Decimal("1"),
+        shipping_handling_flat=Decimal("0"),
+        map_policy=MapPolicy(enforce=True),
+        rounding=RoundingRule(mode="nearest", increment=Decimal("0.05")),
+    )
+    costs = [Decimal("10"), Decimal("10.00"), Decimal("10"), None]
+    map_prices = [None, Decimal("20"), Decimal("5"), Decimal("30")]
+    records = [
+        InventoryRecord(
+            sku=f"SKU{index}",
+            vendor_id="vendor",
+            quantity_available=1,
+            cost=cost,
+            map_price=map_price,
+            price=Decimal("7"),
+        )
+        for index, (cost, map_price) in enumerate(zip(costs, map_prices))
+    ]
+
+    priced = apply_pricing(records, rules)
+
+    assert [str(record.price) for record in priced] == ["12.50", "20", "12.50", "7"]
@@ -13,3 +13,24 @@ def test_sku_map_rewrites_vendor_sku() -> None:
     )
     result = list(sku_map.apply([record]))[0]
     assert result.sku == "SKU-001"
+
+
+def test_sku_map_skips_blank_and_short_rows() -> None:
+    text = "sku,vendor_sku\nSKU-001, VEND-1 \n\nSKU-002\n,VEND-3\nSKU-004,VEND-4,extra\n"
+    sku_map = load_sku_map_from_text(text)
+    assert sku_map.mapping == {"VEND-1": "SKU-001", "VEND-4": "SKU-004"}
+
+
+def test_sku_map_without_columns_is_empty() -> None:
+    assert load_sku_map_from_text("vendor_sku,code\nVEND-1,SKU-001\n").mapping == {}
+    assert load_sku_map_from_text("").mapping == {}
+
+
+def test_sku_map_remap_updates_records_in_place() -> None:
+    sku_map = load_sku_map_from_text("vendor_sku,sku\nVEND-1,SKU-001\n")
+    records = [
+        InventoryRecord(sku="VEND-1", vendor_id="vendor", quantity_available=1, price=0),
+        InventoryRecord(sku="OTHER", vendor_id="vendor", quantity_available=1, price=0),
+    ]
+    sku_map.remap(records)
+    assert [record.sku for record in records] == ["SKU-001", "OTHER"]
@@ -1,132 +1,246 @@
 from __future__ import annotations
 
+import json
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass
 from datetime import datetime
+from pathlib import Path
+from typing import Any, Mapping, NamedTuple
 
 import pytest
+from botocore.exceptions import ClientError
 
+from relay_inventory.adapters.queue.sqs import SqsMessage
 from relay_inventory.app.jobs.schema import RunJob
+from relay_inventory.engine.run import EngineResult
+from relay_inventory.persistence.dynamo_runs import RunRecord
 from relay_inventory.persistence.dynamo_tenants import TenantRecord
+from relay_inventory.scripts import worker as worker_module
 from relay_inventory.scripts.worker import Worker
-from relay_inventory.util.errors import NonRetryableError
+from relay_inventory.util.errors import NonRetryableError, RetryableError
+from relay_inventory.util.metrics import CloudWatchMetrics
+
+_BASE_CONFIG: Mapping[str, Any] = {
+    "schema_version": 1,
+    "tenant_id": "tenant-a",
+    "timezone": "UTC",
+    "default_currency": "USD",
+    "vendors": [
+        {
+            "vendor_id": "vendor-a",
+            "inbound": {"type": "s3", "s3_prefix": "vendor-a/"},
+            "parser": {"format": "csv", "column_map": {}},
+        }
+    ],
+    "pricing": {
+        "base_margin_pct": 0.1,
+        "min_price": 1,
+        "shipping_handling_flat": 0,
+        "map_policy": {"enforce": True, "map_floor_behavior": "max(price, map_price)"},
+        "rounding": {"mode": "nearest", "increment": "0.01"},
+    },
+    "merge": {
+        "strategy": "best_offer",
+        "best_offer": {"sort_by": [], "landed_cost": {"include_shipping_handling": True}},
+    },
+    "output": {"format": "csv", "columns": ["sku", "quantity_available", "price"]},
+    "error_policy": {"max_invalid_rows": 0, "max_invalid_row_pct": 0.0},
+}
+
+_MIN_CONFIG: Mapping[str, Any] = {
+    "tenant_id": "tenant-a",
+    "timezone": "UTC",
+    "default_currency": "USD",
+    "vendors": [
+        {
+            "vendor_id": "vendor-a",
+            "inbound": {"type": "s3", "s3_prefix": "vendor-a/"},
+            "parser": {"format": "csv", "encoding": "utf-8"},
+        }
+    ],
+    "pricing": {
+        "base_margin_pct": 0,
+        "min_price": 0,
+        "shipping_handling_flat": 0,
+        "map_policy": {},
+        "rounding": {},
+    },
+    "merge": {"strategy": "best_offer", "best_offer": {"sort_by": [], "landed_cost": {}}},
+    "output": {"columns": ["sku"]},
+}
+
+_CSV_OK_TEXT = "sku,quantity_available,price\nSKU1,1,1.00\n"
+_CSV_OK_BYTES = _CSV_OK_TEXT.encode()
+_CSV_BAD_BYTES = b"sku,quantity_available,price\nSKU\xe9,1,1.00\n"
+_LATEST_ETAG = '"etag-1"'
+
+
+def _make_config(**overrides: Any) -> dict[str, Any]:
+    return {**_BASE_CONFIG, **overrides}
+
+
+@dataclass(slots=True, frozen=True)
+class _Update:
+    run_id: str
+    status: str
+    stage: str | None = None
+    started_at: datetime | None = None
+    finished_at: datetime | None = None
+    completed_at: datetime | None = None
+    failed_stage: str | None = None
+    error_code: str | None = None
+    error_message: str | None = None
+    errors_artifact_key: str | None = None
+    error_report_key: str | None = None
+    artifacts: dict[str, str] | None = None
+    clear_fields: list[str] | None = None
 
 
 class FakeRuns:
     def __init__(self) -> None:
-        self.updates = []
-
-    def update_status(self, run_id: str, status: str, **kwargs) -> None:
-        self.updates.append((run_id, status, kwargs))
+        self.updates: list[_Update] = []
+
+    def update_status(
+        self,
+        run_id: str,
+        status: str,
+        *,
+        stage: str | None = None,
+        started_at: datetime | None = None,
+        finished_at: datetime | None = None,
+        completed_at: datetime | None = None,
+        failed_stage: str | None = None,
+        error_code: str | None = None,
+        error_message: str | None = None,
+        errors_artifact_key: str | None = None,
+        error_report_key: str | None = None,
+        artifacts: dict[str, str] | None = None,
+        clear_fields: list[str] | None = None,
+    ) -> None:
+        self.updates.append(
+            _Update(
+                run_id,
+                status,
+                stage,
+                started_at,
+                finished_at,
+                completed_at,
+                failed_stage,
+                error_code,
+                error_message,
+                errors_artifact_key,
+                error_report_key,
+                artifacts,
+                clear_fields,
+            )
+        )
 
 
 class FakeTenants:
     def __init__(self, config: dict) -> None:
         self.config = config
+        self._records: dict[tuple[str, int], TenantRecord] = {}
 
     def get(self, tenant_id: str, config_version: int) -> TenantRecord:
-        return TenantRecord(tenant_id=tenant_id, config_version=config_version, config=self.config)
+        key = (tenant_id, config_version)
+        record = self._records.get(key)
+        if record is None:
+            record = self._records[key] = TenantRecord(
+                tenant_id=tenant_id, config_version=config_version, config=self.config
+            )
+        return record
 
 
 class VersionedTenants:
     def __init__(self) -> None:
-        self._configs: dict[tuple[str, int], dict] = {}
+        self._configs: dict[str, dict[int, dict]] = {}
+        self._records: dict[str, dict[int, TenantRecord]] = {}
 
     def put(self, tenant_id: str, config_version: int, config: dict) -> None:
-        self._configs[(tenant_id, config_version)] = config
+        self._configs.setdefault(tenant_id, {})[config_version] = config
+        self._records.get(tenant_id, {}).pop(config_version, None)
 
     def get(self, tenant_id: str, config_version: int) -> TenantRecord:
-        config = self._configs[(tenant_id, config_version)]
-        return TenantRecord(tenant_id=tenant_id, config_version=config_version, config=config)
+        records = self._records.setdefault(tenant_id, {})
+        record = records.get(config_version)
+        if record is None:
+            record = records[config_version] = TenantRecord(
+                tenant_id=tenant_id, config_version=config_version, config=self._configs[tenant_id][config_version]
+            )
+        return record
+
+
+class Location(NamedTuple):
+    key: str
+    etag: str | None = None
+    size: int | None = None
+    last_modified: datetime | None = None
 
 
 class FakeS3:
-    def __init__(self) -> None:
-        self.uploaded_bytes = {}
-        self.uploaded_text = {}
+    def __init__(self, content: bytes = _CSV_OK_BYTES) -> None:
+        self.content = content
+        self.conditional_gets: list[tuple[str, str | None]] = []
+        self.copies: list[tuple[str, str, str | None]] = []
+        self.uploads_bytes: list[tuple[str, bytes]] = []
+        self.uploads_text: list[tuple[str, str]] = []
 
-    def list_latest(self, prefix: str):
-        class Location:
-            def __init__(self, key: str) -> None:
-                self.key = key
+    def list_latest(self, prefix: str) -> Location:
+        return Location(f"{prefix}latest.csv", etag=_LATEST_ETAG)
 
-        return Location(f"{prefix}latest.csv")
+    def list_latest_multi(self, prefixes):
+        return {prefix: self.list_latest(prefix) for prefix in prefixes}
 
     def download_bytes(self, key: str) -> bytes:
-        return b"sku,quantity_available,price\nSKU1,1,1.00\n"
-
-    def upload_bytes(self, key: str, body: bytes) -> None:
-        self.uploaded_bytes[key] = body
+        return self.content
 
-    def upload_text(self, key: str, body: str) -> None:
-        self.uploaded_text[key] = body
+    def download_bytes_if_changed(self, key: str, etag: str | None) -> tuple[bytes | None, str | None]:
+        self.conditional_gets.append((key, etag))
+        current = f'"{len(self.content)}"'
+        return (None, etag) if etag == current else (self.content, current)
 
+    def upload_bytes(self, key: str, body: bytes, content_type: str | None = None) -> None:
+        self.uploads_bytes.append((key, body))
 
-class FakeS3BadEncoding(FakeS3):
-    def download_bytes(self, key: str) -> bytes:
-        return b"sku,quantity_available,price\nSKU\xe9,1,1.00\n"
-
-
-def test_worker_calls_engine(monkeypatch):
-    config = {
-        "schema_version": 1,
-        "tenant_id": "tenant-a",
-        "timezone": "UTC",
-        "default_currency": "USD",
-        "vendors": [
-            {
-                "vendor_id": "vendor-a",
-                "inbound": {"type": "s3", "s3_prefix": "vendor-a/"},
-                "parser": {"format": "csv", "column_map": {}},
-            }
-        ],
-        "pricing": {
-            "base_margin_pct": 0.1,
-            "min_price": 1,
-            "shipping_handling_flat": 0,
-            "map_policy": {"enforce": True, "map_floor_behavior": "max(price, map_price)"},
-            "rounding": {"mode": "nearest", "increment": "0.01"},
-        },
-        "merge": {
-            "strategy": "best_offer",
-            "best_offer": {"sort_by": [], "landed_cost": {"include_shipping_handling": True}},
-        },
-        "output": {"format": "csv", "columns": ["sku", "quantity_available", "price"]},
-        "error_policy": {"max_invalid_rows": 0, "max_invalid_row_pct": 0.0},
-    }
-    worker = Worker(bucket="bucket", runs_table="runs", tenants_table="tenants")
-    worker.runs = FakeRuns()
-    worker.tenants = FakeTenants(config)
-    worker.s3 = FakeS3()
+    def copy_key(self, source_key: str, key: str, if_match: str | None = None) -> None:
+        self.copies.append((source_key, key, if_match))
+        self.uploads_bytes.append((key, self.content))
 
-    call_args = {}
+    def upload_stream(self, key: str, chunks, content_type: str | None = None) -> None:
+        self.uploads_bytes.append((key, b"".join(chunks)))
 
-    def fake_run_inventory_sync(*, vendor_inputs, tenant_config, run_id, now):
-        from relay_inventory.engine.run import EngineResult
+    def upload_gzip_stream(self, key: str, chunks) -> None:
+        self.uploads_bytes.append((key, b"".join(chunks)))
 
-        call_args["vendor_inputs"] = vendor_inputs
-        call_args["tenant_config"] = tenant_config
-        call_args["run_id"] = run_id
-        call_args["now"] = now
+    def upload_text(self, key: str, body: str) -> None:
+        self.uploads_text.append((key, body))
+
+    @property
+    def uploaded_bytes(self) -> dict[str, bytes]:
+        return dict(self.uploads_bytes)
+
+    @property
+    def uploaded_text(self) -> dict[str, str]:
+        return dict(self.uploads_text)
+
+
+def _make_fake_engine(store: dict):
+    def _fn(*, vendor_inputs, tenant_config, run_id, now):
+        store["vendor_inputs"] = vendor_inputs
+        store["tenant_config"] = tenant_config
+        store["run_id"] = run_id
+        store["now"] = now
+        row = {
+            "sku": "SKU1",
+            "quantity_available": 1,
+            "price": "1.00",
+            "vendor_id": "vendor-a",
+            "updated_at": now.isoformat(),
+        }
         return EngineResult(
-            normalized_by_vendor={
-                "vendor-a": [
-                    {
-                        "sku": "SKU1",
-                        "quantity_available": 1,
-                        "price": "1.00",
-                        "vendor_id": "vendor-a",
-                        "updated_at": now.isoformat(),
-                    }
-                ]
-            },
-            merged_rows=[
-                {
-                    "sku": "SKU1",
-                    "quantity_available": 1,
-                    "price": "1.00",
-                    "vendor_id": "vendor-a",
-                    "updated_at": now.isoformat(),
-                }
-            ],
+            normalized_by_vendor={"vendor-a": [row]},
+            merged_rows=[row],
             errors=[],
             summary={
                 "run_id": run_id,
@@ -138,127 +252,276 @@ def test_worker_calls_engine(monkeypatch):
             },
         )
 
-    import relay_inventory.scripts.worker as worker_module
+    return _fn
 
-    monkeypatch.setattr(worker_module, "run_inventory_sync", fake_run_inventory_sync)
+
+@pytest.fixture(scope="module")
+def base_config() -> Mapping[str, Any]:
+    return _BASE_CONFIG
+
+
+@pytest.fixture()
+def csv_bytes_path(tmp_path: Path) -> Path:
+    path = tmp_path / "vendor-a.csv"
+    path.write_bytes(_CSV_OK_BYTES)
+    return path
+
+
+@pytest.fixture()
+def worker(base_config: Mapping[str, Any]) -> Worker:
+    worker = Worker(bucket="bucket", runs_table="runs", tenants_table="tenants")
+    worker.runs = FakeRuns()
+    worker.tenants = FakeTenants(dict(base_config))
+    worker.s3 = FakeS3()
+    return worker
+
+
+def test_worker_calls_engine(worker: Worker, monkeypatch, csv_bytes_path) -> None:
+    worker.s3 = FakeS3(content=csv_bytes_path.read_bytes())
+    call_args = {}
+    monkeypatch.setattr(worker_module, "run_inventory_sync", _make_fake_engine(call_args))
 
     job = RunJob(run_id="run-1", tenant_id="tenant-a", vendors=["vendor-a"], config_version=1)
     worker.run_job(job)
 
     assert call_args["run_id"] == "run-1"
     assert "vendor-a" in call_args["vendor_inputs"]
-    assert isinstance(call_args["vendor_inputs"]["vendor-a"], bytes)
-    assert isinstance(call_args["now"], datetime)
-
-
-def test_worker_reports_decode_error() -> None:
-    config = {
-        "schema_version": 1,
-        "tenant_id": "tenant-a",
-        "timezone": "UTC",
-        "default_currency": "USD",
-        "vendors": [
-            {
-                "vendor_id": "vendor-a",
-                "inbound": {"type": "s3", "s3_prefix": "vendor-a/"},
-                "parser": {"format": "csv", "column_map": {}, "encoding": "utf-8"},
-            }
-        ],
-        "pricing": {
-            "base_margin_pct": 0.1,
-            "min_price": 1,
-            "shipping_handling_flat": 0,
-            "map_policy": {"enforce": True, "map_floor_behavior": "max(price, map_price)"},
-            "rounding": {"mode": "nearest", "increment": "0.01"},
-        },
-        "merge": {
-            "strategy": "best_offer",
-            "best_offer": {"sort_by": [], "landed_cost": {"include_shipping_handling": True}},
-        },
-        "output": {"format": "csv", "columns": ["sku", "quantity_available", "price"]},
-        "error_policy": {"max_invalid_rows": 0, "max_invalid_row_pct": 0.0},
-    }
-    worker = Worker(bucket="bucket", runs_table="runs", tenants_table="tenants")
-    worker.runs = FakeRuns()
-    worker.tenants = FakeTenants(config)
-    worker.s3 = FakeS3BadEncoding()
+    assert type(call_args["vendor_inputs"]["vendor-a"]) is bytes
+    assert type(call_args["now"]) is datetime
+    stored_keys = [key for key, _ in worker.s3.uploads_bytes]
+    assert sum("/inbound/vendor-a/" in key for key in stored_keys) == 1
+    assert [if_match for _, _, if_match in worker.s3.copies] == [_LATEST_ETAG]
+
+
+def test_worker_retries_when_inbound_file_changes_before_copy(worker: Worker, monkeypatch) -> None:
+    def copy_key(source_key: str, key: str, if_match: str | None = None) -> None:
+        raise ClientError({"Error": {"Code": "PreconditionFailed"}}, "CopyObject")
+
+    monkeypatch.setattr(worker.s3, "copy_key", copy_key)
+    job = RunJob(run_id="run-1", tenant_id="tenant-a", vendors=["vendor-a"], config_version=1)
+
+    with pytest.raises(RetryableError, match="changed during ingest"):
+        worker._ingest_vendor(
+            job=job,
+            tenant_id="tenant-a",
+            vendor=worker._get_tenant_config("tenant-a", 1).vendors[0],
+            latest=worker.s3.list_latest("vendor-a/"),
+        )
+
+
+def test_worker_emits_success_metrics(worker: Worker, monkeypatch) -> None:
+    class RecordingCloudWatch:
+        def __init__(self) -> None:
+            self.metric_names = []
+
+        def put_metric_data(self, *, Namespace: str, MetricData: list) -> None:
+            self.metric_names.extend(datum["MetricName"] for datum in MetricData)
+
+    monkeypatch.setenv("AWS_DEFAULT_REGION", "us-east-1")
+    worker.metrics = CloudWatchMetrics(
+        namespace="RelayInventory", enabled=True, environment="test", flush_interval_seconds=0
+    )
+    worker.metrics.client = RecordingCloudWatch()
+    monkeypatch.setattr(worker_module, "run_inventory_sync", _make_fake_engine({}))
+
+    worker.run_job(RunJob(run_id="run-1", tenant_id="tenant-a", vendors=["vendor-a"], config_version=1))
+    worker.metrics.flush()
+
+    assert worker.runs.updates[-1].status == "SUCCEEDED"
+    assert {"RunSucceeded", "RunDurationSeconds", "RowsProcessed"} <= set(worker.metrics.client.metric_names)
+
+
+def test_worker_reports_decode_error(worker: Worker) -> None:
+    worker.tenants = FakeTenants(dict(_MIN_CONFIG))
+    worker.s3 = FakeS3(content=_CSV_BAD_BYTES)
 
     job = RunJob(run_id="run-1", tenant_id="tenant-a", vendors=["vendor-a"], config_version=1)
 
     with pytest.raises(NonRetryableError):
         worker.run_job(job)
 
-    _, status, kwargs = worker.runs.updates[-1]
-    assert status == "FAILED"
-    assert kwargs["error_code"] == "DECODE_ERROR"
-    assert "vendor-a" in kwargs["error_message"]
-
-
-def test_worker_uses_pinned_config_version(monkeypatch) -> None:
-    config_v1 = {
-        "schema_version": 1,
-        "tenant_id": "tenant-a",
-        "timezone": "UTC",
-        "default_currency": "USD",
-        "vendors": [
-            {
-                "vendor_id": "vendor-a",
-                "inbound": {"type": "s3", "s3_prefix": "vendor-a/"},
-                "parser": {"format": "csv", "column_map": {}},
-            }
-        ],
-        "pricing": {
-            "base_margin_pct": 0.1,
-            "min_price": 1,
-            "shipping_handling_flat": 0,
-            "map_policy": {"enforce": True, "map_floor_behavior": "max(price, map_price)"},
-            "rounding": {"mode": "nearest", "increment": "0.01"},
-        },
-        "merge": {
-            "strategy": "best_offer",
-            "best_offer": {"sort_by": [], "landed_cost": {"include_shipping_handling": True}},
-        },
-        "output": {"format": "csv", "columns": ["sku", "quantity_available", "price"]},
-        "error_policy": {"max_invalid_rows": 0, "max_invalid_row_pct": 0.0},
-    }
-    config_v2 = {**config_v1, "default_currency": "EUR"}
+    update = worker.runs.updates[-1]
+    assert update.status == "FAILED"
+    assert update.error_code == "DECODE_ERROR"
+    assert "vendor-a" in update.error_message
+
+
+def test_worker_uses_pinned_config_version(worker: Worker, monkeypatch) -> None:
+    config_v1 = _make_config()
+    config_v2 = _make_config(default_currency="EUR")
     tenants = VersionedTenants()
     tenants.put("tenant-a", 1, config_v1)
     tenants.put("tenant-a", 2, config_v2)
-
-    worker = Worker(bucket="bucket", runs_table="runs", tenants_table="tenants")
-    worker.runs = FakeRuns()
     worker.tenants = tenants
-    worker.s3 = FakeS3()
 
     call_args = {}
+    monkeypatch.setattr(worker_module, "run_inventory_sync", _make_fake_engine(call_args))
 
-    def fake_run_inventory_sync(*, vendor_inputs, tenant_config, run_id, now):
-        from relay_inventory.engine.run import EngineResult
+    job = RunJob(run_id="run-1", tenant_id="tenant-a", vendors=["vendor-a"], config_version=1)
+    worker.run_job(job)
 
-        call_args["tenant_config"] = tenant_config
-        return EngineResult(
-            normalized_by_vendor={},
-            merged_rows=[],
-            errors=[],
-            summary={
-                "run_id": run_id,
-                "vendor_count": 0,
-                "vendor_record_counts": {},
-                "record_count": 0,
-                "invalid_rows": 0,
-                "total_rows": 0,
-            },
-        )
+    assert call_args["tenant_config"].default_currency == "USD"
+    _, snapshot = worker.s3.uploads_text[0]
+    snapshot_data = json.loads(snapshot)
+    assert snapshot_data["config_version"] == 1
+    assert snapshot_data["tenant_config"]["default_currency"] == "USD"
 
-    import relay_inventory.scripts.worker as worker_module
 
-    monkeypatch.setattr(worker_module, "run_inventory_sync", fake_run_inventory_sync)
+def test_worker_deletes_message_once_after_successful_run(worker: Worker, monkeypatch) -> None:
+    class FakeQueue:
+        def __init__(self) -> None:
+            self.deleted = []
 
-    job = RunJob(run_id="run-1", tenant_id="tenant-a", vendors=["vendor-a"], config_version=1)
-    worker.run_job(job)
+        def change_visibility(self, receipt_handle: str, timeout_seconds: int) -> None:
+            pass
 
-    assert call_args["tenant_config"].default_currency == "USD"
-    snapshot = next(iter(worker.s3.uploaded_text.values()))
-    assert '"config_version": 1' in snapshot
-    assert '"default_currency": "USD"' in snapshot
+        def delete(self, receipt_handle: str) -> None:
+            self.deleted.append(receipt_handle)
+
+    worker.queue = FakeQueue()
+    worker.visibility_heartbeat_seconds = 0
+    monkeypatch.setattr(worker, "run_job", lambda job, record=None: None)
+
+    body = {"run_id": "run-1", "tenant_id": "tenant-a", "vendors": ["vendor-a"], "config_version": 1}
+    worker._process_message(SqsMessage(receipt_handle="handle-1", raw_body=json.dumps(body)))
+
+    assert worker.queue.deleted == ["handle-1"]
+
+
+def test_worker_deletes_message_with_invalid_job_body(worker: Worker, monkeypatch) -> None:
+    class FakeQueue:
+        def __init__(self) -> None:
+            self.deleted = []
+
+        def delete(self, receipt_handle: str) -> None:
+            self.deleted.append(receipt_handle)
+
+    errors = []
+    worker.queue = FakeQueue()
+    monkeypatch.setattr(worker.metrics, "record_worker_error", lambda error_type: errors.append(error_type))
+    monkeypatch.setattr(worker, "run_job", lambda job, record=None: pytest.fail("run_job called"))
+
+    worker._process_message(SqsMessage(receipt_handle="handle-1", raw_body=json.dumps({"run_id": "run-1"})))
+
+    assert worker.queue.deleted == ["handle-1"]
+    assert errors == ["invalid_job_message"]
+
+
+def test_worker_close_flushes_pending_batched_deletes(worker: Worker) -> None:
+    class BatchQueue:
+        def __init__(self) -> None:
+            self.deleted = []
+
+        def delete_batch(self, receipt_handles):
+            self.deleted.extend(receipt_handles)
+            return []
+
+    worker.queue = BatchQueue()
+    worker._delete_message("handle-1")
+    worker._delete_message("handle-2")
+
+    worker.close()
+
+    assert worker.queue.deleted == ["handle-1", "handle-2"]
+
+
+def test_worker_idle_backoff_grows_and_caps(worker: Worker) -> None:
+    worker.idle_backoff_max_seconds = 5
+
+    assert [worker._idle_backoff_seconds(polls) for polls in range(1, 7)] == [0.0, 1.0, 2.0, 4.0, 5, 5]
+
+
+def test_worker_receive_error_backoff_is_jittered_and_capped(worker: Worker) -> None:
+    for attempt, base in [(1, 1.0), (2, 2.0), (4, 8.0)]:
+        assert base <= worker._receive_error_backoff_seconds(attempt) <= 2 * base
+    assert worker._receive_error_backoff_seconds(12) == 60.0
+
+
+def test_worker_threads_run_record_through_status_updates(worker: Worker) -> None:
+    record = RunRecord(
+        run_id="run-1",
+        tenant_id="tenant-a",
+        config_version=1,
+        status="FAILED",
+        requested_at="2024-01-01T00:00:00",
+        stage="MERGE_PRICE",
+        started_at="2024-01-01T00:00:01",
+    )
+
+    current = worker._update_run_status(
+        "run-1", "RUNNING", current=record, started_at=datetime(2024, 1, 2), stage="FETCH_INPUTS"
+    )
+    assert worker._update_run_status("run-1", "RUNNING", current=current, stage="NORMALIZE") is current
+    worker._update_run_status("run-1", "FAILED", current=current, stage="NORMALIZE", error_code="boom")
+
+    assert current.stage == "MERGE_PRICE"
+    assert worker.runs.updates == [
+        _Update("run-1", "RUNNING", stage="MERGE_PRICE"),
+        _Update("run-1", "FAILED", stage="MERGE_PRICE", error_code="boom"),
+    ]
+
+
+def test_worker_job_done_releases_slot_on_failure(worker: Worker) -> None:
+    slots = threading.BoundedSemaphore(1)
+    slots.acquire()
+    future: Future = Future()
+    future.set_exception(RuntimeError("boom"))
+
+    worker._job_done(slots, future)
+
+    assert slots.acquire(blocking=False)
+
+
+def test_worker_receives_only_as_many_messages_as_free_slots() -> None:
+    slots = threading.BoundedSemaphore(3)
+    slots.acquire()
+
+    free_slots = Worker._acquire_free_slots(slots)
+
+    assert free_slots == 2
+    assert not slots.acquire(blocking=False)
+    Worker._release_slots(slots, free_slots)
+    assert slots.acquire(blocking=False)
+
+
+def test_worker_revalidates_cached_sku_map_with_one_conditional_get(worker: Worker) -> None:
+    key = "tenant-a/maps/vendor-a.csv"
+
+    first = worker._download_sku_map(key)
+    assert worker._download_sku_map(key) == first
+    assert worker.s3.conditional_gets == [(key, None), (key, f'"{len(first)}"')]
+
+    worker.s3.content = b"vendor_sku,sku\n"
+    assert worker._download_sku_map(key) == b"vendor_sku,sku\n"
+
+
+def test_worker_selects_job_executor_from_env(worker: Worker, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setenv("WORKER_EXECUTOR", "process")
+    with worker._job_executor(2) as executor:
+        assert isinstance(executor, ProcessPoolExecutor)
+
+    monkeypatch.setenv("WORKER_EXECUTOR", "greenlet")
+    with pytest.raises(RuntimeError):
+        worker._job_executor(2)
+
+
+def test_worker_caches_validated_tenant_config_per_version(worker: Worker) -> None:
+    class CountingTenants(VersionedTenants):
+        def __init__(self) -> None:
+            super().__init__()
+            self.gets = 0
+
+        def get(self, tenant_id: str, config_version: int) -> TenantRecord:
+            self.gets += 1
+            return super().get(tenant_id, config_version)
+
+    config = _make_config(vendors=[])
+    tenants = CountingTenants()
+    tenants.put("tenant-a", 1, config)
+    tenants.put("tenant-a", 2, _make_config(vendors=[], default_currency="EUR"))
+    worker.tenants = tenants
+
+    first = worker._get_tenant_config("tenant-a", 1)
+    assert worker._get_tenant_config("tenant-a", 1) is first
+    assert worker._get_tenant_config("tenant-a", 2).default_currency == "EUR"
+    assert tenants.gets == 2